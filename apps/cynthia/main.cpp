@@ -16,11 +16,97 @@
  */
 
 #include <CLI/CLI.hpp>
+#include <chrono>
+#include <fstream>
+#include <iomanip>
+#include <memory>
+#include <sstream>
 
 #include <cynthia/core.hpp>
 #include <cynthia/logger.hpp>
 #include <cynthia/parser/driver.hpp>
 
+namespace {
+
+std::string json_string(const std::string& value) {
+  std::ostringstream out;
+  out << '"';
+  for (char c : value) {
+    switch (c) {
+    case '"':
+      out << "\\\"";
+      break;
+    case '\\':
+      out << "\\\\";
+      break;
+    case '\n':
+      out << "\\n";
+      break;
+    case '\t':
+      out << "\\t";
+      break;
+    default:
+      if (static_cast<unsigned char>(c) < 0x20) {
+        out << "\\u" << std::hex << std::setw(4) << std::setfill('0')
+            << static_cast<int>(c) << std::dec;
+      } else {
+        out << c;
+      }
+    }
+  }
+  out << '"';
+  return out.str();
+}
+
+void write_cache_json(std::ostream& out,
+                      const cynthia::core::CacheStatistics& cache) {
+  out << "{\"hits\":" << cache.nb_hits() << ",\"misses\":" << cache.nb_misses()
+      << ",\"hit_rate\":" << cache.hit_rate() << "}";
+}
+
+// Write the statistics of a finished run as a single-line JSON object.
+void write_stats_json(std::ostream& out, const std::string& input,
+                      bool realizable,
+                      const cynthia::core::phase_times_t& phase_times_ms,
+                      const cynthia::core::ForwardSynthesis& synthesis) {
+  const auto& context = synthesis.get_context();
+  const auto& statistics = context.statistics_;
+  out << std::fixed << std::setprecision(3);
+  out << "{\"input\":" << json_string(input) << ",\"verdict\":\""
+      << (realizable ? "realizable" : "unrealizable") << "\"";
+
+  out << ",\"phase_times_ms\":{";
+  for (size_t i = 0; i < phase_times_ms.size(); ++i) {
+    out << (i ? "," : "") << json_string(phase_times_ms[i].first) << ":"
+        << phase_times_ms[i].second;
+  }
+  out << "}";
+
+  out << ",\"explored_states\":" << statistics.nb_visited_nodes();
+  out << ",\"sdd\":{\"live_size\":" << sdd_manager_live_size(context.manager)
+      << ",\"dead_size\":" << sdd_manager_dead_size(context.manager)
+      << ",\"live_count\":" << sdd_manager_live_count(context.manager)
+      << ",\"dead_count\":" << sdd_manager_dead_count(context.manager)
+      << ",\"variables\":" << sdd_manager_var_count(context.manager) << "}";
+  out << ",\"closure_size\":" << context.closure_.nb_formulas()
+      << ",\"input_variables\":" << context.partition.input_variables.size()
+      << ",\"output_variables\":" << context.partition.output_variables.size();
+  out << ",\"graph\":{\"nodes\":" << context.graph.nb_nodes()
+      << ",\"transitions\":" << context.graph.nb_transitions() << "}";
+  out << ",\"caches\":{\"to_sdd\":";
+  write_cache_json(out, statistics.to_sdd_cache);
+  out << ",\"sdd_to_formula\":";
+  write_cache_json(out, statistics.sdd_to_formula_cache);
+  out << "}}" << std::endl;
+}
+
+double elapsed_ms(std::chrono::high_resolution_clock::time_point start,
+                  std::chrono::high_resolution_clock::time_point end) {
+  return std::chrono::duration<double, std::milli>(end - start).count();
+}
+
+} // namespace
+
 int main(int argc, char** argv) {
   cynthia::utils::Logger logger("main");
   cynthia::utils::Logger::level(cynthia::utils::LogLevel::info);
@@ -36,6 +122,10 @@ int main(int argc, char** argv) {
   bool enable_gc = false;
   app.add_flag("-g,--garbage-collection", enable_gc,
                "Enable garbage collection.");
+  float gc_threshold = 0.95;
+  app.add_option("--gc-threshold", gc_threshold,
+                 "Fraction of dead SDD nodes that triggers garbage collection.")
+      ->check(CLI::Range(0.0, 1.0));
 
   // options & flags
   std::string filename;
@@ -56,6 +146,14 @@ int main(int argc, char** argv) {
   CLI::Option* part_opt = app.add_option("--part", part_file, "Partition file.")
                               ->check(CLI::ExistingFile);
 
+  std::string stats_json;
+  app.add_option("--stats-json", stats_json,
+                 "Write run statistics as JSON to this file.");
+
+  std::string trace_out;
+  app.add_option("--trace-out", trace_out,
+                 "Write a Chrome trace of the search to this file.");
+
   CLI11_PARSE(app, argc, argv)
 
   if (version) {
@@ -67,6 +165,32 @@ int main(int argc, char** argv) {
     cynthia::utils::Logger::level(cynthia::utils::LogLevel::debug);
   }
 
+  std::ofstream stats_file;
+  if (stats_json == "-") {
+    // The log goes to stdout, so the JSON would not be parseable there
+    logger.error("--stats-json needs a file path, not '-'");
+    return 1;
+  }
+  if (!stats_json.empty()) {
+    stats_file.open(stats_json);
+    if (!stats_file) {
+      logger.error("Cannot open {} for writing", stats_json);
+      return 1;
+    }
+  }
+
+  std::ofstream trace_file;
+  std::unique_ptr<cynthia::core::Tracer> tracer;
+  if (!trace_out.empty()) {
+    trace_file.open(trace_out);
+    if (!trace_file) {
+      logger.error("Cannot open {} for writing", trace_out);
+      return 1;
+    }
+    tracer = std::make_unique<cynthia::core::Tracer>(trace_file);
+  }
+
+  auto t_parse_start = std::chrono::high_resolution_clock::now();
   auto driver = cynthia::parser::ltlf::LTLfDriver();
   if (!file_opt->empty()) {
     logger.info("Parsing {}", filename);
@@ -94,16 +218,31 @@ int main(int argc, char** argv) {
 
   auto t_start = std::chrono::high_resolution_clock::now();
 
-  bool result = cynthia::core::is_realizable<cynthia::core::ForwardSynthesis>(
-      parsed_formula, partition, enable_gc);
+  auto synthesis = cynthia::core::ForwardSynthesis(parsed_formula, partition,
+                                                   enable_gc, gc_threshold);
+  synthesis.set_tracer(tracer.get());
+  auto span = cynthia::core::TraceSpan(tracer.get(), "is_realizable");
+  bool result = synthesis.is_realizable();
+  span.end({{"realizable", result}});
   if (result)
     logger.info("realizable.");
   else
     logger.info("unrealizable.");
 
   auto t_end = std::chrono::high_resolution_clock::now();
-  double elapsed_time =
-      std::chrono::duration<double, std::milli>(t_end - t_start).count();
+  double elapsed_time = elapsed_ms(t_start, t_end);
   logger.info("Overall time elapsed: {}ms", elapsed_time);
+
+  if (!stats_json.empty()) {
+    cynthia::core::phase_times_t phase_times_ms{
+        {"parse", elapsed_ms(t_parse_start, t_start)}};
+    const auto& core_phases =
+        synthesis.get_context().statistics_.phase_times_ms();
+    phase_times_ms.insert(phase_times_ms.end(), core_phases.begin(),
+                          core_phases.end());
+    phase_times_ms.emplace_back("synthesis", elapsed_time);
+    write_stats_json(stats_file, file_opt->empty() ? formula : filename, result,
+                     phase_times_ms, synthesis);
+  }
   return 0;
 }
@@ -24,10 +24,23 @@
 #include <cynthia/path.hpp>
 #include <cynthia/sddcpp.hpp>
 #include <cynthia/statistics.hpp>
+#include <cynthia/trace.hpp>
 
 extern "C" {
 #include "sddapi.h"
 }
+/*
+ * Log a debug message of the search, indented by the search depth. The
+ * arguments are evaluated only when debug messages are enabled.
+ */
+#define CYNTHIA_SEARCH_DEBUG(context, ...)                                     \
+  do {                                                                         \
+    if (CYNTHIA_LOG_ENABLED((context).logger,                                  \
+                            ::cynthia::utils::LogLevel::debug)) {              \
+      (context).print_search_debug(__VA_ARGS__);                               \
+    }                                                                          \
+  } while (0)
+
 namespace cynthia {
 namespace core {
 
@@ -73,6 +86,7 @@ public:
     std::map<SddSize, logic::ltlf_ptr> sdd_node_id_to_formula;
     std::map<logic::ltlf_ptr, SddNode*> formula_to_sdd_node;
     utils::Logger logger;
+    Tracer* tracer = nullptr;
     size_t indentation = 0;
     const bool use_gc;
     const float gc_threshold;
@@ -101,13 +115,19 @@ public:
     inline void print_search_debug(const char* fmt) const {
       logger.debug((std::string(indentation, '\t') + fmt).c_str());
     };
+    inline void trace_instant(const char* name,
+                              const trace_args_t& args = {}) const {
+      if (tracer) {
+        tracer->instant(name, args);
+      }
+    }
 
     void initialie_maps_();
   };
   ForwardSynthesis(const logic::ltlf_ptr& formula,
                    const InputOutputPartition& partition,
-                   bool enable_gc = false)
-      : context_{formula, partition, enable_gc},
+                   bool enable_gc = false, float gc_threshold = 0.95)
+      : context_{formula, partition, enable_gc, gc_threshold},
         ISynthesis(formula, partition){};
 
   static std::map<std::string, size_t>
@@ -117,6 +137,9 @@ public:
 
   bool forward_synthesis_();
 
+  const Context& get_context() const { return context_; }
+  void set_tracer(Tracer* tracer) { context_.tracer = tracer; }
+
 private:
   Context context_;
   strategy_t system_move_(const logic::ltlf_ptr& formula, Path& path);
@@ -125,6 +148,9 @@ private:
   SddNodeWrapper next_state_(const SddNodeWrapper& wrapper);
   logic::ltlf_ptr next_state_formula_(SddNode* wrapper);
   SddNodeWrapper formula_to_sdd_(const logic::ltlf_ptr& formula);
+  std::pair<SddNode*, bool>
+  one_step_realizability_(const logic::LTLfFormula& formula);
+  bool one_step_unrealizability_(const logic::LTLfFormula& formula);
   static NodeType node_type_from_sdd_type_(const SddNodeWrapper& wrapper);
   void add_transition_(const SddNodeWrapper& start, SddNode* move_node,
                        const SddNodeWrapper& end);
@@ -67,6 +67,8 @@ public:
   SddNode* get_action_by_id(SddSize action_id) const;
   std::map<size_t, Node> get_successors(Node start) const;
   std::map<size_t, std::set<Node>> get_predecessors(Node end) const;
+  size_t nb_nodes() const;
+  size_t nb_transitions() const;
 };
 
 } // namespace core
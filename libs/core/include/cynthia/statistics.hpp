@@ -16,19 +16,71 @@
  * along with Cynthia.  If not, see <https://www.gnu.org/licenses/>.
  */
 
+#include <chrono>
 #include <cstddef>
 #include <set>
+#include <string>
+#include <utility>
+#include <vector>
 
 namespace cynthia {
 namespace core {
 
+class CacheStatistics {
+private:
+  size_t hits_ = 0;
+  size_t misses_ = 0;
+
+public:
+  inline void hit() { ++hits_; }
+  inline void miss() { ++misses_; }
+  size_t nb_hits() const { return hits_; }
+  size_t nb_misses() const { return misses_; }
+  size_t nb_lookups() const { return hits_ + misses_; }
+  double hit_rate() const;
+};
+
+class Statistics;
+
+/*
+ * Measure the time spent in a phase, from construction to stop() or
+ * destruction, and add it to the phase in the statistics.
+ */
+class PhaseTimer {
+private:
+  Statistics* statistics_;
+  std::string phase_;
+  std::chrono::steady_clock::time_point start_;
+
+public:
+  PhaseTimer(Statistics& statistics, std::string phase);
+  PhaseTimer(const PhaseTimer&) = delete;
+  PhaseTimer& operator=(const PhaseTimer&) = delete;
+  ~PhaseTimer() { stop(); }
+  void stop();
+};
+
+typedef std::vector<std::pair<std::string, double>> phase_times_t;
+
 class Statistics {
 private:
   std::set<size_t> nodes;
+  // in order of first occurrence
+  phase_times_t phase_times_ms_;
 
 public:
+  CacheStatistics to_sdd_cache;
+  CacheStatistics sdd_to_formula_cache;
+
   size_t nb_visited_nodes() const;
   void visit_node(size_t node_id);
+
+  PhaseTimer time_phase(const std::string& phase) {
+    return PhaseTimer(*this, phase);
+  }
+  void add_phase_time(const std::string& phase, double milliseconds);
+  double phase_time_ms(const std::string& phase) const;
+  const phase_times_t& phase_times_ms() const { return phase_times_ms_; }
 };
 
 } // namespace core
@@ -0,0 +1,83 @@
+#pragma once
+/*
+ * This file is part of Cynthia.
+ *
+ * Cynthia is free software: you can redistribute it and/or modify
+ * it under the terms of the GNU General Public License as published by
+ * the Free Software Foundation, either version 3 of the License, or
+ * (at your option) any later version.
+ *
+ * Cynthia is distributed in the hope that it will be useful,
+ * but WITHOUT ANY WARRANTY; without even the implied warranty of
+ * MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+ * GNU General Public License for more details.
+ *
+ * You should have received a copy of the GNU General Public License
+ * along with Cynthia.  If not, see <https://www.gnu.org/licenses/>.
+ */
+
+#include <chrono>
+#include <initializer_list>
+#include <ostream>
+#include <utility>
+
+namespace cynthia {
+namespace core {
+
+typedef std::initializer_list<std::pair<const char*, long long>> trace_args_t;
+
+/*
+ * Write events in the Chrome trace event format (JSON array format), which
+ * can be loaded in Perfetto or chrome://tracing. Events are streamed as
+ * they happen; the format tolerates a missing closing bracket, so the
+ * trace of a run that was killed can still be loaded.
+ *
+ * Event names and argument keys are written verbatim, so they must not
+ * need JSON escaping.
+ */
+class Tracer {
+public:
+  typedef std::chrono::steady_clock::time_point time_point;
+
+private:
+  std::ostream& out_;
+  time_point origin_;
+  bool first_event_ = true;
+
+  void event_(const char* name, char phase, double timestamp,
+              const trace_args_t& args, double duration = -1.0);
+  double timestamp_(time_point time) const;
+
+public:
+  explicit Tracer(std::ostream& out);
+  Tracer(const Tracer&) = delete;
+  Tracer& operator=(const Tracer&) = delete;
+  ~Tracer();
+
+  static time_point now() { return std::chrono::steady_clock::now(); }
+  void begin(const char* name, const trace_args_t& args = {});
+  void end(const char* name, const trace_args_t& args = {});
+  void instant(const char* name, const trace_args_t& args = {});
+  void complete(const char* name, time_point start,
+                const trace_args_t& args = {});
+};
+
+/*
+ * Begin a span on construction and end it on end() or destruction. Does
+ * nothing if the tracer is null.
+ */
+class TraceSpan {
+private:
+  Tracer* tracer_;
+  const char* name_;
+
+public:
+  TraceSpan(Tracer* tracer, const char* name, const trace_args_t& args = {});
+  TraceSpan(const TraceSpan&) = delete;
+  TraceSpan& operator=(const TraceSpan&) = delete;
+  ~TraceSpan() { end(); }
+  void end(const trace_args_t& args = {});
+};
+
+} // namespace core
+} // namespace cynthia
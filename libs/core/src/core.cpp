@@ -37,39 +37,52 @@ ISynthesis::ISynthesis(const logic::ltlf_ptr& formula,
 
 bool ForwardSynthesis::is_realizable() {
   bool result = forward_synthesis_();
+  context_.logger.info("Time spent per phase:");
+  for (const auto& phase : context_.statistics_.phase_times_ms()) {
+    context_.logger.info("  {}: {}ms", phase.first, phase.second);
+  }
   return result;
 }
 
 bool ForwardSynthesis::forward_synthesis_() {
   auto path = Path{};
+  auto& statistics = context_.statistics_;
 
   context_.logger.info("Check zero-step realizability");
+  auto zero_step_timer = statistics.time_phase("zero_step");
   if (eval(*context_.nnf_formula)) {
     context_.logger.info("Zero-step realizability check successful");
     return true;
   }
+  zero_step_timer.stop();
 
   context_.logger.info("Check one-step realizability");
-  auto pair_rel_result =
-      one_step_realizability(*context_.nnf_formula, context_);
+  auto one_step_timer = statistics.time_phase("one_step_realizability");
+  auto pair_rel_result = one_step_realizability_(*context_.nnf_formula);
   if (pair_rel_result.second) {
     context_.logger.info("One-step realizability check successful");
     return true;
   }
+  one_step_timer.stop();
   context_.logger.info("Check one-step unrealizability");
-  auto is_unrealizable =
-      one_step_unrealizability(*context_.nnf_formula, context_);
+  auto one_step_unrel_timer = statistics.time_phase("one_step_unrealizability");
+  auto is_unrealizable = one_step_unrealizability_(*context_.nnf_formula);
   if (!is_unrealizable) {
     context_.logger.info("One-step unrealizability check successful");
     return false;
   }
+  one_step_unrel_timer.stop();
 
   context_.logger.info("Building the root SDD node...");
+  auto root_sdd_timer = statistics.time_phase("root_sdd");
   auto root_sdd_node = to_sdd(*context_.xnf_formula, context_);
   auto sdd_formula_id = sdd_id(root_sdd_node);
+  root_sdd_timer.stop();
   context_.logger.info("Starting first system move...");
+  auto search_timer = statistics.time_phase("search");
   auto strategy = system_move_(context_.xnf_formula, path);
   bool result = strategy[sdd_formula_id] != sdd_manager_false(context_.manager);
+  search_timer.stop();
   context_.logger.info("Explored states: {}",
                        context_.statistics_.nb_visited_nodes());
   return result;
@@ -93,32 +106,39 @@ strategy_t ForwardSynthesis::system_move_(const logic::ltlf_ptr& formula,
                                           Path& path) {
   strategy_t success_strategy, failure_strategy;
   context_.indentation += 1;
-  auto sdd = SddNodeWrapper(to_sdd(*formula, context_), context_.manager);
+  auto sdd = formula_to_sdd_(formula);
   auto sdd_formula_id = sdd.get_id();
+  auto span =
+      TraceSpan(context_.tracer, "system_move",
+                {{"state", sdd_formula_id}, {"depth", context_.indentation}});
   context_.statistics_.visit_node(sdd_formula_id);
 
   success_strategy[sdd_formula_id] = sdd_manager_true(context_.manager);
   failure_strategy[sdd_formula_id] = sdd_manager_false(context_.manager);
-  context_.print_search_debug("State {}", sdd_formula_id);
+  CYNTHIA_SEARCH_DEBUG(context_, "State {}", sdd_formula_id);
 
   if (context_.discovered.find(sdd_formula_id) != context_.discovered.end()) {
     context_.indentation -= 1;
     bool is_success = context_.discovered[sdd_formula_id];
+    context_.trace_instant(
+        "discovered", {{"state", sdd_formula_id}, {"success", is_success}});
     if (is_success) {
-      context_.print_search_debug("{} already discovered, success",
-                                  sdd_formula_id);
+      CYNTHIA_SEARCH_DEBUG(context_, "{} already discovered, success",
+                           sdd_formula_id);
       return strategy_t{
           {sdd_formula_id, context_.winning_moves[sdd_formula_id]}};
     } else {
-      context_.print_search_debug("{} already discovered, failure",
-                                  sdd_formula_id);
+      CYNTHIA_SEARCH_DEBUG(context_, "{} already discovered, failure",
+                           sdd_formula_id);
       return failure_strategy;
     }
   }
 
   if (path.contains(sdd_formula_id)) {
-    context_.print_search_debug("Loop detected for node {}, tagging the node",
-                                sdd_formula_id);
+    CYNTHIA_SEARCH_DEBUG(context_,
+                         "Loop detected for node {}, tagging the node",
+                         sdd_formula_id);
+    context_.trace_instant("loop", {{"state", sdd_formula_id}});
     context_.loop_tags.insert(sdd_formula_id);
     context_.discovered[sdd_formula_id] = false;
     context_.indentation -= 1;
@@ -126,15 +146,15 @@ strategy_t ForwardSynthesis::system_move_(const logic::ltlf_ptr& formula,
   }
 
   if (eval(*formula)) {
-    context_.print_search_debug("{} accepting!", sdd_formula_id);
+    CYNTHIA_SEARCH_DEBUG(context_, "{} accepting!", sdd_formula_id);
+    context_.trace_instant("accepting", {{"state", sdd_formula_id}});
     context_.discovered[sdd_formula_id] = true;
     context_.winning_moves[sdd_formula_id] = sdd_manager_true(context_.manager);
     context_.indentation -= 1;
     return success_strategy;
   }
 
-  auto one_step_realizability_result =
-      one_step_realizability(*formula, context_);
+  auto one_step_realizability_result = one_step_realizability_(*formula);
   if (one_step_realizability_result.second) {
     strategy_t strategy;
     strategy[sdd_formula_id] = one_step_realizability_result.first;
@@ -144,7 +164,7 @@ strategy_t ForwardSynthesis::system_move_(const logic::ltlf_ptr& formula,
     context_.indentation -= 1;
     return strategy;
   }
-  auto is_unrealizable = one_step_unrealizability(*formula, context_);
+  auto is_unrealizable = one_step_unrealizability_(*formula);
   if (!is_unrealizable) {
     context_.discovered[sdd_formula_id] = false;
     context_.indentation -= 1;
@@ -154,9 +174,9 @@ strategy_t ForwardSynthesis::system_move_(const logic::ltlf_ptr& formula,
   path.push(sdd_formula_id);
   if (sdd.get_type() == SddNodeType::STATE) {
     // both system and env moves are irrelevant
-    auto system_move_str =
-        logic::to_string(*sdd_to_formula(sdd.get_raw(), context_));
-    context_.print_search_debug("system move (unique): {}", system_move_str);
+    CYNTHIA_SEARCH_DEBUG(
+        context_, "system move (unique): {}",
+        logic::to_string(*sdd_to_formula(sdd.get_raw(), context_)));
     auto new_strategy = env_move_(sdd, path);
     if (!new_strategy.empty()) {
       path.pop();
@@ -169,12 +189,13 @@ strategy_t ForwardSynthesis::system_move_(const logic::ltlf_ptr& formula,
   } else if (sdd.get_type() == SddNodeType::ENV_STATE) {
     // not at the vtree root; it means that system choice is irrelevant
     // (but env has several choices)
-    context_.print_search_debug("system choice is irrelevant");
+    CYNTHIA_SEARCH_DEBUG(context_, "system choice is irrelevant");
     auto env_state_node = sdd;
     auto new_strategy = env_move_(env_state_node, path);
     if (!new_strategy.empty()) {
-      context_.print_search_debug("Any system move is a success from state {}!",
-                                  sdd_formula_id);
+      CYNTHIA_SEARCH_DEBUG(context_,
+                           "Any system move is a success from state {}!",
+                           sdd_formula_id);
       path.pop();
       // all system moves are OK, since it does not have control
       context_.discovered[sdd_formula_id] = true;
@@ -189,15 +210,16 @@ strategy_t ForwardSynthesis::system_move_(const logic::ltlf_ptr& formula,
     auto children_end = sdd.end();
 
     if (child_it == children_end) {
-      context_.print_search_debug("No children, {} is failure", sdd_formula_id);
+      CYNTHIA_SEARCH_DEBUG(context_, "No children, {} is failure",
+                           sdd_formula_id);
       path.pop();
       context_.discovered[sdd_formula_id] = false;
       context_.indentation -= 1;
       return failure_strategy;
     }
 
-    context_.print_search_debug("Processing {} system node's children nodes",
-                                sdd.nb_children());
+    CYNTHIA_SEARCH_DEBUG(context_, "Processing {} system node's children nodes",
+                         sdd.nb_children());
     std::vector<std::pair<SddNodeWrapper, SddNodeWrapper>> new_children;
     new_children.reserve(sdd.nb_children());
     // process all children, looking for OR-nodes
@@ -223,8 +245,12 @@ strategy_t ForwardSynthesis::system_move_(const logic::ltlf_ptr& formula,
             context_.discovered.find(next_state.get_id());
         if (next_state_result_it != context_.discovered.end()) {
           auto next_state_is_success = next_state_result_it->second;
+          context_.trace_instant(
+              "lookahead_discovered",
+              {{"state", next_state_id}, {"success", next_state_is_success}});
           if (next_state_is_success) {
-            context_.print_search_debug(
+            CYNTHIA_SEARCH_DEBUG(
+                context_,
                 "system look-ahead: next state {} already discovered, success",
                 next_state.get_id());
             path.pop();
@@ -233,18 +259,18 @@ strategy_t ForwardSynthesis::system_move_(const logic::ltlf_ptr& formula,
             strategy[sdd_formula_id] = system_move.get_raw();
             return strategy;
           } else {
-            context_.print_search_debug(
-                "system look-ahead: next state {} already "
-                "discovered, failure, ignoring",
-                next_state.get_id());
+            CYNTHIA_SEARCH_DEBUG(context_,
+                                 "system look-ahead: next state {} already "
+                                 "discovered, failure, ignoring",
+                                 next_state.get_id());
             continue;
           }
         }
         auto one_step_realizability_result =
-            one_step_realizability(*formula_next_state, context_);
+            one_step_realizability_(*formula_next_state);
         if (one_step_realizability_result.second) {
-          context_.print_search_debug("system look-ahead: one-step "
-                                      "realizability check was successful");
+          CYNTHIA_SEARCH_DEBUG(context_, "system look-ahead: one-step "
+                                         "realizability check was successful");
           strategy_t strategy;
           strategy[sdd_formula_id] = system_move.get_raw();
           strategy[next_state_id] = one_step_realizability_result.first;
@@ -256,24 +282,25 @@ strategy_t ForwardSynthesis::system_move_(const logic::ltlf_ptr& formula,
           context_.indentation -= 1;
           return strategy;
         }
-        auto is_unrealizable =
-            one_step_unrealizability(*formula_next_state, context_);
+        auto is_unrealizable = one_step_unrealizability_(*formula_next_state);
         if (!is_unrealizable) {
-          context_.print_search_debug("system look-ahead: one-step "
-                                      "unrealizability check was successful");
+          CYNTHIA_SEARCH_DEBUG(context_,
+                               "system look-ahead: one-step "
+                               "unrealizability check was successful");
           context_.discovered[next_state_id] = false;
           continue;
         }
-        context_.print_search_debug(
-            "system look-ahead: next state {} not discovered yet ",
+        CYNTHIA_SEARCH_DEBUG(
+            context_, "system look-ahead: next state {} not discovered yet ",
             next_state.get_id());
         new_children.emplace_back(system_move, env_state_node);
       } else {
         // one-step lookahead check inconclusive, need to take env action.
         // OR-AND transition.
         assert(env_state_node.get_type() == ENV_STATE);
-        context_.print_search_debug("system look-ahead: {} is not a state node",
-                                    env_state_node.get_id());
+        CYNTHIA_SEARCH_DEBUG(context_,
+                             "system look-ahead: {} is not a state node",
+                             env_state_node.get_id());
         new_children.emplace_back(system_move, env_state_node);
       }
     }
@@ -283,26 +310,28 @@ strategy_t ForwardSynthesis::system_move_(const logic::ltlf_ptr& formula,
     for (const auto& pair : new_children) {
       auto system_move = pair.first;
       auto env_state_node = pair.second;
-      auto system_move_str =
-          logic::to_string(*sdd_to_formula(system_move.get_raw(), context_));
-      context_.print_search_debug("checking system move: {}", system_move_str);
+      CYNTHIA_SEARCH_DEBUG(
+          context_, "checking system move: {}",
+          logic::to_string(*sdd_to_formula(system_move.get_raw(), context_)));
       ++child_it;
       if (system_move.is_false())
         continue;
       auto new_strategy = env_move_(env_state_node, path);
       if (!new_strategy.empty()) {
-        context_.print_search_debug(
-            "System move {} from state {} is successful", sdd_formula_id,
-            system_move_str);
+        CYNTHIA_SEARCH_DEBUG(
+            context_, "System move {} from state {} is successful",
+            sdd_formula_id,
+            logic::to_string(*sdd_to_formula(system_move.get_raw(), context_)));
         path.pop();
         new_strategy[sdd_formula_id] = system_move.get_raw();
         context_.discovered[sdd_formula_id] = true;
         context_.winning_moves[sdd_formula_id] = system_move.get_raw();
         if (context_.loop_tags.find(sdd_formula_id) !=
             context_.loop_tags.end()) {
-          context_.print_search_debug("trigger backward search to update "
-                                      "success tag of predecessors of {}",
-                                      sdd_formula_id);
+          CYNTHIA_SEARCH_DEBUG(context_,
+                               "trigger backward search to update "
+                               "success tag of predecessors of {}",
+                               sdd_formula_id);
           backprop_success(sdd, new_strategy);
         }
         context_.indentation -= 1;
@@ -311,7 +340,7 @@ strategy_t ForwardSynthesis::system_move_(const logic::ltlf_ptr& formula,
     }
   }
 
-  context_.print_search_debug("State {} is failure", sdd_formula_id);
+  CYNTHIA_SEARCH_DEBUG(context_, "State {} is failure", sdd_formula_id);
   path.pop();
   context_.discovered[sdd_formula_id] = false;
   context_.indentation -= 1;
@@ -320,6 +349,9 @@ strategy_t ForwardSynthesis::system_move_(const logic::ltlf_ptr& formula,
 
 strategy_t ForwardSynthesis::env_move_(SddNodeWrapper& wrapper, Path& path) {
   context_.indentation += 1;
+  auto span =
+      TraceSpan(context_.tracer, "env_move",
+                {{"state", wrapper.get_id()}, {"depth", context_.indentation}});
   if (wrapper.get_type() == SddNodeType::STATE) {
     // env move is irrelevant
     auto formula_next_state = next_state_formula_(wrapper.get_raw());
@@ -328,8 +360,8 @@ strategy_t ForwardSynthesis::env_move_(SddNodeWrapper& wrapper, Path& path) {
     // add OR->? transition
     add_transition_(wrapper, sdd_manager_true(context_.manager),
                     sdd_next_state);
-    context_.print_search_debug("env move forced to next state {}",
-                                sdd_next_state_id);
+    CYNTHIA_SEARCH_DEBUG(context_, "env move forced to next state {}",
+                         sdd_next_state_id);
     auto strategy = system_move_(formula_next_state, path);
     context_.indentation -= 1;
     if (strategy[sdd_next_state_id] == sdd_manager_false(context_.manager))
@@ -340,8 +372,8 @@ strategy_t ForwardSynthesis::env_move_(SddNodeWrapper& wrapper, Path& path) {
     assert(wrapper.get_type() == ENV_STATE);
     auto child_it = wrapper.begin();
     auto children_end = wrapper.end();
-    context_.print_search_debug("Processing {} env node's children nodes",
-                                wrapper.nb_children());
+    CYNTHIA_SEARCH_DEBUG(context_, "Processing {} env node's children nodes",
+                         wrapper.nb_children());
     std::vector<std::pair<SddNodeWrapper, SddNodeWrapper>> new_children;
     new_children.reserve(wrapper.nb_children());
     // process all children, looking for OR-successors
@@ -363,34 +395,38 @@ strategy_t ForwardSynthesis::env_move_(SddNodeWrapper& wrapper, Path& path) {
       auto next_state_result_it = context_.discovered.find(next_state_id);
       if (next_state_result_it != context_.discovered.end()) {
         auto next_state_is_success = next_state_result_it->second;
+        context_.trace_instant(
+            "lookahead_discovered",
+            {{"state", next_state_id}, {"success", next_state_is_success}});
         if (next_state_is_success) {
-          context_.print_search_debug("env look-ahead: next state {} already "
-                                      "discovered, success, ignoring",
-                                      next_state_id);
+          CYNTHIA_SEARCH_DEBUG(context_,
+                               "env look-ahead: next state {} already "
+                               "discovered, success, ignoring",
+                               next_state_id);
           ignore = true;
         }
         if (!next_state_is_success) {
-          context_.print_search_debug(
+          CYNTHIA_SEARCH_DEBUG(
+              context_,
               "env look-ahead: next state {} already discovered, failure",
               next_state_id);
           context_.indentation -= 1;
           return strategy_t{};
         }
       }
-      auto is_unrealizable =
-          one_step_unrealizability(*formula_next_state, context_);
+      auto is_unrealizable = one_step_unrealizability_(*formula_next_state);
       if (!is_unrealizable) {
-        context_.print_search_debug("env look-ahead: one-step "
-                                    "unrealizability check was successful");
+        CYNTHIA_SEARCH_DEBUG(context_, "env look-ahead: one-step "
+                                       "unrealizability check was successful");
         context_.discovered[next_state_id] = false;
         context_.indentation -= 1;
         return strategy_t{};
       }
       auto one_step_realizability_result =
-          one_step_realizability(*formula_next_state, context_);
+          one_step_realizability_(*formula_next_state);
       if (one_step_realizability_result.second) {
-        context_.print_search_debug("env look-ahead: one-step "
-                                    "realizability check was successful");
+        CYNTHIA_SEARCH_DEBUG(context_, "env look-ahead: one-step "
+                                       "realizability check was successful");
         context_.discovered[next_state_id] = true;
         context_.winning_moves[next_state_id] =
             one_step_realizability_result.first;
@@ -398,17 +434,17 @@ strategy_t ForwardSynthesis::env_move_(SddNodeWrapper& wrapper, Path& path) {
       }
       if (!ignore) {
         // we don't know, need to take env action
-        context_.print_search_debug(
-            "env look-ahead: next state {} not discovered yet",
-            state_node.get_id());
+        CYNTHIA_SEARCH_DEBUG(context_,
+                             "env look-ahead: next state {} not discovered yet",
+                             state_node.get_id());
         new_children.emplace_back(env_node, state_node);
       }
     }
 
     if (new_children.empty()) {
       // take any successor, it will be a win
-      context_.print_search_debug(
-          "env look-ahead: taking any env action, system wins");
+      CYNTHIA_SEARCH_DEBUG(
+          context_, "env look-ahead: taking any env action, system wins");
       auto formula_next_state = next_state_formula_(wrapper.begin().get_sub());
       context_.indentation -= 1;
       return system_move_(formula_next_state, path);
@@ -419,12 +455,12 @@ strategy_t ForwardSynthesis::env_move_(SddNodeWrapper& wrapper, Path& path) {
     for (const auto& pair : new_children) {
       auto env_move = pair.first;
       auto state_node = pair.second;
-      auto env_action = sdd_to_formula(env_move.get_raw(), context_);
-      auto env_action_str = logic::to_string(*env_action);
       auto formula_next_state = next_state_formula_(state_node.get_raw());
       auto sdd_next_state = formula_to_sdd_(formula_next_state);
       auto sdd_next_state_id = sdd_next_state.get_id();
-      context_.print_search_debug("env move: {}", env_action_str);
+      CYNTHIA_SEARCH_DEBUG(
+          context_, "env move: {}",
+          logic::to_string(*sdd_to_formula(env_move.get_raw(), context_)));
       auto strategy = system_move_(formula_next_state, path);
       if (strategy[sdd_next_state_id] == sdd_manager_false(context_.manager)) {
         context_.indentation -= 1;
@@ -438,15 +474,40 @@ strategy_t ForwardSynthesis::env_move_(SddNodeWrapper& wrapper, Path& path) {
 }
 
 logic::ltlf_ptr ForwardSynthesis::next_state_formula_(SddNode* sdd_ptr) {
+  // Only read the clock when tracing: these run for every search node
+  auto start = context_.tracer ? Tracer::now() : Tracer::time_point{};
   auto sdd_formula = sdd_to_formula(sdd_ptr, context_);
   auto next_state_formula = xnf(*strip_next(*sdd_formula));
+  if (context_.tracer) {
+    context_.tracer->complete("next_state_formula", start,
+                              {{"sdd", sdd_id(sdd_ptr)}});
+  }
   return next_state_formula;
 }
 SddNodeWrapper
 ForwardSynthesis::formula_to_sdd_(const logic::ltlf_ptr& formula) {
+  auto start = context_.tracer ? Tracer::now() : Tracer::time_point{};
   auto wrapper = SddNodeWrapper(to_sdd(*formula, context_), context_.manager);
+  if (context_.tracer) {
+    context_.tracer->complete("to_sdd", start, {{"sdd", wrapper.get_id()}});
+  }
   return wrapper;
 }
+std::pair<SddNode*, bool>
+ForwardSynthesis::one_step_realizability_(const logic::LTLfFormula& formula) {
+  auto span = TraceSpan(context_.tracer, "one_step_realizability");
+  auto result = one_step_realizability(formula, context_);
+  span.end({{"realizable", result.second}});
+  return result;
+}
+bool ForwardSynthesis::one_step_unrealizability_(
+    const logic::LTLfFormula& formula) {
+  auto span = TraceSpan(context_.tracer, "one_step_unrealizability");
+  // false means that the formula is unrealizable
+  auto result = one_step_unrealizability(formula, context_);
+  span.end({{"unrealizable", !result}});
+  return result;
+}
 SddNodeWrapper ForwardSynthesis::next_state_(const SddNodeWrapper& wrapper) {
   auto next_state_formula = next_state_formula_(wrapper.get_raw());
   auto sdd_next_state = formula_to_sdd_(next_state_formula);
@@ -497,15 +558,30 @@ ForwardSynthesis::Context::Context(const logic::ltlf_ptr& formula,
                                    bool use_gc, float gc_threshold)
     : logger{"cynthia"}, formula{formula}, partition{partition}, use_gc{use_gc},
       gc_threshold{gc_threshold}, ast_manager{&formula->ctx()} {
-  nnf_formula = logic::to_nnf(*formula);
-  xnf_formula = xnf(*nnf_formula);
-  Closure closure_object = closure(*xnf_formula);
-  closure_ = closure_object;
-  auto builder = VTreeBuilder(closure_, partition);
-  vtree_ = builder.get_vtree();
-  manager = sdd_manager_new(vtree_);
+  {
+    auto timer = statistics_.time_phase("nnf");
+    nnf_formula = logic::to_nnf(*formula);
+  }
+  {
+    auto timer = statistics_.time_phase("xnf");
+    xnf_formula = xnf(*nnf_formula);
+  }
+  {
+    auto timer = statistics_.time_phase("closure");
+    Closure closure_object = closure(*xnf_formula);
+    closure_ = closure_object;
+  }
+  {
+    auto timer = statistics_.time_phase("vtree");
+    auto builder = VTreeBuilder(closure_, partition);
+    vtree_ = builder.get_vtree();
+  }
+  {
+    auto timer = statistics_.time_phase("sdd_manager");
+    manager = sdd_manager_new(vtree_);
+  }
+  auto timer = statistics_.time_phase("maps");
   prop_to_id = compute_prop_to_id_map(closure_, partition);
-  statistics_ = Statistics();
   initialie_maps_();
 }
 
@@ -529,14 +605,17 @@ void ForwardSynthesis::Context::call_gc_vtree() const {
     if (result) {
       auto after_live = sdd_manager_live_size(manager);
       auto after_dead = sdd_manager_dead_size(manager);
-      print_search_debug("vtree garbage collection with threshold {} completed",
-                         gc_threshold);
-      print_search_debug("== before garbage collection:");
-      print_search_debug("  live sdd size = {}", before_live);
-      print_search_debug("  dead sdd size = {}", before_dead);
-      print_search_debug("== after garbage collection:");
-      print_search_debug("  live sdd size = {}", after_live);
-      print_search_debug("  dead sdd size = {}", after_dead);
+      trace_instant("garbage_collection",
+                    {{"live_size", after_live}, {"dead_size", after_dead}});
+      CYNTHIA_SEARCH_DEBUG(
+          *this, "vtree garbage collection with threshold {} completed",
+          gc_threshold);
+      CYNTHIA_SEARCH_DEBUG(*this, "== before garbage collection:");
+      CYNTHIA_SEARCH_DEBUG(*this, "  live sdd size = {}", before_live);
+      CYNTHIA_SEARCH_DEBUG(*this, "  dead sdd size = {}", before_dead);
+      CYNTHIA_SEARCH_DEBUG(*this, "== after garbage collection:");
+      CYNTHIA_SEARCH_DEBUG(*this, "  live sdd size = {}", after_live);
+      CYNTHIA_SEARCH_DEBUG(*this, "  dead sdd size = {}", after_dead);
     }
   }
 }
@@ -598,9 +677,9 @@ void ForwardSynthesis::add_transition_(const SddNodeWrapper& start,
   auto start_node = Node{start.get_id(), start_state_type};
   auto end_node = Node{end.get_id(), end_state_type};
 
-  context_.print_search_debug(
-      "Adding transition ({}, {}, {})", start_node.to_string(),
-      std::to_string(sdd_id(move_node)), end_node.to_string());
+  CYNTHIA_SEARCH_DEBUG(context_, "Adding transition ({}, {}, {})",
+                       start_node.to_string(),
+                       std::to_string(sdd_id(move_node)), end_node.to_string());
   context_.graph.add_transition(start_node, move_node, end_node);
 }
 
@@ -70,5 +70,24 @@ SddNode* Graph::get_action_by_id(SddSize action_id) const {
   return action_by_id.at(action_id);
 }
 
+size_t Graph::nb_nodes() const {
+  std::set<size_t> node_ids;
+  for (const auto& start_and_successors : transitions) {
+    node_ids.insert(start_and_successors.first.id);
+    for (const auto& action_and_end : start_and_successors.second) {
+      node_ids.insert(action_and_end.second.id);
+    }
+  }
+  return node_ids.size();
+}
+
+size_t Graph::nb_transitions() const {
+  size_t result = 0;
+  for (const auto& start_and_successors : transitions) {
+    result += start_and_successors.second.size();
+  }
+  return result;
+}
+
 } // namespace core
 } // namespace cynthia
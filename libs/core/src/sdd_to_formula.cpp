@@ -25,8 +25,10 @@ logic::ltlf_ptr sdd_to_formula(SddNode* sdd_node,
                                ForwardSynthesis::Context& context_) {
   auto pair = context_.sdd_node_id_to_formula.find(sdd_id(sdd_node));
   if (pair != context_.sdd_node_id_to_formula.end()) {
+    context_.statistics_.sdd_to_formula_cache.hit();
     return pair->second;
   }
+  context_.statistics_.sdd_to_formula_cache.miss();
   logic::ltlf_ptr result;
   if (sdd_node_is_false(sdd_node)) {
     result = context_.ast_manager->make_ff();
@@ -20,8 +20,48 @@
 namespace cynthia {
 namespace core {
 
+double CacheStatistics::hit_rate() const {
+  if (nb_lookups() == 0) {
+    return 0.0;
+  }
+  return static_cast<double>(hits_) / static_cast<double>(nb_lookups());
+}
+
 void Statistics::visit_node(size_t node_id) { nodes.insert(node_id); }
 
 size_t Statistics::nb_visited_nodes() const { return nodes.size(); }
+
+void Statistics::add_phase_time(const std::string& phase, double milliseconds) {
+  for (auto& entry : phase_times_ms_) {
+    if (entry.first == phase) {
+      entry.second += milliseconds;
+      return;
+    }
+  }
+  phase_times_ms_.emplace_back(phase, milliseconds);
+}
+
+double Statistics::phase_time_ms(const std::string& phase) const {
+  for (const auto& entry : phase_times_ms_) {
+    if (entry.first == phase) {
+      return entry.second;
+    }
+  }
+  return 0.0;
+}
+
+PhaseTimer::PhaseTimer(Statistics& statistics, std::string phase)
+    : statistics_{&statistics}, phase_{std::move(phase)},
+      start_{std::chrono::steady_clock::now()} {}
+
+void PhaseTimer::stop() {
+  if (!statistics_) {
+    return;
+  }
+  auto end = std::chrono::steady_clock::now();
+  statistics_->add_phase_time(
+      phase_, std::chrono::duration<double, std::milli>(end - start_).count());
+  statistics_ = nullptr;
+}
 } // namespace core
 } // namespace cynthia
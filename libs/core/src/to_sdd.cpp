@@ -144,8 +144,10 @@ SddNode* to_sdd(const logic::LTLfFormula& formula,
   auto formula_ptr = formula.shared_from_this();
   auto cached_result = context.formula_to_sdd_node.find(formula_ptr);
   if (cached_result != context.formula_to_sdd_node.end()) {
+    context.statistics_.to_sdd_cache.hit();
     return cached_result->second;
   }
+  context.statistics_.to_sdd_cache.miss();
   auto result = visitor.apply(formula);
   context.formula_to_sdd_node[formula_ptr] = result;
   return result;
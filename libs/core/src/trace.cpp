@@ -0,0 +1,93 @@
+/*
+ * This file is part of Cynthia.
+ *
+ * Cynthia is free software: you can redistribute it and/or modify
+ * it under the terms of the GNU General Public License as published by
+ * the Free Software Foundation, either version 3 of the License, or
+ * (at your option) any later version.
+ *
+ * Cynthia is distributed in the hope that it will be useful,
+ * but WITHOUT ANY WARRANTY; without even the implied warranty of
+ * MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+ * GNU General Public License for more details.
+ *
+ * You should have received a copy of the GNU General Public License
+ * along with Cynthia.  If not, see <https://www.gnu.org/licenses/>.
+ */
+
+#include <cynthia/trace.hpp>
+#include <iomanip>
+
+namespace cynthia {
+namespace core {
+
+Tracer::Tracer(std::ostream& out) : out_{out}, origin_{now()} {
+  // microseconds
+  out_ << std::fixed << std::setprecision(3) << "[";
+}
+
+Tracer::~Tracer() { out_ << "\n]\n" << std::flush; }
+
+double Tracer::timestamp_(Tracer::time_point time) const {
+  return std::chrono::duration<double, std::micro>(time - origin_).count();
+}
+
+void Tracer::event_(const char* name, char phase, double timestamp,
+                    const trace_args_t& args, double duration) {
+  out_ << (first_event_ ? "\n" : ",\n");
+  first_event_ = false;
+  out_ << "{\"name\":\"" << name << "\",\"ph\":\"" << phase
+       << "\",\"ts\":" << timestamp;
+  if (duration >= 0) {
+    out_ << ",\"dur\":" << duration;
+  }
+  if (phase == 'i') {
+    out_ << ",\"s\":\"t\"";
+  }
+  out_ << ",\"pid\":1,\"tid\":1";
+  if (args.size() > 0) {
+    out_ << ",\"args\":{";
+    bool first_arg = true;
+    for (const auto& arg : args) {
+      out_ << (first_arg ? "\"" : ",\"") << arg.first << "\":" << arg.second;
+      first_arg = false;
+    }
+    out_ << "}";
+  }
+  out_ << "}";
+}
+
+void Tracer::begin(const char* name, const trace_args_t& args) {
+  event_(name, 'B', timestamp_(now()), args);
+}
+
+void Tracer::end(const char* name, const trace_args_t& args) {
+  event_(name, 'E', timestamp_(now()), args);
+}
+
+void Tracer::instant(const char* name, const trace_args_t& args) {
+  event_(name, 'i', timestamp_(now()), args);
+}
+
+void Tracer::complete(const char* name, Tracer::time_point start,
+                      const trace_args_t& args) {
+  auto begin = timestamp_(start);
+  event_(name, 'X', begin, args, timestamp_(now()) - begin);
+}
+
+TraceSpan::TraceSpan(Tracer* tracer, const char* name, const trace_args_t& args)
+    : tracer_{tracer}, name_{name} {
+  if (tracer_) {
+    tracer_->begin(name_, args);
+  }
+}
+
+void TraceSpan::end(const trace_args_t& args) {
+  if (tracer_) {
+    tracer_->end(name_, args);
+    tracer_ = nullptr;
+  }
+}
+
+} // namespace core
+} // namespace cynthia
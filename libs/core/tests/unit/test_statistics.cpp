@@ -0,0 +1,80 @@
+/*
+ * This file is part of Cynthia.
+ *
+ * Cynthia is free software: you can redistribute it and/or modify
+ * it under the terms of the GNU General Public License as published by
+ * the Free Software Foundation, either version 3 of the License, or
+ * (at your option) any later version.
+ *
+ * Cynthia is distributed in the hope that it will be useful,
+ * but WITHOUT ANY WARRANTY; without even the implied warranty of
+ * MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+ * GNU General Public License for more details.
+ *
+ * You should have received a copy of the GNU General Public License
+ * along with Cynthia.  If not, see <https://www.gnu.org/licenses/>.
+ */
+#include <catch.hpp>
+#include <cynthia/statistics.hpp>
+
+namespace cynthia {
+namespace core {
+namespace Test {
+
+TEST_CASE("Phase times are accumulated in order of first occurrence",
+          "[statistics]") {
+  auto statistics = Statistics();
+  REQUIRE(statistics.phase_times_ms().empty());
+  REQUIRE(statistics.phase_time_ms("nnf") == 0.0);
+
+  statistics.add_phase_time("nnf", 1.5);
+  statistics.add_phase_time("search", 10.0);
+  statistics.add_phase_time("nnf", 2.0);
+
+  const auto& phases = statistics.phase_times_ms();
+  REQUIRE(phases.size() == 2);
+  REQUIRE(phases[0].first == "nnf");
+  REQUIRE(phases[0].second == 3.5);
+  REQUIRE(phases[1].first == "search");
+  REQUIRE(statistics.phase_time_ms("search") == 10.0);
+}
+
+TEST_CASE("Phase timer", "[statistics]") {
+  auto statistics = Statistics();
+
+  SECTION("records the phase when it goes out of scope") {
+    {
+      auto timer = statistics.time_phase("vtree");
+      REQUIRE(statistics.phase_times_ms().empty());
+    }
+    REQUIRE(statistics.phase_times_ms().size() == 1);
+    REQUIRE(statistics.phase_times_ms()[0].first == "vtree");
+    REQUIRE(statistics.phase_time_ms("vtree") >= 0.0);
+  }
+
+  SECTION("records the phase only once when stopped explicitly") {
+    {
+      auto timer = statistics.time_phase("search");
+      timer.stop();
+      auto recorded = statistics.phase_time_ms("search");
+      timer.stop();
+      REQUIRE(statistics.phase_time_ms("search") == recorded);
+    }
+    REQUIRE(statistics.phase_times_ms().size() == 1);
+  }
+}
+
+TEST_CASE("Cache hit rate", "[statistics]") {
+  auto cache = CacheStatistics();
+  REQUIRE(cache.hit_rate() == 0.0);
+  cache.miss();
+  cache.hit();
+  cache.hit();
+  cache.hit();
+  REQUIRE(cache.nb_lookups() == 4);
+  REQUIRE(cache.hit_rate() == 0.75);
+}
+
+} // namespace Test
+} // namespace core
+} // namespace cynthia
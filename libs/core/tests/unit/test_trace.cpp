@@ -0,0 +1,73 @@
+/*
+ * This file is part of Cynthia.
+ *
+ * Cynthia is free software: you can redistribute it and/or modify
+ * it under the terms of the GNU General Public License as published by
+ * the Free Software Foundation, either version 3 of the License, or
+ * (at your option) any later version.
+ *
+ * Cynthia is distributed in the hope that it will be useful,
+ * but WITHOUT ANY WARRANTY; without even the implied warranty of
+ * MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+ * GNU General Public License for more details.
+ *
+ * You should have received a copy of the GNU General Public License
+ * along with Cynthia.  If not, see <https://www.gnu.org/licenses/>.
+ */
+#include <catch.hpp>
+#include <cynthia/trace.hpp>
+#include <sstream>
+
+namespace cynthia {
+namespace core {
+namespace Test {
+
+TEST_CASE("Empty trace", "[trace]") {
+  std::ostringstream out;
+  { auto tracer = Tracer(out); }
+  REQUIRE(out.str() == "[\n]\n");
+}
+
+TEST_CASE("Trace events", "[trace]") {
+  std::ostringstream out;
+  {
+    auto tracer = Tracer(out);
+    {
+      auto span = TraceSpan(&tracer, "system_move", {{"state", 3}});
+      tracer.instant("loop", {{"state", 3}, {"depth", 1}});
+      tracer.complete("to_sdd", Tracer::now());
+      span.end({{"success", 1}});
+    }
+  }
+  auto trace = out.str();
+  auto begin = trace.find("{\"name\":\"system_move\",\"ph\":\"B\"");
+  auto instant = trace.find("{\"name\":\"loop\",\"ph\":\"i\"");
+  auto complete = trace.find("{\"name\":\"to_sdd\",\"ph\":\"X\"");
+  auto end = trace.find("{\"name\":\"system_move\",\"ph\":\"E\"");
+  REQUIRE(trace.front() == '[');
+  REQUIRE(begin != std::string::npos);
+  REQUIRE(instant != std::string::npos);
+  REQUIRE(complete != std::string::npos);
+  REQUIRE(end != std::string::npos);
+  REQUIRE(begin < instant);
+  REQUIRE(instant < complete);
+  REQUIRE(complete < end);
+  REQUIRE(trace.find("\"args\":{\"state\":3}", begin) < instant);
+  REQUIRE(trace.find("\"args\":{\"state\":3,\"depth\":1}") !=
+          std::string::npos);
+  REQUIRE(trace.find("\"dur\":", complete) < end);
+  REQUIRE(trace.find("\"args\":{\"success\":1}", end) != std::string::npos);
+  // the span is ended only once
+  REQUIRE(trace.find("\"ph\":\"E\"", trace.find("}}", end)) ==
+          std::string::npos);
+}
+
+TEST_CASE("Span without tracer", "[trace]") {
+  auto span = TraceSpan(nullptr, "system_move", {{"state", 3}});
+  span.end();
+  REQUIRE(true);
+}
+
+} // namespace Test
+} // namespace core
+} // namespace cynthia
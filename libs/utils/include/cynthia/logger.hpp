@@ -22,6 +22,31 @@
 // clang-format on
 #include <string>
 
+/*
+ * Log with `logger` only if messages of `level` are enabled, so that the
+ * arguments are not evaluated otherwise. Define CYNTHIA_DISABLE_TRACING
+ * (CMake option CYNTHIA_TRACING=OFF) to compile these calls out.
+ */
+#ifdef CYNTHIA_DISABLE_TRACING
+#define CYNTHIA_LOG_ENABLED(logger, level) false
+#else
+#define CYNTHIA_LOG_ENABLED(logger, level) (logger).should_log(level)
+#endif
+
+#define CYNTHIA_DEBUG(logger, ...)                                             \
+  do {                                                                         \
+    if (CYNTHIA_LOG_ENABLED(logger, ::cynthia::utils::LogLevel::debug)) {      \
+      (logger).debug(__VA_ARGS__);                                             \
+    }                                                                          \
+  } while (0)
+
+#define CYNTHIA_TRACE(logger, ...)                                             \
+  do {                                                                         \
+    if (CYNTHIA_LOG_ENABLED(logger, ::cynthia::utils::LogLevel::trace)) {      \
+      (logger).trace(__VA_ARGS__);                                             \
+    }                                                                          \
+  } while (0)
+
 namespace cynthia {
 namespace utils {
 
@@ -40,6 +65,11 @@ public:
 
   std::string section() const noexcept { return section_; }
 
+  bool should_log(const LogLevel level) const {
+    return internal_logger_->should_log(
+        static_cast<spdlog::level::level_enum>(level));
+  }
+
   template <typename Arg1, typename... Args>
   void log(const LogLevel level, const char* fmt, const Arg1& arg1,
            const Args&... args) const {
@@ -115,6 +115,37 @@ TEST_CASE("logger work as expected", "[logger]") {
   }
 }
 
+TEST_CASE("level-gated logging", "[logger]") {
+  Logger log("logger test");
+  int evaluated = 0;
+  auto argument = [&evaluated]() {
+    ++evaluated;
+    return "argument";
+  };
+
+  SECTION("arguments are not evaluated when the level is disabled") {
+    Logger::level(LogLevel::info);
+    REQUIRE(log.should_log(LogLevel::info));
+    REQUIRE_FALSE(log.should_log(LogLevel::debug));
+    CYNTHIA_DEBUG(log, "this is a {} message", argument());
+    CYNTHIA_TRACE(log, "this is a {} message", argument());
+    REQUIRE(evaluated == 0);
+  }
+
+  SECTION("arguments are evaluated when the level is enabled") {
+    Logger::level(LogLevel::trace);
+    CYNTHIA_DEBUG(log, "this is a {} message", argument());
+    CYNTHIA_TRACE(log, "this is a {} message", argument());
+#ifdef CYNTHIA_DISABLE_TRACING
+    REQUIRE(evaluated == 0);
+#else
+    REQUIRE(evaluated == 2);
+#endif
+  }
+
+  Logger::level(LogLevel::info);
+}
+
 } // namespace Test
 } // namespace utils
 } // namespace cynthia
\ No newline at end of file
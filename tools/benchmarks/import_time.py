@@ -0,0 +1,91 @@
+"""Measure the startup cost of sm1000-test.
+
+Each sample runs in a fresh interpreter, so nothing is cached in
+sys.modules. Reports the median cumulative import time of a module (from
+`python -X importtime`) and the median wall time of a full command, and
+lists the slowest imports of the median sample.
+
+Usage (from tools/benchmarks):
+    python import_time.py
+    python import_time.py --module sm1000_tester.runner -n 50
+    python import_time.py --command "run-single --help"
+"""
+
+import argparse
+import shlex
+import statistics
+import subprocess
+import sys
+import time
+from pathlib import Path
+from typing import Dict, List, Tuple
+
+
+HERE = Path(__file__).resolve().parent
+
+
+def import_profile(module: str) -> Dict[str, Tuple[int, int]]:
+    """Import `module` in a fresh interpreter.
+
+    Returns:
+        (self, cumulative) import time in microseconds per imported module
+    """
+    proc = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {module}"],
+        cwd=HERE,
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    profile = {}
+    for line in proc.stderr.splitlines():
+        if not line.startswith("import time:") or "|" not in line:
+            continue
+        own, cumulative, name = line[len("import time:"):].split("|")
+        if own.strip().isdigit():
+            profile[name.strip()] = (int(own), int(cumulative))
+    return profile
+
+
+def command_time(args: List[str]) -> float:
+    """Wall time in seconds of one sm1000-test invocation."""
+    start = time.perf_counter()
+    subprocess.run(
+        [sys.executable, "-c", "from sm1000_tester import main; main()", *args],
+        cwd=HERE,
+        stdout=subprocess.DEVNULL,
+        stderr=subprocess.DEVNULL,
+    )
+    return time.perf_counter() - start
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--module", default="sm1000_tester.cli", help="Module to import")
+    parser.add_argument("--command", default="--help", help="sm1000-test arguments to time")
+    parser.add_argument("-n", "--samples", type=int, default=20, help="Samples per measurement")
+    parser.add_argument("--top", type=int, default=10, help="Slowest imports to list")
+    args = parser.parse_args()
+
+    profiles = [import_profile(args.module) for _ in range(args.samples)]
+    profiles.sort(key=lambda p: p[args.module][1])
+    median = profiles[len(profiles) // 2]
+    totals = [p[args.module][1] / 1000 for p in profiles]
+    print(
+        f"import {args.module}: median {statistics.median(totals):.1f} ms, "
+        f"min {min(totals):.1f} ms ({args.samples} samples)"
+    )
+    print("slowest imports of the median sample (cumulative ms):")
+    slowest = sorted(median.items(), key=lambda item: item[1][1], reverse=True)
+    for name, (_, cumulative) in slowest[1:args.top + 1]:
+        print(f"  {cumulative / 1000:8.1f}  {name}")
+
+    walls = [command_time(shlex.split(args.command)) * 1000 for _ in range(args.samples)]
+    print(
+        f"sm1000-test {args.command}: median {statistics.median(walls):.1f} ms, "
+        f"min {min(walls):.1f} ms ({args.samples} samples)"
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -6,6 +6,11 @@ tool, including result comparison against expected outputs.
 
 __version__ = "0.1.0"
 
-from sm1000_tester.cli import main
-
 __all__ = ["main"]
+
+
+def main() -> None:
+    """Run the sm1000-test command line (imported lazily to keep startup fast)."""
+    from sm1000_tester.cli import main as cli_main
+
+    cli_main()
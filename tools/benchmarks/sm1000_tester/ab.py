@@ -0,0 +1,217 @@
+"""Interleaved A/B benchmarking of two cynthia-app binaries."""
+
+import random
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from contextlib import nullcontext
+from typing import Dict, List, Optional, Sequence, Tuple
+
+from sm1000_tester.models import ABRun, BenchmarkCase, BenchmarkResult
+from sm1000_tester.runner import CynthiaBenchmark, aggregate_runs
+from sm1000_tester.stats import bootstrap_geomean_ci
+from sm1000_tester.utils import normalize_result, results_match
+
+
+def sequential_verdict(
+    ratios: Sequence[float],
+    confidence: float = 0.99,
+    margin: float = 0.02,
+    min_cases: int = 20,
+) -> str:
+    """Decide whether the geometric-mean ratio so far is settled.
+
+    Args:
+        ratios: Per-case time ratios (candidate / baseline) so far
+        confidence: Confidence level of the bootstrap interval; kept high,
+            since the check is repeated as cases complete
+        margin: Relative difference below which the binaries are considered
+            equivalent
+        min_cases: Never settle on fewer ratios than this
+
+    Returns:
+        'faster' or 'slower' if the interval excludes 1, 'equivalent' if it
+        lies within the margin, 'unsettled' otherwise
+    """
+    if len(ratios) < min_cases:
+        return "unsettled"
+    low, high = bootstrap_geomean_ci(ratios, confidence, resamples=1000)
+    if high < 1:
+        return "faster"
+    if low > 1:
+        return "slower"
+    if low >= 1 / (1 + margin) and high <= 1 + margin:
+        return "equivalent"
+    return "unsettled"
+
+
+class ABBenchmark:
+    """Run a baseline and a candidate binary alternately on each case.
+
+    For every case, the binaries take turns running first (ABBA...), and
+    every other case starts with B, so neither binary systematically pays
+    the cold start of a pair, and drift in temperature or machine load
+    affects both alike. The case's ratio is candidate median over baseline
+    median. Cases are visited in a shuffled (seeded) order, and the stopping
+    rule only looks at the longest run of cases completed in that order: with
+    several jobs, short cases finish first, so the completed cases as such
+    are not a fair sample of the suite.
+    """
+
+    def __init__(
+        self,
+        baseline: CynthiaBenchmark,
+        candidate: CynthiaBenchmark,
+        pairs: int = 3,
+        early_stop: bool = True,
+        confidence: float = 0.99,
+        margin: float = 0.02,
+        min_cases: int = 20,
+        check_every: int = 10,
+        seed: int = 0,
+    ):
+        """Initialize the A/B runner.
+
+        Args:
+            baseline: Runner of binary A; its jobs, timeouts and CPU pinning
+                are used for both binaries
+            candidate: Runner of binary B on the same suite
+            pairs: Number of AB pairs of runs per case
+            early_stop: Stop once sequential_verdict settles
+            confidence: Confidence level of the stopping rule
+            margin: Equivalence margin of the stopping rule
+            min_cases: Smallest number of cases to stop after
+            check_every: Check the stopping rule every this many cases
+            seed: Seed of the case order
+        """
+        self.baseline = baseline
+        self.candidate = candidate
+        self.pairs = max(pairs, 1)
+        self.early_stop = early_stop
+        self.confidence = confidence
+        self.margin = margin
+        self.min_cases = min_cases
+        self.check_every = max(check_every, 1)
+        self.seed = seed
+
+    def run_case(
+        self, case: BenchmarkCase, expected_map: Dict[str, str], lead: int = 0
+    ) -> Tuple[BenchmarkResult, BenchmarkResult]:
+        """Run both binaries on one case, interleaved.
+
+        Args:
+            case: The benchmark case to run
+            expected_map: Expected results keyed by case key
+            lead: Binary that runs first in the first pair (0 for the
+                baseline, 1 for the candidate); the lead then alternates
+
+        Returns:
+            (baseline result, candidate result)
+        """
+        timeout = self.baseline.timeout_policy.budget_for(case.key)
+        pool = self.baseline.cpu_pool
+        with pool.acquire() if pool is not None else nullcontext() as cpu:
+            runs: Tuple[list, list] = ([], [])
+            benches = (self.baseline, self.candidate)
+            for pair in range(self.pairs):
+                first = (lead + pair) % 2
+                for side in (first, 1 - first):
+                    runs[side].append(
+                        benches[side].run_cynthia(
+                            case.formula_file, case.partition_file, timeout, cpu
+                        )
+                    )
+                if any(
+                    normalize_result(series[-1].outcome) not in ("realizable", "unrealizable")
+                    for series in runs
+                ):
+                    break
+
+        expected = expected_map.get(case.key, "Unknown")
+        results = []
+        for series in runs:
+            measurement = aggregate_runs(series)
+            results.append(BenchmarkResult(
+                folder=case.folder,
+                filename=case.filename,
+                expected=expected,
+                actual=measurement.outcome,
+                matched=results_match(expected, measurement.outcome),
+                duration=measurement.duration,
+                peak_rss=measurement.peak_rss,
+                user_time=measurement.user_time,
+                sys_time=measurement.sys_time,
+                timeout=timeout,
+                samples=measurement.samples,
+                cpu=cpu,
+                internal_time=measurement.internal_time,
+                explored_states=measurement.explored_states,
+            ))
+        return results[0], results[1]
+
+    def run(self, progress_callback=None) -> ABRun:
+        """Run the suite until it is exhausted or the comparison is settled.
+
+        Args:
+            progress_callback: Called with (cases done, verdict so far) after
+                each case
+
+        Returns:
+            ABRun with the paired results in canonical case order
+        """
+        expected_map = self.baseline.load_expected_map()
+        cases = self.baseline.collect_cases()
+        order = list(range(len(cases)))
+        random.Random(self.seed).shuffle(order)
+
+        pairs: Dict[int, Tuple[BenchmarkResult, BenchmarkResult]] = {}
+        ratios: List[float] = []
+        # Cases of the shuffled order completed without a gap; only they are
+        # an unbiased sample to stop on
+        prefix = 0
+        checked = 0
+        verdict = "unsettled"
+        stopped_early = False
+        with ThreadPoolExecutor(max_workers=self.baseline.jobs) as executor:
+            futures = {
+                executor.submit(self.run_case, cases[index], expected_map, position % 2): index
+                for position, index in enumerate(order)
+            }
+            try:
+                for future in as_completed(futures):
+                    pairs[futures[future]] = future.result()
+                    while prefix < len(order) and order[prefix] in pairs:
+                        ratio = _paired_ratio(*pairs[order[prefix]])
+                        if ratio is not None:
+                            ratios.append(ratio)
+                        prefix += 1
+                    if prefix - checked >= self.check_every or prefix == len(cases):
+                        checked = prefix
+                        verdict = sequential_verdict(
+                            ratios, self.confidence, self.margin, self.min_cases
+                        )
+                    if progress_callback is not None:
+                        progress_callback(len(pairs), verdict)
+                    if self.early_stop and verdict != "unsettled" and prefix < len(cases):
+                        stopped_early = True
+                        break
+            finally:
+                # Drop queued cases; running ones finish on their own
+                for future in futures:
+                    future.cancel()
+
+        # Report on the sample the verdict was reached on
+        done = sorted(order[:prefix]) if stopped_early else sorted(pairs)
+        return ABRun(
+            baseline=[pairs[i][0] for i in done],
+            candidate=[pairs[i][1] for i in done],
+            verdict=verdict,
+            stopped_early=stopped_early,
+            total_cases=len(cases),
+        )
+
+
+def _paired_ratio(base: BenchmarkResult, cand: BenchmarkResult) -> Optional[float]:
+    """Candidate over baseline time, if both reached a verdict."""
+    conclusive = ("realizable", "unrealizable")
+    if normalize_result(base.actual) not in conclusive or normalize_result(cand.actual) not in conclusive:
+        return None
+    return max(cand.duration, 0.001) / max(base.duration, 0.001)
@@ -0,0 +1,89 @@
+"""Pinning of cynthia-app processes to dedicated CPUs (Linux only)."""
+
+import os
+import queue
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Iterator, List, Set
+
+import typer
+
+
+SYSFS_CPU = Path("/sys/devices/system/cpu")
+
+
+def pinning_supported() -> bool:
+    """Check whether the platform can set the CPU affinity of a process."""
+    return hasattr(os, "sched_setaffinity")
+
+
+def smt_siblings(cpu: int) -> Set[int]:
+    """Hardware threads sharing a core with `cpu`, including itself.
+
+    Reads /sys/devices/system/cpu/cpuN/topology/thread_siblings_list
+    (e.g. '0,64' or '0-1'); falls back to `{cpu}` when it is unavailable.
+    """
+    path = SYSFS_CPU / f"cpu{cpu}" / "topology" / "thread_siblings_list"
+    try:
+        text = path.read_text().strip()
+    except OSError:
+        return {cpu}
+
+    siblings = set()
+    for part in text.split(","):
+        first, _, last = part.partition("-")
+        siblings.update(range(int(first), int(last or first) + 1))
+    return siblings
+
+
+def select_cpus(no_smt_siblings: bool = False) -> List[int]:
+    """List the CPUs that cases may be pinned to.
+
+    Args:
+        no_smt_siblings: Use one hardware thread per physical core, so that
+            no two cases share a core's execution units and L1/L2 caches
+
+    Returns:
+        CPUs available to this process, in increasing order
+    """
+    available = sorted(os.sched_getaffinity(0))
+    if not no_smt_siblings:
+        return available
+
+    selected, taken = [], set()
+    for cpu in available:
+        if cpu not in taken:
+            selected.append(cpu)
+            taken |= smt_siblings(cpu)
+    return selected
+
+
+class CpuPool:
+    """Hand out each CPU to at most one running case at a time."""
+
+    def __init__(self, cpus: List[int]):
+        """Initialize the pool.
+
+        Args:
+            cpus: CPUs to hand out
+
+        Raises:
+            typer.BadParameter: If pinning is unsupported or `cpus` is empty
+        """
+        if not pinning_supported():
+            raise typer.BadParameter("CPU pinning requires os.sched_setaffinity (Linux)")
+        if not cpus:
+            raise typer.BadParameter("No CPUs available for pinning")
+        self.cpus = list(cpus)
+        self._free: "queue.Queue[int]" = queue.Queue()
+        for cpu in self.cpus:
+            self._free.put(cpu)
+
+    @contextmanager
+    def acquire(self) -> Iterator[int]:
+        """Take a free CPU for the duration of the block, waiting if needed."""
+        cpu = self._free.get()
+        try:
+            yield cpu
+        finally:
+            self._free.put(cpu)
@@ -0,0 +1,153 @@
+"""Content-addressed cache of benchmark case results."""
+
+import hashlib
+import json
+import sqlite3
+import threading
+from pathlib import Path
+from typing import Optional, Sequence
+
+from sm1000_tester.models import BenchmarkCase, RunMeasurement
+from sm1000_tester.utils import file_sha256, get_project_root, normalize_result
+
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS results (
+    key TEXT PRIMARY KEY,
+    outcome TEXT NOT NULL,
+    duration REAL NOT NULL,
+    peak_rss INTEGER NOT NULL,
+    user_time REAL NOT NULL,
+    sys_time REAL NOT NULL,
+    internal_time REAL,
+    explored_states INTEGER,
+    samples TEXT,
+    warmup INTEGER NOT NULL DEFAULT 0
+);
+"""
+
+# Columns added after the first schema version, created on older caches
+RESULT_COLUMNS = {
+    "internal_time": "REAL",
+    "explored_states": "INTEGER",
+    "samples": "TEXT",
+    "warmup": "INTEGER NOT NULL DEFAULT 0",
+}
+
+
+def default_cache_path() -> Path:
+    """Get the default location of the result cache."""
+    return get_project_root() / "tools" / "benchmarks" / ".results" / "cache.sqlite"
+
+
+class ResultCache:
+    """Reuse results of cases whose inputs have not changed.
+
+    Entries are keyed by a hash of the cynthia-app binary, the formula file,
+    the partition file and the command-line flags, so any change to one of
+    them is a miss. Only conclusive outcomes (realizable or unrealizable) are
+    stored: timeouts and errors depend on the machine and the budget. Each
+    entry keeps its wall-time samples and number of warmup runs, and only
+    serves requests for at most as many of each (see get), so a result of
+    one run is not passed off as the median of --repeat runs.
+    """
+
+    def __init__(self, app_path: Path, cache_path: Optional[Path] = None):
+        """Open (and create if needed) the cache database.
+
+        Args:
+            app_path: Path to the cynthia-app binary whose results are cached
+            cache_path: Path to the SQLite file; defaults to default_cache_path()
+        """
+        self.cache_path = Path(cache_path) if cache_path else default_cache_path()
+        self.cache_path.parent.mkdir(parents=True, exist_ok=True)
+        self.app_hash = file_sha256(app_path)
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(self.cache_path, check_same_thread=False)
+        self._conn.executescript(SCHEMA)
+        existing = {row[1] for row in self._conn.execute("PRAGMA table_info(results)")}
+        for name, declaration in RESULT_COLUMNS.items():
+            if name not in existing:
+                self._conn.execute(f"ALTER TABLE results ADD COLUMN {name} {declaration}")
+
+    def key_for(self, case: BenchmarkCase, flags: Sequence[str]) -> str:
+        """Compute the cache key of a case run with the given flags."""
+        digest = hashlib.sha256()
+        digest.update(self.app_hash.encode())
+        digest.update(file_sha256(case.formula_file).encode())
+        digest.update(file_sha256(case.partition_file).encode())
+        digest.update(json.dumps(list(flags)).encode())
+        return digest.hexdigest()
+
+    def get(self, key: str, repeat: int = 1, warmup: int = 0) -> Optional[RunMeasurement]:
+        """Look up a cached measurement.
+
+        Args:
+            key: Cache key of the case (see key_for)
+            repeat: Measured runs the caller would make
+            warmup: Warmup runs the caller would make first
+
+        Returns:
+            The measurement, or None on a miss or if it was made with fewer
+            measured or warmup runs than requested
+        """
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT outcome, duration, peak_rss, user_time, sys_time, "
+                "internal_time, explored_states, samples, warmup FROM results WHERE key = ?",
+                (key,),
+            ).fetchone()
+        if row is None:
+            return None
+        (
+            outcome, duration, peak_rss, user_time, sys_time,
+            internal_time, explored_states, samples, cached_warmup,
+        ) = row
+        # Entries from before samples were stored come from a single run
+        samples = json.loads(samples) if samples else [duration]
+        if len(samples) < repeat or cached_warmup < warmup:
+            return None
+        return RunMeasurement(
+            outcome=outcome,
+            duration=duration,
+            peak_rss=peak_rss,
+            user_time=user_time,
+            sys_time=sys_time,
+            samples=samples,
+            internal_time=internal_time,
+            explored_states=explored_states,
+        )
+
+    def put(self, key: str, measurement: RunMeasurement, warmup: int = 0) -> None:
+        """Store a measurement if its outcome is conclusive.
+
+        Args:
+            key: Cache key of the case (see key_for)
+            measurement: Aggregated measurement, with its samples
+            warmup: Warmup runs made before the measured ones
+        """
+        if normalize_result(measurement.outcome) not in ("realizable", "unrealizable"):
+            return
+        with self._lock, self._conn:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO results "
+                "(key, outcome, duration, peak_rss, user_time, sys_time, "
+                "internal_time, explored_states, samples, warmup) "
+                "VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)",
+                (
+                    key,
+                    measurement.outcome,
+                    measurement.duration,
+                    measurement.peak_rss,
+                    measurement.user_time,
+                    measurement.sys_time,
+                    measurement.internal_time,
+                    measurement.explored_states,
+                    json.dumps(measurement.samples or [measurement.duration]),
+                    warmup,
+                ),
+            )
+
+    def close(self) -> None:
+        """Close the underlying database connection."""
+        self._conn.close()
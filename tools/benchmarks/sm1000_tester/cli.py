@@ -1,17 +1,23 @@
-"""Command-line interface for SMV 1000 benchmark testing."""
+"""Command-line interface for SMV 1000 benchmark testing.
+
+Imports of modules that only some commands need (the runner, the SQLite
+stores, rich tables and progress bars, ...) are deferred to those commands,
+which keeps the startup of quick commands such as run-single short.
+"""
 
 from pathlib import Path
-from typing import Optional
+from typing import List, Optional
 
 import typer
 from rich.console import Console
-from rich.panel import Panel
-
-from sm1000_tester.models import BenchmarkResult
-from sm1000_tester.ui.report import ReportGenerator
-from sm1000_tester.runner import CynthiaBenchmark
-from sm1000_tester.utils import format_path_display, get_project_root
 
+from sm1000_tester.limits import MemoryLimit, parse_size
+from sm1000_tester.models import BenchmarkResult, split_case_key
+from sm1000_tester.results_log import ResultLog
+from sm1000_tester.scheduler import Schedule
+from sm1000_tester.suite import discover_cases, find_manifest, load_manifest
+from sm1000_tester.timeouts import TimeoutPolicy
+from sm1000_tester.utils import DEFAULT_PORT, format_path_display, get_project_root
 
 app = typer.Typer(
     name="sm1000-test",
@@ -22,6 +28,15 @@ app = typer.Typer(
 console = Console()
 
 
+def memory_limit_from(mem_limit: Optional[str], mem_cgroup: Optional[Path]) -> Optional[MemoryLimit]:
+    """Build the memory limit of the --mem-limit and --mem-cgroup options."""
+    if mem_limit is None:
+        if mem_cgroup is not None:
+            raise typer.BadParameter("--mem-cgroup requires --mem-limit")
+        return None
+    return MemoryLimit(parse_size(mem_limit), mem_cgroup)
+
+
 @app.command()
 def smv1000(
     ctx: typer.Context,
@@ -43,7 +58,14 @@ def smv1000(
         None,
         "--benchmark-dir",
         "-b",
-        help="Path to SMV 1000 benchmark directory",
+        help="Path to SMV 1000 benchmark directory, or any tree of .ltlf/.part pairs",
+    ),
+    manifest: Optional[Path] = typer.Option(
+        None,
+        "--manifest",
+        "-m",
+        help="CSV of expected results (Folder,Filename,Result); defaults to results.csv in the benchmark directory",
+        dir_okay=False,
     ),
     verbose: bool = typer.Option(
         False,
@@ -61,13 +83,165 @@ def smv1000(
         "--show-paths",
         help="Display .ltlf and .part file paths for each failed test case",
     ),
+    jobs: int = typer.Option(
+        1,
+        "--jobs",
+        "-j",
+        help="Number of test cases to run concurrently (0 = one per CPU)",
+        min=0,
+    ),
+    db_path: Optional[Path] = typer.Option(
+        None,
+        "--db",
+        help="Path to the results history database",
+        dir_okay=False,
+    ),
+    no_record: bool = typer.Option(
+        False,
+        "--no-record",
+        help="Do not store this run in the results history database",
+    ),
+    use_cache: bool = typer.Option(
+        False,
+        "--cache",
+        help="Reuse results of cases whose binary, inputs and flags are unchanged",
+    ),
+    cache_path: Optional[Path] = typer.Option(
+        None,
+        "--cache-path",
+        help="Path to the result cache database",
+        dir_okay=False,
+    ),
+    timeout: float = typer.Option(
+        60.0,
+        "--timeout",
+        "-t",
+        help="Per-case timeout in seconds",
+        min=0.1,
+    ),
+    adaptive_timeout: bool = typer.Option(
+        False,
+        "--adaptive-timeout",
+        help="Derive each case's timeout from its recorded durations in the history database",
+    ),
+    timeout_factor: float = typer.Option(
+        5.0,
+        "--timeout-factor",
+        help="Adaptive timeout: multiple of the case's historical p95 duration",
+        min=1.0,
+    ),
+    timeout_floor: float = typer.Option(
+        1.0,
+        "--timeout-floor",
+        help="Adaptive timeout: smallest per-case budget in seconds",
+        min=0.1,
+    ),
+    timeout_ceiling: Optional[float] = typer.Option(
+        None,
+        "--timeout-ceiling",
+        help="Adaptive timeout: largest per-case budget in seconds (default: --timeout)",
+        min=0.1,
+    ),
+    schedule: Schedule = typer.Option(
+        Schedule.fixed,
+        "--schedule",
+        help="Case start order: canonical, or longest expected duration first from history",
+        case_sensitive=False,
+    ),
+    repeat: int = typer.Option(
+        1,
+        "--repeat",
+        "-r",
+        help="Number of measured runs per case; the median is reported",
+        min=1,
+    ),
+    warmup: int = typer.Option(
+        0,
+        "--warmup",
+        "-w",
+        help="Number of discarded runs per case before measuring",
+        min=0,
+    ),
+    max_cv: float = typer.Option(
+        0.10,
+        "--max-cv",
+        help="Mark repeated timings with a coefficient of variation above this as unreliable",
+        min=0.0,
+    ),
+    log_path: Optional[Path] = typer.Option(
+        None,
+        "--log",
+        help="Stream each result to this JSONL file as soon as it completes",
+        dir_okay=False,
+    ),
+    resume: bool = typer.Option(
+        False,
+        "--resume",
+        help="Skip cases already recorded in the --log file",
+    ),
+    force: bool = typer.Option(
+        False,
+        "--force",
+        help="With --resume, accept a --log written by another binary or with other flags",
+    ),
+    shard: Optional[str] = typer.Option(
+        None,
+        "--shard",
+        help="Only run shard i of N (e.g. 2/4); combine the shards' --log files with merge",
+        metavar="i/N",
+    ),
+    shard_history: Optional[Path] = typer.Option(
+        None,
+        "--shard-history",
+        help="JSONL result log of an earlier run to balance shards by recorded durations",
+        exists=True,
+        dir_okay=False,
+    ),
+    pin_cpus: bool = typer.Option(
+        False,
+        "--pin-cpus",
+        help="Pin each running case to a dedicated CPU (Linux); caps --jobs at the CPU count",
+    ),
+    no_smt_siblings: bool = typer.Option(
+        False,
+        "--no-smt-siblings",
+        help="With --pin-cpus, use one hardware thread per core and leave SMT siblings idle",
+    ),
+    mem_limit: Optional[str] = typer.Option(
+        None,
+        "--mem-limit",
+        help="Memory limit of each cynthia-app process (e.g. 4G); runs exceeding it are MemOut",
+        metavar="SIZE",
+    ),
+    mem_cgroup: Optional[Path] = typer.Option(
+        None,
+        "--mem-cgroup",
+        help="Delegated cgroup v2 directory to enforce --mem-limit in, in addition to RLIMIT_AS",
+        file_okay=False,
+    ),
+    dashboard: bool = typer.Option(
+        False,
+        "--dashboard",
+        help="Show each worker's case, the throughput and cases running past their recorded p99",
+    ),
 ):
     """Run the SMV 1000 benchmark suite and compare with expected results.
 
     The SMV 1000 benchmark consists of 1000 LTLf formulas split across
     bench1/ and bench2/ directories. This script runs Cynthia on each
     formula and compares the result with the expected output.
+
+    With --benchmark-dir, any directory tree of .ltlf/.part pairs can be run
+    the same way; expected results are read from --manifest.
     """
+    from rich.panel import Panel
+
+    from sm1000_tester.cache import ResultCache
+    from sm1000_tester.history import ResultStore
+    from sm1000_tester.runner import CynthiaBenchmark
+    from sm1000_tester.scheduler import LongestFirstScheduler, parse_shard
+    from sm1000_tester.ui.report import ReportGenerator
+
     # Handle help flag
     if help_flag:
         typer.echo(ctx.get_help())
@@ -81,28 +255,88 @@ def smv1000(
     # Use provided paths or defaults
     app_path = app_path or default_app_path
     benchmark_dir = benchmark_dir or default_benchmark_dir
-    csv_path = benchmark_dir / "results.csv"
+    csv_path = find_manifest(benchmark_dir, manifest) or "(none)"
+    is_smv1000 = benchmark_dir.resolve() == default_benchmark_dir.resolve()
+    suite_name = "SMV 1000" if is_smv1000 else benchmark_dir.name
 
     # Format paths with tabs for alignment
     max_label_len = max(len("App:"), len("Benchmark:"), len("CSV:"))
 
     console.print(Panel(
-        f"[bold cyan]SMV 1000 Benchmark Test[/bold cyan]\n"
+        f"[bold cyan]{suite_name} Benchmark Test[/bold cyan]\n"
         f"{format_path_display('App:', app_path, max_label_len)}\n"
         f"{format_path_display('Benchmark:', benchmark_dir, max_label_len)}\n"
         f"{format_path_display('CSV:', csv_path, max_label_len)}",
         border_style="cyan",
     ))
 
+    if resume and log_path is None:
+        console.print("[red]Error: --resume requires --log[/red]")
+        raise typer.Exit(1)
+    if force and not resume:
+        console.print("[red]Error: --force requires --resume[/red]")
+        raise typer.Exit(1)
+    if no_smt_siblings and not pin_cpus:
+        console.print("[red]Error: --no-smt-siblings requires --pin-cpus[/red]")
+        raise typer.Exit(1)
+
     try:
+        shard_spec = parse_shard(shard) if shard is not None else None
+        memory_limit = memory_limit_from(mem_limit, mem_cgroup)
+        result_log = ResultLog(log_path) if log_path is not None else None
+
+        cache = None
+        if use_cache and app_path.exists():
+            cache = ResultCache(app_path, cache_path)
+
+        duration_history = {}
+        if adaptive_timeout or dashboard or schedule == Schedule.longest_first:
+            duration_history = ResultStore(db_path).duration_history()
+
+        timeout_policy = TimeoutPolicy(default=timeout)
+        if adaptive_timeout:
+            timeout_policy = TimeoutPolicy(
+                default=timeout,
+                history=duration_history,
+                factor=timeout_factor,
+                floor=timeout_floor,
+                ceiling=timeout_ceiling,
+            )
+            if not timeout_policy.adaptive:
+                console.print("[yellow]No recorded durations; using --timeout for all cases[/yellow]")
+
         bench = CynthiaBenchmark(
             app_path=app_path,
             benchmark_dir=benchmark_dir,
             verbose=verbose,
             all_failures=all_failures,
             show_paths=show_paths,
+            jobs=jobs,
+            cache=cache,
+            manifest=manifest,
+            repeat=repeat,
+            warmup=warmup,
+            result_log=result_log,
+            resume=resume,
+            force_resume=force,
+            shard=shard_spec,
+            pin_cpus=pin_cpus,
+            no_smt_siblings=no_smt_siblings,
+            memory_limit=memory_limit,
+            dashboard=dashboard,
+            duration_history=duration_history,
+            shard_history=(
+                ResultLog(shard_history).duration_history() if shard_history is not None else None
+            ),
+            timeout_policy=timeout_policy,
+            scheduler=(
+                LongestFirstScheduler(duration_history)
+                if schedule == Schedule.longest_first else None
+            ),
         )
-        results = bench.run_smv1000()
+        results = bench.run_suite()
+        if cache is not None:
+            cache.close()
 
         # Generate and display report
         report_gen = ReportGenerator(
@@ -111,19 +345,977 @@ def smv1000(
             verbose=verbose,
             all_failures=all_failures,
             show_paths=show_paths,
+            suite_name=suite_name,
+            max_cv=max_cv,
         )
         report_gen.print_summary(results)
 
+        if not no_record and results:
+            store = ResultStore(db_path)
+            run_id = store.record_run(results, app_path, bench.app_flags)
+            console.print(f"[dim]Recorded as run {run_id} in {store.db_path}[/dim]")
+
+    except typer.BadParameter as e:
+        console.print(f"[red]Error: {e}[/red]")
+        raise typer.Exit(1)
+
+
+app.command(
+    name="suite",
+    help="Run every .ltlf/.part pair under --benchmark-dir and compare with --manifest. "
+    "Takes the same options as smv1000.",
+)(smv1000)
+
+
+@app.command()
+def history(
+    test_case: Optional[str] = typer.Option(
+        None,
+        "--case",
+        "-c",
+        help="Show the history of a single test case (e.g., 'bench1/f7')",
+    ),
+    limit: int = typer.Option(
+        20,
+        "--limit",
+        "-n",
+        help="Maximum number of runs to display",
+        min=1,
+    ),
+    db_path: Optional[Path] = typer.Option(
+        None,
+        "--db",
+        help="Path to the results history database",
+        dir_okay=False,
+    ),
+):
+    """Query the results history database.
+
+    Without --case, lists the most recent runs with their binary hash, flags,
+    host and pass rate. With --case, shows that case across runs.
+
+    Example: sm1000-test history --case bench1/f7
+    """
+    from sm1000_tester.history import ResultStore
+    from sm1000_tester.ui.report import ReportGenerator
+
+    store = ResultStore(db_path)
+    report_gen = ReportGenerator(
+        console=console,
+        benchmark_dir=get_project_root() / "benchmarks" / "sm1000",
+    )
+
+    if test_case is None:
+        report_gen.print_run_history(store.list_runs(limit))
+        return
+
+    folder, filename = split_case_key(test_case)
+    if not filename:
+        console.print(
+            f"[red]Error: Invalid test case format: '{test_case}'. "
+            f"Expected format: 'bench1/f7'[/red]"
+        )
+        raise typer.Exit(1)
+    report_gen.print_case_history(test_case, store.case_history(folder, filename, limit=limit))
+
+
+@app.command()
+def compare(
+    baseline: str = typer.Argument(
+        ...,
+        help="Baseline result set: run id, 'latest', 'previous' or a JSONL result log",
+    ),
+    candidate: str = typer.Argument(
+        "latest",
+        help="Candidate result set: run id, 'latest', 'previous' or a JSONL result log",
+    ),
+    max_slowdown: float = typer.Option(
+        1.10,
+        "--max-slowdown",
+        help="Fail when the geometric-mean time ratio exceeds this significantly",
+        min=1.0,
+    ),
+    alpha: float = typer.Option(
+        0.05,
+        "--alpha",
+        help="Significance level of the Wilcoxon signed-rank test",
+        min=0.0,
+        max=1.0,
+    ),
+    allow_new_timeouts: bool = typer.Option(
+        False,
+        "--allow-new-timeouts",
+        help="Do not fail when cases time out only in the candidate",
+    ),
+    min_duration: float = typer.Option(
+        0.001,
+        "--min-duration",
+        help="Clamp durations to at least this many seconds before computing ratios",
+        min=0.0,
+    ),
+    top: int = typer.Option(
+        10,
+        "--top",
+        help="Number of largest slowdowns and speedups to list",
+        min=0,
+    ),
+    db_path: Optional[Path] = typer.Option(
+        None,
+        "--db",
+        help="Path to the results history database",
+        dir_okay=False,
+    ),
+):
+    """Compare the timings of two result sets and detect regressions.
+
+    Reports the geometric-mean time ratio (candidate / baseline) with a
+    bootstrap confidence interval, a Wilcoxon signed-rank p-value, and cases
+    that newly time out. Exits with code 1 on a significant slowdown beyond
+    --max-slowdown or on new timeouts.
+
+    Example: sm1000-test compare 12 latest --max-slowdown 1.05
+    """
+    from sm1000_tester.compare import compare_results, is_regression, load_result_set
+    from sm1000_tester.history import ResultStore
+    from sm1000_tester.ui.report import ReportGenerator
+
+    store = ResultStore(db_path)
+    try:
+        baseline_results = load_result_set(baseline, store)
+        candidate_results = load_result_set(candidate, store)
     except typer.BadParameter as e:
         console.print(f"[red]Error: {e}[/red]")
         raise typer.Exit(1)
 
+    comparison = compare_results(baseline_results, candidate_results, min_duration)
+
+    report_gen = ReportGenerator(
+        console=console,
+        benchmark_dir=get_project_root() / "benchmarks" / "sm1000",
+    )
+    report_gen.print_comparison(comparison, top=top)
+
+    failed = False
+    if is_regression(comparison, max_slowdown, alpha):
+        console.print(
+            f"[red]Regression: geometric-mean time ratio {comparison.geomean_ratio:.3f}x "
+            f"exceeds {max_slowdown:.3f}x (p={comparison.p_value:.4f})[/red]"
+        )
+        failed = True
+    if comparison.new_timeouts and not allow_new_timeouts:
+        console.print(f"[red]{len(comparison.new_timeouts)} case(s) newly time out[/red]")
+        failed = True
+    if failed:
+        raise typer.Exit(1)
+
+
+@app.command()
+def report(
+    runs: Optional[List[str]] = typer.Argument(
+        None,
+        help="Result sets to plot: run ids, 'latest', 'previous' or JSONL result logs (default: latest)",
+    ),
+    output: Path = typer.Option(
+        Path("report.html"),
+        "--output",
+        "-o",
+        help="HTML file to write",
+        dir_okay=False,
+    ),
+    title: str = typer.Option(
+        "Cynthia Benchmark Report",
+        "--title",
+        help="Title of the report",
+    ),
+    db_path: Optional[Path] = typer.Option(
+        None,
+        "--db",
+        help="Path to the results history database",
+        dir_okay=False,
+    ),
+):
+    """Write cactus, survival, per-folder and scatter plots as one HTML file.
+
+    The report is static HTML with inline SVG (no scripts, no network), so
+    it can be archived as a CI artifact. With two or more result sets, the
+    first two are also plotted against each other case by case.
+
+    Example: sm1000-test report previous latest -o report.html
+    """
+    from sm1000_tester.compare import load_result_set
+    from sm1000_tester.history import ResultStore
+    from sm1000_tester.ui.html import HtmlReport
+
+    store = ResultStore(db_path)
+    specs = runs or ["latest"]
+    result_sets = {}
+    try:
+        for spec in specs:
+            label = Path(spec).name if spec.endswith(".jsonl") else spec
+            if label in result_sets:
+                label = f"{label} ({len(result_sets) + 1})"
+            result_sets[label] = load_result_set(spec, store)
+    except typer.BadParameter as e:
+        console.print(f"[red]Error: {e}[/red]")
+        raise typer.Exit(1)
+
+    HtmlReport(title).write(output, result_sets)
+    console.print(f"[green]Report written to {output}[/green]")
+
+
+@app.command()
+def ab(
+    app_paths: List[Path] = typer.Option(
+        ...,
+        "--app-path",
+        "-a",
+        help="cynthia-app binary; give exactly two: the baseline (A), then the candidate (B)",
+        dir_okay=False,
+    ),
+    benchmark_dir: Optional[Path] = typer.Option(
+        None,
+        "--benchmark-dir",
+        "-b",
+        help="Root directory of the suite (default: benchmarks/sm1000)",
+    ),
+    manifest: Optional[Path] = typer.Option(
+        None,
+        "--manifest",
+        "-m",
+        help="CSV of expected results (default: <benchmark-dir>/results.csv)",
+        dir_okay=False,
+    ),
+    pairs: int = typer.Option(
+        3,
+        "--pairs",
+        help="Number of AB pairs of runs per case",
+        min=1,
+    ),
+    jobs: int = typer.Option(
+        1,
+        "--jobs",
+        "-j",
+        help="Number of cases to run concurrently (0 = one per CPU)",
+        min=0,
+    ),
+    timeout: float = typer.Option(
+        60.0,
+        "--timeout",
+        "-t",
+        help="Per-run timeout in seconds",
+        min=0.1,
+    ),
+    early_stop: bool = typer.Option(
+        True,
+        "--early-stop/--no-early-stop",
+        help="Stop as soon as the speedup is statistically settled",
+    ),
+    confidence: float = typer.Option(
+        0.99,
+        "--confidence",
+        help="Confidence level of the bootstrap interval used to stop and report",
+        min=0.5,
+        max=0.9999,
+    ),
+    margin: float = typer.Option(
+        0.02,
+        "--margin",
+        help="Relative difference below which the binaries count as equivalent",
+        min=0.0,
+    ),
+    min_cases: int = typer.Option(
+        20,
+        "--min-cases",
+        help="Smallest number of cases before stopping early",
+        min=1,
+    ),
+    check_every: int = typer.Option(
+        10,
+        "--check-every",
+        help="Check whether the difference is settled every this many cases",
+        min=1,
+    ),
+    seed: int = typer.Option(
+        0,
+        "--seed",
+        help="Seed of the shuffled case order",
+    ),
+    top: int = typer.Option(
+        10,
+        "--top",
+        help="Number of largest slowdowns and speedups to list",
+        min=0,
+    ),
+    pin_cpus: bool = typer.Option(
+        False,
+        "--pin-cpus",
+        help="Pin each running case to a dedicated CPU (Linux); caps --jobs at the CPU count",
+    ),
+):
+    """Compare two cynthia-app binaries with interleaved runs on the same cases.
+
+    Each case is run ABBA... with both binaries, so neither always runs
+    first and drift in temperature or load affects both alike. Cases are
+    visited in a shuffled order, and by
+    default the run stops once the bootstrap interval of the geometric-mean
+    time ratio (B / A) excludes 1, or lies within --margin of it.
+
+    Example: sm1000-test ab -a build-main/cynthia-app -a build/cynthia-app -j 8
+    """
+    from rich.progress import BarColumn, Progress, TextColumn, TimeRemainingColumn
+
+    from sm1000_tester.ab import ABBenchmark
+    from sm1000_tester.compare import compare_results
+    from sm1000_tester.runner import CynthiaBenchmark
+    from sm1000_tester.ui.report import ReportGenerator
+
+    if len(app_paths) != 2:
+        console.print("[red]Error: give exactly two --app-path options (baseline, candidate)[/red]")
+        raise typer.Exit(1)
+
+    project_root = get_project_root()
+    benchmark_dir = benchmark_dir or project_root / "benchmarks" / "sm1000"
+
+    try:
+        baseline, candidate = (
+            CynthiaBenchmark(
+                app_path=app_path,
+                benchmark_dir=benchmark_dir,
+                jobs=jobs,
+                manifest=manifest,
+                timeout_policy=TimeoutPolicy(default=timeout),
+                pin_cpus=pin_cpus and app_path == app_paths[0],
+            )
+            for app_path in app_paths
+        )
+        runner = ABBenchmark(
+            baseline,
+            candidate,
+            pairs=pairs,
+            early_stop=early_stop,
+            confidence=confidence,
+            margin=margin,
+            min_cases=min_cases,
+            check_every=check_every,
+            seed=seed,
+        )
+
+        with Progress(
+            TextColumn("[progress.description]{task.description}"),
+            BarColumn(),
+            TextColumn("{task.completed}/{task.total}"),
+            TimeRemainingColumn(),
+            console=console,
+        ) as progress:
+            task = progress.add_task("[cyan]A/B (unsettled)...", total=None)
+
+            def on_case(done: int, verdict: str) -> None:
+                progress.update(
+                    task, completed=done, description=f"[cyan]A/B ({verdict})..."
+                )
+
+            progress.update(task, total=len(baseline.collect_cases()))
+            result = runner.run(on_case)
+    except typer.BadParameter as e:
+        console.print(f"[red]Error: {e}[/red]")
+        raise typer.Exit(1)
+
+    comparison = compare_results(result.baseline, result.candidate, confidence=confidence)
+    report_gen = ReportGenerator(console=console, benchmark_dir=benchmark_dir)
+    report_gen.print_comparison(comparison, top=top)
+
+    verdicts = {
+        "faster": "[green]B is faster than A[/green]",
+        "slower": "[red]B is slower than A[/red]",
+        "equivalent": f"B and A are equivalent within {margin:.0%}",
+        "unsettled": "[yellow]No settled difference[/yellow]",
+    }
+    stopped = " (stopped early)" if result.stopped_early else ""
+    console.print()
+    console.print(
+        f"{verdicts[result.verdict]}: {comparison.geomean_ratio:.3f}x "
+        f"after {len(result.baseline)} of {result.total_cases} cases{stopped}"
+    )
+    if app_paths[0].resolve() == app_paths[1].resolve() and comparison.cases:
+        # A/A run: any difference is a bias of the measurement itself
+        if comparison.ci_low <= 1.0 <= comparison.ci_high:
+            console.print(
+                f"[green]A/A check passed: the {comparison.confidence:.0%} interval "
+                f"[{comparison.ci_low:.3f}, {comparison.ci_high:.3f}] contains 1[/green]"
+            )
+        else:
+            console.print(
+                f"[red]A/A check failed: the {comparison.confidence:.0%} interval "
+                f"[{comparison.ci_low:.3f}, {comparison.ci_high:.3f}] excludes 1; "
+                f"the measurements are biased[/red]"
+            )
+
+
+@app.command()
+def sweep(
+    axes: List[str] = typer.Option(
+        ...,
+        "--axis",
+        "-x",
+        help="Comma-separated flag alternatives, e.g. --axis=',-g'; repeat for a cartesian product",
+    ),
+    app_path: Optional[Path] = typer.Option(
+        None,
+        "--app-path",
+        "-a",
+        help="Path to cynthia-app executable",
+        dir_okay=False,
+    ),
+    benchmark_dir: Optional[Path] = typer.Option(
+        None,
+        "--benchmark-dir",
+        "-b",
+        help="Root directory of the suite (default: benchmarks/sm1000)",
+    ),
+    manifest: Optional[Path] = typer.Option(
+        None,
+        "--manifest",
+        "-m",
+        help="CSV of expected results (default: <benchmark-dir>/results.csv)",
+        dir_okay=False,
+    ),
+    jobs: int = typer.Option(
+        1,
+        "--jobs",
+        "-j",
+        help="Number of cases to run concurrently (0 = one per CPU)",
+        min=0,
+    ),
+    timeout: float = typer.Option(
+        60.0,
+        "--timeout",
+        "-t",
+        help="Per-run timeout in seconds",
+        min=0.1,
+    ),
+    repeat: int = typer.Option(
+        1,
+        "--repeat",
+        "-r",
+        help="Number of measured runs per case and configuration; the median is reported",
+        min=1,
+    ),
+    use_cache: bool = typer.Option(
+        False,
+        "--cache",
+        help="Reuse results of cases whose binary, inputs and flags are unchanged",
+    ),
+    pin_cpus: bool = typer.Option(
+        False,
+        "--pin-cpus",
+        help="Pin each running case to a dedicated CPU (Linux); caps --jobs at the CPU count",
+    ),
+    top: int = typer.Option(
+        10,
+        "--top",
+        help="Number of cases with the largest gain over the first configuration to list",
+        min=0,
+    ),
+    csv_path: Optional[Path] = typer.Option(
+        None,
+        "--csv",
+        help="Write every case's time per configuration and its best configuration to this CSV",
+        dir_okay=False,
+    ),
+):
+    """Run the suite over a cartesian product of cynthia-app flag sets.
+
+    Each --axis lists alternatives separated by commas (an empty alternative
+    adds no flag); one configuration is run per combination, all with -n.
+    Times are compared to the first configuration.
+
+    Example: sm1000-test sweep --axis=',-g' --axis='--gc-threshold 0.5,--gc-threshold 0.95'
+    """
+    import csv
+
+    from rich.progress import BarColumn, Progress, TextColumn, TimeRemainingColumn
+
+    from sm1000_tester.cache import ResultCache
+    from sm1000_tester.runner import CynthiaBenchmark
+    from sm1000_tester.sweep import SweepBenchmark, config_label, summarize_sweep, expand_axes
+    from sm1000_tester.ui.report import ReportGenerator
+
+    project_root = get_project_root()
+    app_path = app_path or project_root / "build" / "apps" / "cynthia" / "cynthia-app"
+    benchmark_dir = benchmark_dir or project_root / "benchmarks" / "sm1000"
+    configs = expand_axes(axes)
+
+    try:
+        cache = ResultCache(app_path, cache_path=None) if use_cache and app_path.exists() else None
+        base = CynthiaBenchmark(
+            app_path=app_path,
+            benchmark_dir=benchmark_dir,
+            jobs=jobs,
+            cache=cache,
+            manifest=manifest,
+            repeat=repeat,
+            timeout_policy=TimeoutPolicy(default=timeout),
+            pin_cpus=pin_cpus,
+        )
+        runner = SweepBenchmark(base, configs)
+        console.print(
+            f"[dim]{len(configs)} configurations: "
+            f"{', '.join(config_label(flags) for flags in configs)}[/dim]"
+        )
+        with Progress(
+            TextColumn("[progress.description]{task.description}"),
+            BarColumn(),
+            TextColumn("{task.completed}/{task.total}"),
+            TimeRemainingColumn(),
+            console=console,
+        ) as progress:
+            task = progress.add_task(
+                f"[cyan]Sweeping {len(configs)} configurations...",
+                total=len(base.collect_cases()),
+            )
+            results = runner.run(lambda done: progress.update(task, completed=done))
+        if cache is not None:
+            cache.close()
+    except typer.BadParameter as e:
+        console.print(f"[red]Error: {e}[/red]")
+        raise typer.Exit(1)
+
+    summary = summarize_sweep(configs, results)
+    report_gen = ReportGenerator(console=console, benchmark_dir=benchmark_dir)
+    report_gen.print_sweep(summary, top=top)
+
+    if csv_path is not None:
+        labels = [config.label for config in summary.configs]
+        with open(csv_path, "w", newline="", encoding="utf-8") as f:
+            writer = csv.writer(f)
+            writer.writerow(["Case", *labels, "Best", "Speedup"])
+            for case in summary.cases:
+                writer.writerow([
+                    case.key,
+                    *(f"{case.durations[label]:.6f}" for label in labels),
+                    case.best,
+                    f"{case.speedup:.4f}",
+                ])
+        console.print(f"[dim]Per-case results written to {csv_path}[/dim]")
+
+
+@app.command()
+def merge(
+    logs: List[Path] = typer.Argument(
+        ...,
+        help="JSONL result logs of the shards (written with --log)",
+        exists=True,
+        dir_okay=False,
+    ),
+    benchmark_dir: Optional[Path] = typer.Option(
+        None,
+        "--benchmark-dir",
+        "-b",
+        help="Root directory of the suite the shards ran (default: benchmarks/sm1000)",
+    ),
+    manifest: Optional[Path] = typer.Option(
+        None,
+        "--manifest",
+        "-m",
+        help="CSV of expected results (default: <benchmark-dir>/results.csv)",
+        dir_okay=False,
+    ),
+    output: Optional[Path] = typer.Option(
+        None,
+        "--output",
+        "-o",
+        help="Write the merged results to this JSONL file",
+        dir_okay=False,
+    ),
+    verbose: bool = typer.Option(
+        False,
+        "--verbose",
+        "-v",
+        help="Show detailed output for failed tests",
+    ),
+    all_failures: bool = typer.Option(
+        False,
+        "--all-failures",
+        help="Display all failed test cases (default: show only first 20)",
+    ),
+    show_paths: bool = typer.Option(
+        False,
+        "--show-paths",
+        help="Display .ltlf and .part file paths for failed tests",
+    ),
+):
+    """Merge the result logs of sharded runs into one report.
+
+    Results are checked again against the manifest, and cases of the suite
+    that no shard ran are listed. Exits with code 1 on mismatches or missing
+    cases.
+
+    Example: sm1000-test merge shard-1.jsonl shard-2.jsonl -o all.jsonl
+    """
+    from sm1000_tester.merge import merge_result_sets
+    from sm1000_tester.ui.report import ReportGenerator
+
+    project_root = get_project_root()
+    default_benchmark_dir = project_root / "benchmarks" / "sm1000"
+    benchmark_dir = benchmark_dir or default_benchmark_dir
+    is_smv1000 = benchmark_dir.resolve() == default_benchmark_dir.resolve()
+
+    try:
+        if not benchmark_dir.exists():
+            raise typer.BadParameter(f"Benchmark directory not found: {benchmark_dir}")
+        csv_path = find_manifest(benchmark_dir, manifest)
+        expected_map = load_manifest(csv_path) if csv_path is not None else {}
+    except typer.BadParameter as e:
+        console.print(f"[red]Error: {e}[/red]")
+        raise typer.Exit(1)
+
+    shard_logs = [ResultLog(path) for path in logs]
+    headers = [log.read_header() or {} for log in shard_logs]
+    if len({(h.get("app_hash"), tuple(h.get("flags", []))) for h in headers}) > 1:
+        console.print("[yellow]Warning: the shards ran different binaries or flags[/yellow]")
+
+    results, missing = merge_result_sets(
+        [log.load() for log in shard_logs], discover_cases(benchmark_dir), expected_map
+    )
+
+    report_gen = ReportGenerator(
+        console=console,
+        benchmark_dir=benchmark_dir,
+        verbose=verbose,
+        all_failures=all_failures,
+        show_paths=show_paths,
+        suite_name="SMV 1000" if is_smv1000 else benchmark_dir.name,
+    )
+    report_gen.print_summary(results)
+
+    if output is not None:
+        merged_log = ResultLog(output)
+        merged_log.open(headers[0].get("app_hash", ""), headers[0].get("flags", []))
+        try:
+            for result in results:
+                merged_log.append(result)
+        finally:
+            merged_log.close()
+        console.print(f"[dim]Merged results written to {output}[/dim]")
+
+    if missing:
+        console.print(f"[red]{len(missing)} case(s) missing from the shards:[/red]")
+        for key in missing[:20]:
+            console.print(f"  {key}")
+        if len(missing) > 20:
+            console.print(f"  ... and {len(missing) - 20} more")
+    if missing or any(not r.matched for r in results):
+        raise typer.Exit(1)
+
+
+@app.command()
+def coordinator(
+    benchmark_dir: Optional[Path] = typer.Option(
+        None,
+        "--benchmark-dir",
+        "-b",
+        help="Root directory of the suite to serve (default: benchmarks/sm1000)",
+    ),
+    manifest: Optional[Path] = typer.Option(
+        None,
+        "--manifest",
+        "-m",
+        help="CSV of expected results (default: <benchmark-dir>/results.csv)",
+        dir_okay=False,
+    ),
+    host: str = typer.Option(
+        "127.0.0.1",
+        "--host",
+        help="Address to listen on (0.0.0.0 to accept remote workers)",
+    ),
+    port: int = typer.Option(
+        DEFAULT_PORT,
+        "--port",
+        "-p",
+        help="TCP port to listen on",
+    ),
+    timeout: float = typer.Option(
+        60.0,
+        "--timeout",
+        "-t",
+        help="Per-case timeout in seconds, sent to the workers",
+        min=0.1,
+    ),
+    schedule: Schedule = typer.Option(
+        Schedule.fixed,
+        "--schedule",
+        help="Order cases are handed out in: canonical, or longest expected duration first",
+        case_sensitive=False,
+    ),
+    app_hash: Optional[str] = typer.Option(
+        None,
+        "--app-hash",
+        help="SHA-256 of the cynthia-app binary workers must run (default: the first worker's)",
+    ),
+    lease_grace: float = typer.Option(
+        30.0,
+        "--lease-grace",
+        help="Seconds past a case's timeout before it is handed to another worker",
+        min=0.0,
+    ),
+    log_path: Optional[Path] = typer.Option(
+        None,
+        "--log",
+        help="Stream each result to this JSONL file as soon as it arrives",
+        dir_okay=False,
+    ),
+    db_path: Optional[Path] = typer.Option(
+        None,
+        "--db",
+        help="Path to the results history database",
+        dir_okay=False,
+    ),
+    no_record: bool = typer.Option(
+        False,
+        "--no-record",
+        help="Do not store this run in the results history database",
+    ),
+    verbose: bool = typer.Option(
+        False,
+        "--verbose",
+        "-v",
+        help="Show detailed output for failed tests",
+    ),
+    all_failures: bool = typer.Option(
+        False,
+        "--all-failures",
+        help="Display all failed test cases (default: show only first 20)",
+    ),
+    show_paths: bool = typer.Option(
+        False,
+        "--show-paths",
+        help="Display .ltlf and .part file paths for failed tests",
+    ),
+):
+    """Serve the cases of a suite to workers and report their results.
+
+    Workers (sm1000-test worker) pull one case at a time, so fast workers take
+    more cases than slow ones. Cases of a worker that disconnects, or that
+    exceeds its timeout by --lease-grace, are handed to another worker.
+
+    Example: sm1000-test coordinator --port 8765 --log run.jsonl
+    """
+    from rich.progress import BarColumn, Progress, TextColumn, TimeRemainingColumn
+
+    from sm1000_tester.distributed import Coordinator
+    from sm1000_tester.history import ResultStore
+    from sm1000_tester.scheduler import LongestFirstScheduler
+    from sm1000_tester.ui import PassStatsColumn, ReportGenerator
+
+    project_root = get_project_root()
+    default_benchmark_dir = project_root / "benchmarks" / "sm1000"
+    benchmark_dir = benchmark_dir or default_benchmark_dir
+    is_smv1000 = benchmark_dir.resolve() == default_benchmark_dir.resolve()
+
+    try:
+        if not benchmark_dir.exists():
+            raise typer.BadParameter(f"Benchmark directory not found: {benchmark_dir}")
+        csv_path = find_manifest(benchmark_dir, manifest)
+        expected_map = load_manifest(csv_path) if csv_path is not None else {}
+    except typer.BadParameter as e:
+        console.print(f"[red]Error: {e}[/red]")
+        raise typer.Exit(1)
+
+    cases = discover_cases(benchmark_dir)
+    position = {case.key: i for i, case in enumerate(cases)}
+    if schedule == Schedule.longest_first:
+        order = LongestFirstScheduler(ResultStore(db_path).duration_history()).order(cases)
+        cases = [cases[i] for i in order]
+
+    with Progress(
+        TextColumn("[progress.description]{task.description}"),
+        BarColumn(),
+        PassStatsColumn(),
+        TextColumn("[progress.percentage]{task.percentage:>3.0f}%"),
+        TimeRemainingColumn(),
+        console=console,
+    ) as progress:
+        task = progress.add_task(
+            f"[cyan]Serving {len(cases)} cases on {host}:{port}...", total=len(cases)
+        )
+        counts = {"passed": 0, "done": 0}
+
+        def on_result(result: BenchmarkResult) -> None:
+            counts["done"] += 1
+            counts["passed"] += int(result.matched)
+            progress.update(
+                task, advance=1, passed=counts["passed"], total_tested=counts["done"]
+            )
+
+        server = Coordinator(
+            cases,
+            expected_map,
+            timeout_policy=TimeoutPolicy(default=timeout),
+            result_log=ResultLog(log_path) if log_path is not None else None,
+            lease_grace=lease_grace,
+            on_result=on_result,
+            app_hash=app_hash,
+        )
+        try:
+            results = server.serve(host, port)
+        except typer.BadParameter as e:
+            console.print(f"[red]Error: {e}[/red]")
+            raise typer.Exit(1)
+
+    results.sort(key=lambda r: position[f"{r.folder}/{r.filename}"])
+
+    report_gen = ReportGenerator(
+        console=console,
+        benchmark_dir=benchmark_dir,
+        verbose=verbose,
+        all_failures=all_failures,
+        show_paths=show_paths,
+        suite_name="SMV 1000" if is_smv1000 else benchmark_dir.name,
+    )
+    report_gen.print_summary(results)
+    console.print(
+        f"[dim]{len(server.workers)} worker connection(s), {server.requeued} case(s) re-queued[/dim]"
+    )
+    if server.rejected:
+        console.print(
+            f"[yellow]Refused {server.rejected} worker connection(s) with a different "
+            f"cynthia-app binary or flags[/yellow]"
+        )
+    if not no_record and results and server.workers:
+        first = next(iter(server.workers.values()))
+        store = ResultStore(db_path)
+        run_id = store.record_run(
+            results, Path(first["app_path"]), first["flags"], app_hash=first["app_hash"]
+        )
+        console.print(f"[dim]Recorded as run {run_id} in {store.db_path}[/dim]")
+
+
+@app.command()
+def worker(
+    app_path: Optional[Path] = typer.Option(
+        None,
+        "--app-path",
+        "-a",
+        help="Path to cynthia-app executable",
+        dir_okay=False,
+    ),
+    benchmark_dir: Optional[Path] = typer.Option(
+        None,
+        "--benchmark-dir",
+        "-b",
+        help="This machine's copy of the suite the coordinator serves (default: benchmarks/sm1000)",
+    ),
+    host: str = typer.Option(
+        "127.0.0.1",
+        "--host",
+        help="Coordinator address",
+    ),
+    port: int = typer.Option(
+        DEFAULT_PORT,
+        "--port",
+        "-p",
+        help="Coordinator TCP port",
+    ),
+    jobs: int = typer.Option(
+        1,
+        "--jobs",
+        "-j",
+        help="Number of cases to run concurrently (0 = one per CPU)",
+        min=0,
+    ),
+    name: Optional[str] = typer.Option(
+        None,
+        "--name",
+        help="Worker name reported to the coordinator (default: host:pid)",
+    ),
+    use_cache: bool = typer.Option(
+        False,
+        "--cache",
+        help="Reuse results of cases whose binary, inputs and flags are unchanged",
+    ),
+    cache_path: Optional[Path] = typer.Option(
+        None,
+        "--cache-path",
+        help="Path to the result cache database",
+        dir_okay=False,
+    ),
+    repeat: int = typer.Option(
+        1,
+        "--repeat",
+        "-r",
+        help="Number of measured runs per case; the median is reported",
+        min=1,
+    ),
+    warmup: int = typer.Option(
+        0,
+        "--warmup",
+        "-w",
+        help="Number of discarded runs per case before measuring",
+        min=0,
+    ),
+    pin_cpus: bool = typer.Option(
+        False,
+        "--pin-cpus",
+        help="Pin each running case to a dedicated CPU (Linux); caps --jobs at the CPU count",
+    ),
+    no_smt_siblings: bool = typer.Option(
+        False,
+        "--no-smt-siblings",
+        help="With --pin-cpus, use one hardware thread per core and leave SMT siblings idle",
+    ),
+    mem_limit: Optional[str] = typer.Option(
+        None,
+        "--mem-limit",
+        help="Memory limit of each cynthia-app process (e.g. 4G); runs exceeding it are MemOut",
+        metavar="SIZE",
+    ),
+    mem_cgroup: Optional[Path] = typer.Option(
+        None,
+        "--mem-cgroup",
+        help="Delegated cgroup v2 directory to enforce --mem-limit in, in addition to RLIMIT_AS",
+        file_okay=False,
+    ),
+):
+    """Run cases served by a coordinator until it has none left.
+
+    Example: sm1000-test worker --host bench-01 -j 8
+    """
+    from sm1000_tester.cache import ResultCache
+    from sm1000_tester.distributed import run_worker
+    from sm1000_tester.runner import CynthiaBenchmark
+
+    project_root = get_project_root()
+    app_path = app_path or project_root / "build" / "apps" / "cynthia" / "cynthia-app"
+    benchmark_dir = benchmark_dir or project_root / "benchmarks" / "sm1000"
+
+    try:
+        memory_limit = memory_limit_from(mem_limit, mem_cgroup)
+        cache = ResultCache(app_path, cache_path) if use_cache and app_path.exists() else None
+        bench = CynthiaBenchmark(
+            app_path=app_path,
+            benchmark_dir=benchmark_dir,
+            jobs=jobs,
+            cache=cache,
+            repeat=repeat,
+            warmup=warmup,
+            pin_cpus=pin_cpus,
+            no_smt_siblings=no_smt_siblings,
+            memory_limit=memory_limit,
+        )
+        count = run_worker(bench, host, port, name=name, console=console)
+        if cache is not None:
+            cache.close()
+    except typer.BadParameter as e:
+        console.print(f"[red]Error: {e}[/red]")
+        raise typer.Exit(1)
+    console.print(f"[green]Worker finished: {count} case(s) run[/green]")
+
 
 @app.command()
 def run_single(
     test_case: str = typer.Argument(
         ...,
-        help="Test case to run (e.g., 'bench1/f7', 'bench2/f123')",
+        help="Test case to run, relative to the benchmark directory (e.g., 'bench1/f7', 'bench2/f123')",
         metavar="TEST_CASE",
     ),
     app_path: Optional[Path] = typer.Option(
@@ -145,6 +1337,33 @@ def run_single(
         "-v",
         help="Enable verbose output (show file paths)",
     ),
+    timeout: float = typer.Option(
+        60.0,
+        "--timeout",
+        "-t",
+        help="Timeout in seconds",
+        min=0.1,
+    ),
+    repeat: int = typer.Option(
+        1,
+        "--repeat",
+        "-r",
+        help="Number of measured runs per case; the median is reported",
+        min=1,
+    ),
+    warmup: int = typer.Option(
+        0,
+        "--warmup",
+        "-w",
+        help="Number of discarded runs per case before measuring",
+        min=0,
+    ),
+    max_cv: float = typer.Option(
+        0.10,
+        "--max-cv",
+        help="Mark repeated timings with a coefficient of variation above this as unreliable",
+        min=0.0,
+    ),
 ):
     """Run a single test case from the SMV 1000 benchmark suite.
 
@@ -152,6 +1371,11 @@ def run_single(
 
     Example: sm1000-test run-single bench1/f7
     """
+    from rich.panel import Panel
+
+    from sm1000_tester.runner import CynthiaBenchmark
+    from sm1000_tester.ui.report import ReportGenerator
+
     # Determine default paths relative to project root
     project_root = get_project_root()
     default_app_path = project_root / "build" / "apps" / "cynthia" / "cynthia-app"
@@ -175,6 +1399,9 @@ def run_single(
             app_path=app_path,
             benchmark_dir=benchmark_dir,
             verbose=verbose,
+            timeout_policy=TimeoutPolicy(default=timeout),
+            repeat=repeat,
+            warmup=warmup,
         )
 
         # Run single test
@@ -185,6 +1412,7 @@ def run_single(
             console=console,
             benchmark_dir=benchmark_dir,
             verbose=verbose,
+            max_cv=max_cv,
         )
         report_gen.print_single_result(result)
 
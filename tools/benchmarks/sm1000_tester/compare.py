@@ -0,0 +1,132 @@
+"""Performance comparison between two benchmark result sets."""
+
+import math
+from pathlib import Path
+from typing import Dict, List, Sequence
+
+import typer
+
+from sm1000_tester.history import ResultStore
+from sm1000_tester.models import BenchmarkResult, CaseComparison, Comparison
+from sm1000_tester.results_log import ResultLog
+from sm1000_tester.stats import bootstrap_geomean_ci, geometric_mean, wilcoxon_signed_rank
+from sm1000_tester.utils import normalize_result
+
+
+def load_result_set(spec: str, store: ResultStore) -> List[BenchmarkResult]:
+    """Load a result set from a run specification.
+
+    Args:
+        spec: A run id from the history database, 'latest', 'previous', or
+            the path of a JSONL result log
+        store: History database to load runs from
+
+    Returns:
+        List of benchmark results
+
+    Raises:
+        typer.BadParameter: If the run does not exist
+    """
+    if spec.endswith(".jsonl") or Path(spec).is_file():
+        results = ResultLog(Path(spec)).load()
+        if not results:
+            raise typer.BadParameter(f"No results in {spec}")
+        return results
+
+    if spec in ("latest", "previous"):
+        runs = store.list_runs(limit=2)
+        index = 0 if spec == "latest" else 1
+        if len(runs) <= index:
+            raise typer.BadParameter(f"No {spec} run in {store.db_path}")
+        run_id = runs[index].run_id
+    elif spec.isdigit():
+        run_id = int(spec)
+    else:
+        raise typer.BadParameter(
+            f"Invalid result set: '{spec}'. Expected a run id, 'latest', 'previous' or a .jsonl file"
+        )
+
+    results = store.run_results(run_id)
+    if not results:
+        raise typer.BadParameter(f"Run {run_id} not found in {store.db_path}")
+    return results
+
+
+def _is_conclusive(result: BenchmarkResult) -> bool:
+    return normalize_result(result.actual) in ("realizable", "unrealizable")
+
+
+def compare_results(
+    baseline: Sequence[BenchmarkResult],
+    candidate: Sequence[BenchmarkResult],
+    min_duration: float = 0.001,
+    confidence: float = 0.95,
+) -> Comparison:
+    """Compare the timings of a candidate result set against a baseline.
+
+    Ratios are candidate time over baseline time, so values above 1 are
+    slowdowns. Only cases that are conclusive in both sets contribute to the
+    ratio statistics; timeouts are reported separately.
+
+    Args:
+        baseline: Baseline results
+        candidate: Candidate results
+        min_duration: Durations are clamped to at least this many seconds,
+            so that near-zero timings don't produce huge ratios
+        confidence: Confidence level of the bootstrap interval
+
+    Returns:
+        Comparison with per-case ratios and aggregate statistics
+    """
+    baseline_map: Dict[str, BenchmarkResult] = {f"{r.folder}/{r.filename}": r for r in baseline}
+    candidate_map: Dict[str, BenchmarkResult] = {f"{r.folder}/{r.filename}": r for r in candidate}
+
+    cases = []
+    new_timeouts, resolved_timeouts, new_failures, missing = [], [], [], []
+    for key, base in baseline_map.items():
+        cand = candidate_map.get(key)
+        if cand is None:
+            missing.append(key)
+            continue
+
+        base_timeout = base.actual == "Timeout"
+        cand_timeout = cand.actual == "Timeout"
+        if cand_timeout and not base_timeout:
+            new_timeouts.append(key)
+        elif base_timeout and not cand_timeout:
+            resolved_timeouts.append(key)
+        if base.matched and not cand.matched:
+            new_failures.append(key)
+
+        if _is_conclusive(base) and _is_conclusive(cand):
+            ratio = max(cand.duration, min_duration) / max(base.duration, min_duration)
+            cases.append(CaseComparison(key=key, baseline=base, candidate=cand, ratio=ratio))
+
+    ratios = [c.ratio for c in cases]
+    ci_low, ci_high = bootstrap_geomean_ci(ratios, confidence)
+    return Comparison(
+        cases=cases,
+        geomean_ratio=geometric_mean(ratios),
+        ci_low=ci_low,
+        ci_high=ci_high,
+        p_value=wilcoxon_signed_rank([math.log(r) for r in ratios]),
+        confidence=confidence,
+        new_timeouts=new_timeouts,
+        resolved_timeouts=resolved_timeouts,
+        new_failures=new_failures,
+        missing=missing,
+    )
+
+
+def is_regression(comparison: Comparison, max_slowdown: float, alpha: float) -> bool:
+    """Decide whether a comparison shows a significant slowdown.
+
+    Args:
+        comparison: Result of compare_results
+        max_slowdown: Largest acceptable geometric-mean ratio (e.g. 1.10)
+        alpha: Significance level of the Wilcoxon signed-rank test
+
+    Returns:
+        True if the geometric-mean ratio exceeds the threshold significantly
+    """
+    return comparison.geomean_ratio > max_slowdown and comparison.p_value < alpha
@@ -0,0 +1,397 @@
+"""Coordinator/worker execution of a suite over TCP.
+
+The coordinator holds the queue of cases; workers connect, pull one case at
+a time, run it and send the result back. The protocol is newline-delimited
+JSON, request/response, always initiated by the worker:
+
+    {"type": "hello", "worker": ..., "app_path": ..., "app_hash": ...,
+     "flags": [...], "runs_per_case": n}              -> {"type": "welcome"}
+                                                       | {"type": "error", "message": ...}
+    {"type": "next"}   -> {"type": "case", "folder": ..., "filename": ..., "timeout": s}
+                        | {"type": "wait", "seconds": s}
+                        | {"type": "done"}
+    {"type": "result", "result": {...}}               -> {"type": "ack"}
+
+A case handed out is leased to its connection. The lease ends when the
+result arrives; if the connection drops or the lease runs out first, the
+case goes back to the front of the queue.
+
+All workers must run the same binary with the same flags, since their
+results are recorded as one run: a hello that differs from the first
+worker's (or from the binary hash the coordinator expects) is refused and
+the connection closed.
+"""
+
+import itertools
+import json
+import os
+import socket
+import socketserver
+import threading
+import time
+from collections import deque
+from dataclasses import replace
+from pathlib import Path
+from typing import TYPE_CHECKING, Callable, Deque, Dict, List, Optional, Sequence, Set, Tuple
+
+import typer
+from rich.console import Console
+
+from sm1000_tester.models import BenchmarkCase, BenchmarkResult
+from sm1000_tester.results_log import ResultLog, record_to_result, result_to_record
+from sm1000_tester.timeouts import TimeoutPolicy
+from sm1000_tester.utils import DEFAULT_PORT, file_sha256, results_match
+
+if TYPE_CHECKING:
+    from sm1000_tester.runner import CynthiaBenchmark
+
+
+class Coordinator:
+    """Serve the cases of a suite to workers and collect their results."""
+
+    def __init__(
+        self,
+        cases: Sequence[BenchmarkCase],
+        expected_map: Dict[str, str],
+        timeout_policy: Optional[TimeoutPolicy] = None,
+        result_log: Optional[ResultLog] = None,
+        lease_grace: float = 30.0,
+        poll_interval: float = 0.5,
+        on_result: Optional[Callable[[BenchmarkResult], None]] = None,
+        app_hash: Optional[str] = None,
+    ):
+        """Initialize the coordinator.
+
+        Args:
+            cases: Cases to run, in the order they should be handed out
+            expected_map: Expected results keyed by case key; results are
+                checked against it rather than against the worker's manifest
+            timeout_policy: Per-case timeout budgets sent to the workers
+            result_log: JSONL log that each result is streamed to, if any
+            lease_grace: Seconds a lease may outlive the case's timeout
+                budget before the case is handed to another worker
+            poll_interval: Seconds an idle worker waits before asking again
+            on_result: Called with each new result, under the coordinator lock
+            app_hash: SHA-256 of the binary workers must run; defaults to the
+                binary of the first worker
+        """
+        self.cases = {case.key: case for case in cases}
+        self.expected_map = expected_map
+        self.timeout_policy = timeout_policy or TimeoutPolicy()
+        self.result_log = result_log
+        self.lease_grace = lease_grace
+        self.poll_interval = poll_interval
+        self.on_result = on_result
+        self.workers: Dict[str, dict] = {}
+        self.requeued = 0
+        self.rejected = 0
+        self.app_hash = app_hash
+        self.flags: Optional[List[str]] = None
+
+        self._pending: Deque[str] = deque(case.key for case in cases)
+        # Case key -> (deadline, id of the connection holding the lease)
+        self._leases: Dict[str, Tuple[float, int]] = {}
+        self._results: Dict[str, BenchmarkResult] = {}
+        self._log_open = False
+        self._lock = threading.Lock()
+        self._finished = threading.Event()
+        if not self._pending:
+            self._finished.set()
+
+    def register(self, hello: dict) -> Optional[str]:
+        """Record a worker's description.
+
+        Returns:
+            None if the worker is accepted, otherwise the reason it is refused
+        """
+        with self._lock:
+            app_hash = hello.get("app_hash")
+            flags = list(hello.get("flags", []))
+            if self.app_hash is not None and app_hash != self.app_hash:
+                reason = f"binary {app_hash} differs from the expected {self.app_hash}"
+            elif self.flags is not None and flags != self.flags:
+                reason = (
+                    f"flags {' '.join(flags)!r} differ from the other workers' "
+                    f"{' '.join(self.flags)!r}"
+                )
+            else:
+                self.app_hash = app_hash
+                self.flags = flags
+                self.workers[hello.get("worker", "?")] = hello
+                return None
+            self.rejected += 1
+            return reason
+
+    def next_case(self, owner: int, runs_per_case: int = 1) -> dict:
+        """Lease the next case, or tell the worker to wait or stop.
+
+        Args:
+            owner: Id of the connection asking
+            runs_per_case: Runs the worker makes per case (warmups + repeats),
+                to size the lease
+
+        Returns:
+            The response message for the worker
+        """
+        with self._lock:
+            self._requeue_expired()
+            if not self._pending:
+                if self._leases:
+                    return {"type": "wait", "seconds": self.poll_interval}
+                return {"type": "done"}
+
+            key = self._pending.popleft()
+            case = self.cases[key]
+            timeout = self.timeout_policy.budget_for(key)
+            deadline = time.monotonic() + timeout * max(runs_per_case, 1) + self.lease_grace
+            self._leases[key] = (deadline, owner)
+            return {
+                "type": "case",
+                "folder": case.folder,
+                "filename": case.filename,
+                "timeout": timeout,
+            }
+
+    def complete(self, result: BenchmarkResult) -> bool:
+        """Accept a worker's result.
+
+        Args:
+            result: The result as reported by the worker
+
+        Returns:
+            False if the result was ignored (unknown case or already done)
+        """
+        key = f"{result.folder}/{result.filename}"
+        with self._lock:
+            if key not in self.cases or key in self._results:
+                return False
+            self._leases.pop(key, None)
+            if key in self._pending:
+                # Re-queued after its lease expired, but the first worker made it
+                self._pending.remove(key)
+
+            expected = self.expected_map.get(key, "Unknown")
+            result = replace(result, expected=expected, matched=results_match(expected, result.actual))
+            self._results[key] = result
+            if self.result_log is not None:
+                if not self._log_open:
+                    # Every accepted worker runs this binary with these flags
+                    self.result_log.open(self.app_hash or "", self.flags or [])
+                    self._log_open = True
+                self.result_log.append(result)
+            if self.on_result is not None:
+                self.on_result(result)
+            if len(self._results) == len(self.cases):
+                self._finished.set()
+            return True
+
+    def release(self, keys: Set[str], owner: int) -> None:
+        """Put the unfinished cases of a lost worker back in the queue."""
+        with self._lock:
+            for key in keys:
+                # The lease may have expired and gone to another worker since
+                if key in self._leases and self._leases[key][1] == owner:
+                    del self._leases[key]
+                    self._pending.appendleft(key)
+                    self.requeued += 1
+
+    def _requeue_expired(self) -> None:
+        now = time.monotonic()
+        for key, (deadline, _) in list(self._leases.items()):
+            if deadline < now:
+                del self._leases[key]
+                self._pending.appendleft(key)
+                self.requeued += 1
+
+    def results(self) -> List[BenchmarkResult]:
+        """Results received so far, in case order."""
+        with self._lock:
+            return [self._results[key] for key in self.cases if key in self._results]
+
+    def serve(self, host: str = "127.0.0.1", port: int = DEFAULT_PORT) -> List[BenchmarkResult]:
+        """Serve cases until every case has a result.
+
+        Args:
+            host: Address to listen on
+            port: TCP port to listen on
+
+        Returns:
+            List of benchmark results, in case order
+
+        Raises:
+            typer.BadParameter: If the address cannot be listened on
+        """
+        try:
+            server = _Server((host, port), _Handler)
+        except OSError as e:
+            raise typer.BadParameter(f"Cannot listen on {host}:{port}: {e}")
+        server.coordinator = self
+        thread = threading.Thread(target=server.serve_forever, daemon=True)
+        thread.start()
+        try:
+            # Wake up regularly so that Ctrl+C is handled promptly
+            while not self._finished.wait(0.5):
+                pass
+        finally:
+            server.shutdown()
+            server.server_close()
+            if self.result_log is not None:
+                self.result_log.close()
+        return self.results()
+
+
+class _Server(socketserver.ThreadingTCPServer):
+    allow_reuse_address = True
+    daemon_threads = True
+    coordinator: Coordinator
+    # Lease owners; unlike id(), never reused for a later connection
+    connection_ids = itertools.count()
+
+
+class _Handler(socketserver.StreamRequestHandler):
+    """Serve one worker connection."""
+
+    def handle(self) -> None:
+        coordinator: Coordinator = self.server.coordinator
+        owner = next(self.server.connection_ids)
+        leased: Set[str] = set()
+        runs_per_case = 1
+        try:
+            for line in self.rfile:
+                message = json.loads(line)
+                kind = message.get("type")
+                if kind == "hello":
+                    reason = coordinator.register(message)
+                    if reason is not None:
+                        self.wfile.write(
+                            (json.dumps({"type": "error", "message": reason}) + "\n").encode()
+                        )
+                        return
+                    runs_per_case = int(message.get("runs_per_case", 1))
+                    response = {"type": "welcome"}
+                elif kind == "next":
+                    response = coordinator.next_case(owner, runs_per_case)
+                    if response["type"] == "case":
+                        leased.add(f"{response['folder']}/{response['filename']}")
+                elif kind == "result":
+                    result = record_to_result(message["result"])
+                    coordinator.complete(result)
+                    leased.discard(f"{result.folder}/{result.filename}")
+                    response = {"type": "ack"}
+                else:
+                    response = {"type": "error", "message": f"Unknown message type: {kind}"}
+                self.wfile.write((json.dumps(response) + "\n").encode())
+        except (ConnectionError, json.JSONDecodeError):
+            pass
+        finally:
+            coordinator.release(leased, owner)
+
+
+def run_worker(
+    bench: "CynthiaBenchmark",
+    host: str = "127.0.0.1",
+    port: int = DEFAULT_PORT,
+    name: Optional[str] = None,
+    console: Optional[Console] = None,
+) -> int:
+    """Pull cases from a coordinator and run them until it has none left.
+
+    Runs `bench.jobs` connections in parallel. Case paths are resolved
+    against the worker's own `bench.benchmark_dir`.
+
+    Args:
+        bench: Runner configured with the worker's binary and suite copy
+        host: Coordinator address
+        port: Coordinator TCP port
+        name: Worker name reported to the coordinator (defaults to host:pid)
+        console: Console to report progress on
+
+    Returns:
+        Number of cases this worker ran
+
+    Raises:
+        typer.BadParameter: If the coordinator cannot be reached, or refuses
+            the worker's binary or flags
+    """
+    console = console or Console()
+    name = name or f"{socket.gethostname()}:{os.getpid()}"
+    hello = {
+        "type": "hello",
+        "app_path": str(bench.app_path),
+        "app_hash": file_sha256(bench.app_path),
+        "flags": bench.app_flags,
+        "runs_per_case": bench.warmup + bench.repeat,
+    }
+    counts = [0] * bench.jobs
+    refused: List[ConnectionRefusedError] = []
+    rejected: List[str] = []
+
+    def pull(slot: int) -> None:
+        with socket.create_connection((host, port)) as sock, sock.makefile("rwb") as stream:
+            def request(message: dict) -> dict:
+                stream.write((json.dumps(message) + "\n").encode())
+                stream.flush()
+                line = stream.readline()
+                if not line:
+                    raise ConnectionError("coordinator closed the connection")
+                return json.loads(line)
+
+            welcome = request({**hello, "worker": f"{name}/{slot}"})
+            if welcome["type"] == "error":
+                rejected.append(welcome["message"])
+                return
+            while True:
+                response = request({"type": "next"})
+                if response["type"] == "done":
+                    return
+                if response["type"] == "wait":
+                    time.sleep(response["seconds"])
+                    continue
+                case = _resolve_case(bench.benchmark_dir, response["folder"], response["filename"])
+                try:
+                    result = bench.run_case(case, {}, timeout=response["timeout"])
+                except Exception as e:
+                    # Report it rather than drop the connection, which would
+                    # hand the same case to the next worker
+                    result = BenchmarkResult(
+                        folder=case.folder,
+                        filename=case.filename,
+                        expected="Unknown",
+                        actual=f"Error: {e}",
+                        matched=False,
+                        duration=0.0,
+                        timeout=response["timeout"],
+                    )
+                request({"type": "result", "result": result_to_record(result)})
+                counts[slot] += 1
+                console.print(f"[dim]{case.key}: {result.actual} ({result.duration:.2f}s)[/dim]")
+
+    def guarded(slot: int) -> None:
+        try:
+            pull(slot)
+        except ConnectionRefusedError as e:
+            refused.append(e)
+        except ConnectionError:
+            # The coordinator stops listening once every case has a result
+            pass
+
+    threads = [threading.Thread(target=guarded, args=(slot,)) for slot in range(bench.jobs)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    if rejected:
+        raise typer.BadParameter(f"Refused by the coordinator: {rejected[0]}")
+    if refused and not any(counts):
+        raise typer.BadParameter(f"Cannot connect to coordinator at {host}:{port}: {refused[0]}")
+    return sum(counts)
+
+
+def _resolve_case(benchmark_dir: Path, folder: str, filename: str) -> BenchmarkCase:
+    case_dir = benchmark_dir / folder
+    return BenchmarkCase(
+        folder=folder,
+        filename=filename,
+        formula_file=case_dir / f"{filename}.ltlf",
+        partition_file=case_dir / f"{filename}.part",
+    )
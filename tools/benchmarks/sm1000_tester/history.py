@@ -0,0 +1,275 @@
+"""Persistent SQLite history of benchmark runs."""
+
+import json
+import os
+import platform
+import sqlite3
+from contextlib import closing
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Dict, List, Optional, Sequence, Tuple
+
+from sm1000_tester.models import BenchmarkResult, RunRecord
+from sm1000_tester.utils import file_sha256, get_project_root
+
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS runs (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    started_at TEXT NOT NULL,
+    app_path TEXT NOT NULL,
+    app_hash TEXT NOT NULL,
+    flags TEXT NOT NULL,
+    hostname TEXT NOT NULL,
+    platform TEXT NOT NULL,
+    cpu_count INTEGER NOT NULL
+);
+
+CREATE TABLE IF NOT EXISTS cases (
+    run_id INTEGER NOT NULL REFERENCES runs(id) ON DELETE CASCADE,
+    folder TEXT NOT NULL,
+    filename TEXT NOT NULL,
+    expected TEXT NOT NULL,
+    actual TEXT NOT NULL,
+    matched INTEGER NOT NULL,
+    duration REAL NOT NULL,
+    peak_rss INTEGER NOT NULL,
+    user_time REAL NOT NULL,
+    sys_time REAL NOT NULL,
+    cached INTEGER NOT NULL DEFAULT 0,
+    timeout REAL NOT NULL DEFAULT 0,
+    samples TEXT NOT NULL DEFAULT '[]',
+    cpu INTEGER,
+    internal_time REAL,
+    explored_states INTEGER,
+    resumed INTEGER NOT NULL DEFAULT 0
+);
+
+CREATE INDEX IF NOT EXISTS cases_by_key ON cases(folder, filename);
+CREATE INDEX IF NOT EXISTS cases_by_run ON cases(run_id);
+"""
+
+# Columns added after the first schema version, created on older databases
+CASE_COLUMNS = {
+    "cached": "INTEGER NOT NULL DEFAULT 0",
+    "timeout": "REAL NOT NULL DEFAULT 0",
+    "samples": "TEXT NOT NULL DEFAULT '[]'",
+    "cpu": "INTEGER",
+    "internal_time": "REAL",
+    "explored_states": "INTEGER",
+    "resumed": "INTEGER NOT NULL DEFAULT 0",
+}
+
+
+def default_db_path() -> Path:
+    """Get the default location of the results database."""
+    return get_project_root() / "tools" / "benchmarks" / ".results" / "history.sqlite"
+
+
+class ResultStore:
+    """Store every case of every benchmark run in a local SQLite database."""
+
+    def __init__(self, db_path: Optional[Path] = None):
+        """Open (and create if needed) the results database.
+
+        Args:
+            db_path: Path to the SQLite file; defaults to default_db_path()
+        """
+        self.db_path = Path(db_path) if db_path else default_db_path()
+        self.db_path.parent.mkdir(parents=True, exist_ok=True)
+        with closing(self._connect()) as conn:
+            conn.executescript(SCHEMA)
+            existing = {row["name"] for row in conn.execute("PRAGMA table_info(cases)")}
+            for name, declaration in CASE_COLUMNS.items():
+                if name not in existing:
+                    conn.execute(f"ALTER TABLE cases ADD COLUMN {name} {declaration}")
+
+    def _connect(self) -> sqlite3.Connection:
+        conn = sqlite3.connect(self.db_path)
+        conn.row_factory = sqlite3.Row
+        return conn
+
+    def record_run(
+        self,
+        results: Sequence[BenchmarkResult],
+        app_path: Path,
+        flags: Sequence[str],
+        app_hash: Optional[str] = None,
+    ) -> int:
+        """Store a finished run and all its case results.
+
+        Args:
+            results: Results of the run
+            app_path: Path to the cynthia-app binary used
+            flags: Command-line flags passed to cynthia-app
+            app_hash: SHA-256 of the binary, for runs whose binary is not
+                readable here (e.g. on remote workers); hashed from
+                `app_path` by default
+
+        Returns:
+            The id of the new run
+        """
+        with closing(self._connect()) as conn, conn:
+            cursor = conn.execute(
+                "INSERT INTO runs (started_at, app_path, app_hash, flags, hostname, "
+                "platform, cpu_count) VALUES (?, ?, ?, ?, ?, ?, ?)",
+                (
+                    datetime.now(timezone.utc).isoformat(timespec="seconds"),
+                    str(Path(app_path).resolve()),
+                    app_hash or file_sha256(app_path),
+                    json.dumps(list(flags)),
+                    platform.node(),
+                    platform.platform(),
+                    os.cpu_count() or 1,
+                ),
+            )
+            run_id = cursor.lastrowid
+            conn.executemany(
+                "INSERT INTO cases (run_id, folder, filename, expected, actual, matched, "
+                "duration, peak_rss, user_time, sys_time, cached, timeout, samples, cpu, "
+                "internal_time, explored_states, resumed) "
+                "VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)",
+                [
+                    (
+                        run_id, r.folder, r.filename, r.expected, r.actual, int(r.matched),
+                        r.duration, r.peak_rss, r.user_time, r.sys_time, int(r.cached),
+                        r.timeout, json.dumps(r.samples), r.cpu,
+                        r.internal_time, r.explored_states, int(r.resumed),
+                    )
+                    for r in results
+                ],
+            )
+        return run_id
+
+    def list_runs(self, limit: int = 20) -> List[RunRecord]:
+        """List the most recent runs, newest first.
+
+        Args:
+            limit: Maximum number of runs to return
+
+        Returns:
+            List of run records with aggregate figures
+        """
+        with closing(self._connect()) as conn:
+            rows = conn.execute(
+                "SELECT runs.*, COUNT(cases.run_id) AS total, "
+                "COALESCE(SUM(cases.matched), 0) AS passed, "
+                "COALESCE(SUM(cases.duration), 0.0) AS total_duration "
+                "FROM runs LEFT JOIN cases ON cases.run_id = runs.id "
+                "GROUP BY runs.id ORDER BY runs.id DESC LIMIT ?",
+                (limit,),
+            ).fetchall()
+        return [
+            RunRecord(
+                run_id=row["id"],
+                started_at=row["started_at"],
+                app_path=row["app_path"],
+                app_hash=row["app_hash"],
+                flags=" ".join(json.loads(row["flags"])),
+                hostname=row["hostname"],
+                platform=row["platform"],
+                cpu_count=row["cpu_count"],
+                total=row["total"],
+                passed=row["passed"],
+                total_duration=row["total_duration"],
+            )
+            for row in rows
+        ]
+
+    def run_results(self, run_id: int) -> List[BenchmarkResult]:
+        """Load all case results of a run.
+
+        Args:
+            run_id: Id of the run
+
+        Returns:
+            List of benchmark results, in the order they were recorded
+        """
+        with closing(self._connect()) as conn:
+            rows = conn.execute(
+                "SELECT * FROM cases WHERE run_id = ? ORDER BY rowid", (run_id,)
+            ).fetchall()
+        return [self._row_to_result(row) for row in rows]
+
+    def case_history(
+        self, folder: str, filename: str, limit: int = 20
+    ) -> List[Tuple[Dict[str, object], BenchmarkResult]]:
+        """Load the results of one case across runs, newest first.
+
+        Args:
+            folder: Case folder (e.g. 'bench1')
+            filename: Case name (e.g. 'f7')
+            limit: Maximum number of runs to return
+
+        Returns:
+            List of (run info, result) pairs; run info holds run_id,
+            started_at, app_hash and flags
+        """
+        with closing(self._connect()) as conn:
+            rows = conn.execute(
+                "SELECT cases.*, runs.started_at, runs.app_hash, runs.flags "
+                "FROM cases JOIN runs ON cases.run_id = runs.id "
+                "WHERE cases.folder = ? AND cases.filename = ? "
+                "ORDER BY runs.id DESC LIMIT ?",
+                (folder, filename, limit),
+            ).fetchall()
+        return [
+            (
+                {
+                    "run_id": row["run_id"],
+                    "started_at": row["started_at"],
+                    "app_hash": row["app_hash"],
+                    "flags": " ".join(json.loads(row["flags"])),
+                },
+                self._row_to_result(row),
+            )
+            for row in rows
+        ]
+
+    def duration_history(self, last_runs: int = 20) -> Dict[str, List[float]]:
+        """Collect measured durations of conclusive results per case.
+
+        Cached results and timeouts or errors are left out, since they say
+        nothing about how long a case takes to solve. So are results loaded
+        back by --resume: their durations were measured by an earlier
+        invocation and may already be recorded with another run.
+
+        Args:
+            last_runs: Only consider this many most recent runs
+
+        Returns:
+            Dict mapping case keys (e.g. 'bench1/f7') to durations in seconds
+        """
+        with closing(self._connect()) as conn:
+            rows = conn.execute(
+                "SELECT folder, filename, duration FROM cases "
+                "WHERE cached = 0 AND resumed = 0 "
+                "AND actual IN ('Realizable', 'Unrealizable') "
+                "AND run_id IN (SELECT id FROM runs ORDER BY id DESC LIMIT ?)",
+                (last_runs,),
+            ).fetchall()
+        history: Dict[str, List[float]] = {}
+        for row in rows:
+            history.setdefault(f"{row['folder']}/{row['filename']}", []).append(row["duration"])
+        return history
+
+    @staticmethod
+    def _row_to_result(row: sqlite3.Row) -> BenchmarkResult:
+        return BenchmarkResult(
+            folder=row["folder"],
+            filename=row["filename"],
+            expected=row["expected"],
+            actual=row["actual"],
+            matched=bool(row["matched"]),
+            duration=row["duration"],
+            peak_rss=row["peak_rss"],
+            user_time=row["user_time"],
+            sys_time=row["sys_time"],
+            cached=bool(row["cached"]),
+            timeout=row["timeout"],
+            samples=json.loads(row["samples"]),
+            cpu=row["cpu"],
+            internal_time=row["internal_time"],
+            explored_states=row["explored_states"],
+            resumed=bool(row["resumed"]),
+        )
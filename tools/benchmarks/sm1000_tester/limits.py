@@ -0,0 +1,139 @@
+"""Memory limits for cynthia-app processes (Linux only)."""
+
+import re
+from pathlib import Path
+from typing import Optional
+
+import typer
+
+try:
+    import resource
+except ImportError:  # Windows
+    resource = None
+
+
+SIZE_UNITS = {"": 1, "K": 1024, "M": 1024 ** 2, "G": 1024 ** 3, "T": 1024 ** 4}
+
+
+def parse_size(text: str) -> int:
+    """Parse a byte size such as '4G', '512M' or '1048576'.
+
+    Units are binary (K = 1024) and an optional trailing 'B' or 'iB' is
+    accepted, so '4G', '4GB' and '4GiB' are the same.
+
+    Raises:
+        typer.BadParameter: If the size is malformed or less than one byte
+    """
+    match = re.fullmatch(r"\s*(\d+(?:\.\d+)?)\s*([KMGT]?)(?:I?B)?\s*", text.upper())
+    if match is None:
+        raise typer.BadParameter(f"Invalid size '{text}'. Expected e.g. 4G, 512M or 1048576")
+    number, unit = match.groups()
+    size = int(float(number) * SIZE_UNITS[unit])
+    if size <= 0:
+        raise typer.BadParameter(f"Invalid size '{text}'. The size must be positive")
+    return size
+
+
+class MemoryLimit:
+    """Cap the memory of each child process.
+
+    The address space of every child is limited with RLIMIT_AS, so that
+    allocations beyond the limit fail (std::bad_alloc) instead of pushing
+    the host into swap. If a cgroup v2 directory is given, each child is
+    also moved into a cgroup of its own below it with `memory.max` set,
+    which limits resident memory and lets OOM kills be told apart from
+    other SIGKILLs. That directory must be writable and have the memory
+    controller enabled in its `cgroup.subtree_control`.
+    """
+
+    def __init__(self, limit: int, cgroup_parent: Optional[Path] = None):
+        """Initialize the memory limit.
+
+        Args:
+            limit: Limit in bytes
+            cgroup_parent: Delegated cgroup v2 directory to create per-case
+                cgroups in, if any
+
+        Raises:
+            typer.BadParameter: If limits are unsupported or the cgroup
+                directory is unusable
+        """
+        if resource is None or not hasattr(resource, "prlimit"):
+            raise typer.BadParameter("--mem-limit requires resource.prlimit (Linux)")
+        self.limit = limit
+        self.cgroup_parent = cgroup_parent
+        if cgroup_parent is not None:
+            controllers = cgroup_parent / "cgroup.subtree_control"
+            try:
+                enabled = controllers.read_text().split()
+            except OSError as e:
+                raise typer.BadParameter(f"Not a cgroup v2 directory: {cgroup_parent} ({e})")
+            if "memory" not in enabled:
+                raise typer.BadParameter(
+                    f"The memory controller is not enabled in {controllers}"
+                )
+
+    def apply(self, pid: int) -> Optional[Path]:
+        """Limit a freshly spawned child.
+
+        Args:
+            pid: Process id of the child
+
+        Returns:
+            The child's cgroup directory, if one was created
+        """
+        try:
+            resource.prlimit(pid, resource.RLIMIT_AS, (self.limit, self.limit))
+        except ProcessLookupError:
+            return None
+        if self.cgroup_parent is None:
+            return None
+
+        cgroup = self.cgroup_parent / f"sm1000-{pid}"
+        cgroup.mkdir(exist_ok=True)
+        (cgroup / "memory.max").write_text(str(self.limit))
+        swap_max = cgroup / "memory.swap.max"
+        if swap_max.exists():
+            swap_max.write_text("0")
+        try:
+            (cgroup / "cgroup.procs").write_text(str(pid))
+        except ProcessLookupError:
+            pass
+        return cgroup
+
+    @staticmethod
+    def oom_killed(cgroup: Optional[Path]) -> bool:
+        """Check whether the OOM killer fired in a child's cgroup."""
+        if cgroup is None:
+            return False
+        try:
+            events = (cgroup / "memory.events").read_text()
+        except OSError:
+            return False
+        counts = dict(line.split() for line in events.splitlines() if line.strip())
+        return int(counts.get("oom_kill", 0)) > 0
+
+    @staticmethod
+    def peak_memory(cgroup: Optional[Path]) -> Optional[int]:
+        """Read the peak memory use of a child's cgroup, in bytes.
+
+        Unlike the rusage peak RSS, this only counts what the child itself
+        charged. Returns None without a cgroup or on kernels older than 5.19,
+        which have no `memory.peak`.
+        """
+        if cgroup is None:
+            return None
+        try:
+            return int((cgroup / "memory.peak").read_text())
+        except (OSError, ValueError):
+            return None
+
+    @staticmethod
+    def release(cgroup: Optional[Path]) -> None:
+        """Remove a child's cgroup once the child has been reaped."""
+        if cgroup is None:
+            return
+        try:
+            cgroup.rmdir()
+        except OSError:
+            pass
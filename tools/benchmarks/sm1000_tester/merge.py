@@ -0,0 +1,42 @@
+"""Combination of result sets produced by separate shards."""
+
+from dataclasses import replace
+from typing import Dict, List, Sequence, Tuple
+
+from sm1000_tester.models import BenchmarkCase, BenchmarkResult
+from sm1000_tester.utils import results_match
+
+
+def merge_result_sets(
+    result_sets: Sequence[Sequence[BenchmarkResult]],
+    cases: Sequence[BenchmarkCase],
+    expected_map: Dict[str, str],
+) -> Tuple[List[BenchmarkResult], List[str]]:
+    """Merge shard results and check them against the expected results.
+
+    Expected results are taken from `expected_map` rather than from the
+    shards, so a shard run with a stale or missing manifest cannot hide a
+    mismatch. If a case appears in several sets, the last one wins.
+
+    Args:
+        result_sets: Results of each shard
+        cases: All cases of the suite, in canonical order
+        expected_map: Expected results keyed by case key
+
+    Returns:
+        (results, missing): the merged results in canonical order (cases
+        outside the suite last), and the keys of suite cases without a result
+    """
+    merged: Dict[str, BenchmarkResult] = {}
+    for results in result_sets:
+        for result in results:
+            key = f"{result.folder}/{result.filename}"
+            expected = expected_map.get(key, "Unknown")
+            merged[key] = replace(
+                result, expected=expected, matched=results_match(expected, result.actual)
+            )
+
+    suite_keys = [case.key for case in cases]
+    missing = [key for key in suite_keys if key not in merged]
+    ordered = [merged.pop(key) for key in suite_keys if key in merged]
+    return ordered + list(merged.values()), missing
@@ -1,6 +1,37 @@
 """Data models for SMV 1000 benchmark testing."""
 
-from dataclasses import dataclass
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
+
+
+def split_case_key(key: str) -> Tuple[str, str]:
+    """Split a case identifier into its folder and filename.
+
+    The inverse of `BenchmarkCase.key`: 'Patterns/GFand/gfand_3' gives
+    ('Patterns/GFand', 'gfand_3'). A case at the root of the suite has an
+    empty folder, so both '/f7' and 'f7' give ('', 'f7').
+    """
+    folder, _, filename = key.strip("/").rpartition("/")
+    return folder, filename
+
+
+@dataclass(frozen=True)
+class BenchmarkCase:
+    """A single benchmark instance: a formula and its partition file."""
+
+    folder: str
+    filename: str
+    formula_file: Path
+    partition_file: Path
+
+    @property
+    def key(self) -> str:
+        """Return the case identifier used in results.csv (e.g. 'bench1/f7').
+
+        Cases at the root of the suite have an empty folder (e.g. '/f7').
+        """
+        return f"{self.folder}/{self.filename}"
 
 
 @dataclass
@@ -13,8 +44,142 @@ class BenchmarkResult:
     actual: str
     matched: bool
     duration: float
+    peak_rss: int = 0
+    user_time: float = 0.0
+    sys_time: float = 0.0
+    cached: bool = False
+    # Loaded back from a --log file by --resume rather than measured now
+    resumed: bool = False
+    timeout: float = 0.0
+    samples: List[float] = field(default_factory=list)
+    cpu: Optional[int] = None
+    internal_time: Optional[float] = None
+    explored_states: Optional[int] = None
+
+    @property
+    def overhead(self) -> Optional[float]:
+        """Wall time not spent in synthesis (process startup, parsing, teardown)."""
+        if self.internal_time is None:
+            return None
+        return self.duration - self.internal_time
 
     def __repr__(self) -> str:
         """Return string representation of the result."""
         status = "✓" if self.matched else "✗"
         return f"{status} {self.folder}/{self.filename}: {self.expected} vs {self.actual} ({self.duration:.3f}s)"
+
+
+@dataclass
+class RunMeasurement:
+    """Outcome and resource usage of a single cynthia-app invocation."""
+
+    outcome: str
+    duration: float
+    peak_rss: int = 0
+    user_time: float = 0.0
+    sys_time: float = 0.0
+    samples: List[float] = field(default_factory=list)
+    internal_time: Optional[float] = None
+    explored_states: Optional[int] = None
+
+
+@dataclass
+class RunRecord:
+    """Metadata and aggregate figures of a benchmark run stored in history."""
+
+    run_id: int
+    started_at: str
+    app_path: str
+    app_hash: str
+    flags: str
+    hostname: str
+    platform: str
+    cpu_count: int
+    total: int
+    passed: int
+    total_duration: float
+
+
+@dataclass
+class CaseComparison:
+    """Timing of one case in a baseline and a candidate run."""
+
+    key: str
+    baseline: BenchmarkResult
+    candidate: BenchmarkResult
+    ratio: float
+
+    @property
+    def speedup(self) -> float:
+        """Return baseline time over candidate time (>1 means faster)."""
+        return 1 / self.ratio
+
+
+@dataclass
+class Comparison:
+    """Aggregate comparison of a candidate run against a baseline run."""
+
+    cases: List[CaseComparison]
+    geomean_ratio: float
+    ci_low: float
+    ci_high: float
+    p_value: float
+    confidence: float = 0.95
+    new_timeouts: List[str] = field(default_factory=list)
+    resolved_timeouts: List[str] = field(default_factory=list)
+    new_failures: List[str] = field(default_factory=list)
+    missing: List[str] = field(default_factory=list)
+
+
+@dataclass
+class ABRun:
+    """Results of an interleaved A/B run of two binaries on the same cases."""
+
+    baseline: List[BenchmarkResult]
+    candidate: List[BenchmarkResult]
+    verdict: str
+    stopped_early: bool
+    total_cases: int
+
+
+@dataclass
+class ConfigSummary:
+    """Aggregate figures of one flag configuration in a sweep."""
+
+    label: str
+    flags: List[str]
+    passed: int
+    timeouts: int
+    total_duration: float
+    geomean_ratio: float
+    wins: int
+
+
+@dataclass
+class CaseBest:
+    """Fastest configuration of one case in a sweep."""
+
+    key: str
+    best: str
+    durations: Dict[str, float]
+    speedup: float
+
+
+@dataclass
+class Sweep:
+    """Results of a suite run over several flag configurations."""
+
+    configs: List[ConfigSummary]
+    cases: List[CaseBest]
+    results: Dict[str, List[BenchmarkResult]]
+
+
+@dataclass
+class TimingStats:
+    """Robust summary of repeated wall-time samples of one case."""
+
+    samples: int
+    median: float
+    minimum: float
+    iqr: float
+    cv: float
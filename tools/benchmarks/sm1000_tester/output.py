@@ -0,0 +1,79 @@
+"""Incremental parsing of cynthia-app output."""
+
+import re
+from typing import Optional
+
+
+# Output of a failed allocation: an uncaught std::bad_alloc, or messages
+# from the allocator or the SDD package
+MEMOUT_MARKERS = ("BAD_ALLOC", "OUT OF MEMORY", "CANNOT ALLOCATE MEMORY")
+
+# Lines logged by cynthia-app (apps/cynthia/main.cpp, ForwardSynthesis)
+VERDICT_RE = re.compile(r"\b(un)?realizable\.[ \t\r]*$", re.IGNORECASE | re.MULTILINE)
+INTERNAL_TIME_RE = re.compile(r"Overall time elapsed: ([0-9.eE+-]+)ms")
+EXPLORED_STATES_RE = re.compile(r"Explored states: (\d+)")
+
+
+def _last_match(pattern: re.Pattern, text: str) -> Optional[re.Match]:
+    match = None
+    for match in pattern.finditer(text):
+        pass
+    return match
+
+
+class OutputParser:
+    """Extract the verdict and metrics of a cynthia-app run incrementally.
+
+    Output is fed in blocks of complete lines as it is read from the child,
+    so it never has to be held in memory as a whole. A block is first
+    checked for each message with a plain substring test, so blocks of
+    search trace (`-v`) are dismissed without running any regex. The verdict
+    is known as soon as its line has been read; later lines of the same kind
+    take precedence.
+    """
+
+    def __init__(self) -> None:
+        self.verdict: Optional[str] = None
+        self.internal_time: Optional[float] = None
+        self.explored_states: Optional[int] = None
+        self.memout = False
+
+    def feed(self, lines: str) -> None:
+        """Parse one or more complete lines of output."""
+        if "ealizable." in lines or "EALIZABLE." in lines:
+            match = _last_match(VERDICT_RE, lines)
+            if match is not None:
+                self.verdict = "Unrealizable" if match.group(1) else "Realizable"
+        if "time elapsed" in lines:
+            match = _last_match(INTERNAL_TIME_RE, lines)
+            if match is not None:
+                # Logged in milliseconds
+                self.internal_time = float(match.group(1)) / 1000
+        if "Explored states" in lines:
+            match = _last_match(EXPLORED_STATES_RE, lines)
+            if match is not None:
+                self.explored_states = int(match.group(1))
+        if not self.memout and any(hint in lines for hint in ("lloc", "LLOC", "emory", "EMORY")):
+            upper = lines.upper()
+            self.memout = any(marker in upper for marker in MEMOUT_MARKERS)
+
+    def outcome(self, tail: str) -> str:
+        """Return the verdict, falling back to a search of the output tail.
+
+        Args:
+            tail: Last lines of the output, for outputs without a verdict
+                line of their own (e.g. "NOT REALIZABLE" from other builds)
+
+        Returns:
+            'Realizable', 'Unrealizable' or 'Unknown'
+        """
+        if self.verdict is not None:
+            return self.verdict
+        # Check for "NOT REALIZABLE" or "UNREALIZABLE" FIRST to avoid
+        # matching "REALIZABLE" in "NOT REALIZABLE"
+        tail_upper = tail.upper()
+        if "UNREALIZABLE" in tail_upper or "NOT REALIZABLE" in tail_upper:
+            return "Unrealizable"
+        if "REALIZABLE" in tail_upper:
+            return "Realizable"
+        return "Unknown"
@@ -0,0 +1,241 @@
+"""Child process execution with resource accounting."""
+
+import errno
+import os
+import signal
+import subprocess
+import sys
+import threading
+import time
+from dataclasses import dataclass
+from typing import BinaryIO, Callable, List, Optional, Tuple
+
+from sm1000_tester.limits import MemoryLimit
+
+
+# Bytes read from the child at a time
+CHUNK_BYTES = 1024 * 1024
+# Bytes of trailing output kept in ProcessResult.output
+TAIL_BYTES = 64 * 1024
+
+# Run as `python -S -I -c _RUSAGE_SHIM <report fd> <timeout> <cmd>...`: forks
+# and execs the command, kills it once the timeout expires, and reports on the
+# report fd that it is ready, then the command's rusage and whether it timed
+# out. It forks only on EOF on stdin, once the harness has applied its limits.
+# Only the shim reaps the command, so only it can kill it without racing a
+# reuse of the pid.
+_RUSAGE_SHIM = """
+import os, sys
+import _signal as signal  # not signal.py, whose enum import would add to the floor
+report = int(sys.argv[1])
+os.write(report, b"ready\\n")
+os.read(0, 1)
+pid = os.fork()
+if pid == 0:
+    os.close(report)
+    null = os.open(os.devnull, os.O_RDONLY)
+    os.dup2(null, 0)
+    os.close(null)
+    try:
+        os.execvp(sys.argv[3], sys.argv[3:])
+    except OSError as e:
+        os.write(2, f"{sys.argv[3]}: {e}\\n".encode())
+        os._exit(127)
+expired = False
+def expire(signum, frame):
+    global expired
+    expired = True
+    os.kill(pid, signal.SIGKILL)
+signal.signal(signal.SIGINT, signal.SIG_IGN)
+signal.signal(signal.SIGALRM, expire)
+signal.setitimer(signal.ITIMER_REAL, float(sys.argv[2]))
+_, status, ru = os.wait4(pid, 0)
+signal.setitimer(signal.ITIMER_REAL, 0)
+os.write(report, f"{ru.ru_maxrss} {ru.ru_utime!r} {ru.ru_stime!r} {int(expired)}\\n".encode())
+if os.WIFSIGNALED(status):
+    if os.WTERMSIG(status) != signal.SIGKILL:
+        signal.signal(os.WTERMSIG(status), signal.SIG_DFL)
+    os.kill(os.getpid(), os.WTERMSIG(status))
+os._exit(os.waitstatus_to_exitcode(status))
+"""
+
+
+@dataclass
+class ProcessResult:
+    """Output, exit status and resource usage of a finished child process.
+
+    `output` holds only the last lines of the combined stdout and stderr
+    (see TAIL_BYTES); `output_lines` counts all of them. A `peak_rss` of 0
+    means it could not be measured.
+    """
+
+    output: str
+    returncode: int
+    timed_out: bool
+    duration: float
+    peak_rss: int = 0
+    user_time: float = 0.0
+    sys_time: float = 0.0
+    oom_killed: bool = False
+    output_lines: int = 0
+
+
+def _maxrss_to_bytes(maxrss: int) -> int:
+    """Convert ru_maxrss to bytes (kilobytes on Linux, bytes on macOS)."""
+    return maxrss if sys.platform == "darwin" else maxrss * 1024
+
+
+def _spawn_measured(cmd: List[str], timeout: float) -> Tuple[subprocess.Popen, BinaryIO]:
+    """Start the rusage shim for a command; it forks only once stdin is closed.
+
+    Returns:
+        The shim process and the read end of its report pipe, past the
+        'ready' line
+
+    Raises:
+        OSError: If the command is a path that cannot be executed, as
+            `subprocess.Popen` would for the command itself
+    """
+    if os.sep in cmd[0] and not os.access(cmd[0], os.X_OK):
+        code = errno.EACCES if os.path.exists(cmd[0]) else errno.ENOENT
+        raise OSError(code, os.strerror(code), cmd[0])
+    report_r, report_w = os.pipe()
+    try:
+        proc = subprocess.Popen(
+            [sys.executable, "-S", "-I", "-c", _RUSAGE_SHIM, str(report_w), repr(timeout), *cmd],
+            stdin=subprocess.PIPE,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.STDOUT,
+            pass_fds=(report_w,),
+        )
+    finally:
+        os.close(report_w)
+    report = os.fdopen(report_r, "rb")
+    report.readline()
+    return proc, report
+
+
+def run_process(
+    cmd: List[str],
+    timeout: float,
+    cpu: Optional[int] = None,
+    memory: Optional[MemoryLimit] = None,
+    on_lines: Optional[Callable[[str], None]] = None,
+    tail_bytes: int = TAIL_BYTES,
+) -> ProcessResult:
+    """Run a command, streaming its stdout and stderr, and measure its rusage.
+
+    Output is read in chunks as the child writes it. Complete lines are
+    passed to `on_lines`, a chunk's worth at a time, and only the last
+    `tail_bytes` of output are kept, so memory use does not grow with the
+    output (e.g. the search trace of -v).
+
+    The rusage (peak RSS, user and system CPU time) is that of the command
+    alone, also when several commands run concurrently. Linux carries the
+    high-water mark of the spawning process across exec, so a child of the
+    harness would never report a peak RSS below the harness's own. Where
+    `os.wait4` is available, the command is therefore started by a small
+    shim process that forks it, enforces the timeout and reaps it with
+    `os.wait4`: the reported
+    peak RSS is then exact above the shim's own size (5-7 MiB). When the
+    command runs in a cgroup of its own (see MemoryLimit), the cgroup's
+    `memory.peak` is reported instead. Elsewhere the command is started
+    directly and no rusage is reported.
+
+    Args:
+        cmd: Command line to execute
+        timeout: Wall-clock budget in seconds; the child is killed when exceeded
+        cpu: Pin the child to this CPU. The affinity is set on the shim
+            before it forks the command (or right after spawning the command
+            without a shim), since a preexec_fn is not safe with the runner's
+            threads
+        memory: Memory limit to apply to the child, likewise
+        on_lines: Called with one or more complete lines of output at a
+            time, in order, as they are read
+        tail_bytes: Bytes of trailing output kept in the result
+
+    Returns:
+        ProcessResult for the finished child
+    """
+    measured = hasattr(os, "wait4")
+    if measured:
+        proc, report = _spawn_measured(cmd, timeout)
+    else:
+        proc = subprocess.Popen(cmd, stdout=subprocess.PIPE, stderr=subprocess.STDOUT)
+    # Applied to the shim before it forks, so the command inherits them
+    if cpu is not None:
+        try:
+            os.sched_setaffinity(proc.pid, {cpu})
+        except ProcessLookupError:
+            # Already exited and reaped; nothing left to pin
+            pass
+    cgroup = memory.apply(proc.pid) if memory is not None else None
+
+    start_time = time.perf_counter()
+    expired = threading.Event()
+
+    def kill() -> None:
+        expired.set()
+        proc.kill()
+
+    if measured:
+        # Let the shim fork the command; it enforces the timeout itself
+        proc.stdin.close()
+        timer = None
+    else:
+        timer = threading.Timer(timeout, kill)
+        timer.start()
+    tail = b""
+    pending = b""
+    line_count = 0
+    try:
+        while True:
+            chunk = proc.stdout.read1(CHUNK_BYTES)
+            block = pending + chunk
+            if chunk:
+                # Hold back a trailing partial line, unless it is overlong
+                cut = block.rfind(b"\n") + 1
+                if cut == 0 and len(block) < tail_bytes:
+                    pending = block
+                    continue
+                block, pending = (block[:cut], block[cut:]) if cut else (block, b"")
+            if block:
+                line_count += block.count(b"\n")
+                tail = (tail + block)[-tail_bytes:]
+                if on_lines is not None:
+                    on_lines(block.decode(errors="replace"))
+            if not chunk:
+                break
+    finally:
+        if timer is not None:
+            timer.cancel()
+        proc.stdout.close()
+
+    proc.wait()
+    peak_rss, user_time, sys_time = 0, 0.0, 0.0
+    if measured:
+        with report:
+            usage = report.readline().split()
+        if len(usage) == 4:
+            peak_rss = _maxrss_to_bytes(int(usage[0]))
+            user_time, sys_time = float(usage[1]), float(usage[2])
+            if usage[3] == b"1":
+                expired.set()
+    cgroup_peak = MemoryLimit.peak_memory(cgroup)
+    if cgroup_peak is not None:
+        peak_rss = cgroup_peak
+    oom_killed = MemoryLimit.oom_killed(cgroup)
+    MemoryLimit.release(cgroup)
+
+    return ProcessResult(
+        output=tail.decode(errors="replace"),
+        returncode=proc.returncode,
+        # A timer firing after a normal exit must not count as a timeout
+        timed_out=expired.is_set() and proc.returncode == -signal.SIGKILL,
+        duration=time.perf_counter() - start_time,
+        peak_rss=peak_rss,
+        user_time=user_time,
+        sys_time=sys_time,
+        oom_killed=oom_killed,
+        output_lines=line_count,
+    )
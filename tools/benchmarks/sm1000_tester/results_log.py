@@ -0,0 +1,127 @@
+"""Append-only JSONL log of benchmark results."""
+
+import json
+import os
+from dataclasses import asdict, fields
+from pathlib import Path
+from typing import Dict, List, Optional, Sequence, TextIO
+
+from sm1000_tester.models import BenchmarkResult
+
+
+RESULT_FIELDS = {f.name for f in fields(BenchmarkResult)}
+
+
+def result_to_record(result: BenchmarkResult) -> Dict[str, object]:
+    """Convert a result to a JSON-serializable log record."""
+    return {"record": "result", **asdict(result)}
+
+
+def record_to_result(record: Dict[str, object]) -> BenchmarkResult:
+    """Convert a log record back to a result, ignoring unknown keys."""
+    return BenchmarkResult(**{k: v for k, v in record.items() if k in RESULT_FIELDS})
+
+
+class ResultLog:
+    """Stream results to a JSONL file as soon as each case completes.
+
+    The first record of a log describes the run (binary hash and flags);
+    every following line is one BenchmarkResult. Each line is flushed and
+    fsynced when written, so a killed run loses at most the line being
+    written, and a truncated last line is ignored when the log is read back.
+    """
+
+    def __init__(self, path: Path):
+        """Initialize the log.
+
+        Args:
+            path: Path to the JSONL file
+        """
+        self.path = Path(path)
+        self._file: Optional[TextIO] = None
+
+    def open(self, app_hash: str, flags: Sequence[str], resume: bool = False) -> None:
+        """Open the log for writing.
+
+        Args:
+            app_hash: SHA-256 of the cynthia-app binary of this run
+            flags: Command-line flags passed to cynthia-app
+            resume: Append to an existing log instead of starting a new one
+        """
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        appending = resume and self.path.exists()
+        self._file = open(self.path, "a" if appending else "w", encoding="utf-8")
+        if appending and self.path.stat().st_size > 0:
+            # Terminate a line cut short by a crash, so it stays separate
+            with open(self.path, "rb") as f:
+                f.seek(-1, os.SEEK_END)
+                if f.read(1) != b"\n":
+                    self._file.write("\n")
+        if not appending:
+            self._write({"record": "run", "app_hash": app_hash, "flags": list(flags)})
+
+    def append(self, result: BenchmarkResult) -> None:
+        """Write one result and make it durable."""
+        self._write(result_to_record(result))
+
+    def close(self) -> None:
+        """Close the log file."""
+        if self._file is not None:
+            self._file.close()
+            self._file = None
+
+    def _write(self, record: Dict[str, object]) -> None:
+        self._file.write(json.dumps(record) + "\n")
+        self._file.flush()
+        os.fsync(self._file.fileno())
+
+    def read_header(self) -> Optional[Dict[str, object]]:
+        """Read the run record of an existing log, if any."""
+        if not self.path.exists():
+            return None
+        with open(self.path, encoding="utf-8") as f:
+            first = f.readline()
+        try:
+            record = json.loads(first)
+        except json.JSONDecodeError:
+            return None
+        return record if record.get("record") == "run" else None
+
+    def load(self) -> List[BenchmarkResult]:
+        """Read all complete results from the log.
+
+        Lines that are not valid JSON (such as a line cut short by a crash)
+        are skipped. If a case appears more than once, the last entry wins.
+
+        Returns:
+            List of results in the order they were first logged
+        """
+        results: Dict[str, BenchmarkResult] = {}
+        if not self.path.exists():
+            return []
+        with open(self.path, encoding="utf-8") as f:
+            for line in f:
+                try:
+                    record = json.loads(line)
+                except json.JSONDecodeError:
+                    continue
+                if record.get("record") != "result":
+                    continue
+                result = record_to_result(record)
+                results[f"{result.folder}/{result.filename}"] = result
+        return list(results.values())
+
+    def duration_history(self) -> Dict[str, List[float]]:
+        """Collect measured durations of conclusive results per case.
+
+        Like ResultStore.duration_history, cached results and timeouts or
+        errors are left out.
+
+        Returns:
+            Dict mapping case keys (e.g. 'bench1/f7') to durations in seconds
+        """
+        return {
+            f"{r.folder}/{r.filename}": [r.duration]
+            for r in self.load()
+            if not r.cached and r.actual in ("Realizable", "Unrealizable")
+        }
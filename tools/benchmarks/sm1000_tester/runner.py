@@ -1,18 +1,58 @@
 """Core benchmark runner for SMV 1000 testing."""
 
-import subprocess
+import os
+import signal
+import statistics
 import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from pathlib import Path
-from typing import List
+from typing import Dict, List, Optional, Tuple
 
-import pandas as pd
 import typer
 from rich.console import Console
-from rich.progress import BarColumn, Progress, TimeRemainingColumn, TextColumn
 
-from sm1000_tester.models import BenchmarkResult
-from sm1000_tester.ui import PassStatsColumn
-from sm1000_tester.utils import normalize_result
+from sm1000_tester.affinity import CpuPool, select_cpus
+from sm1000_tester.cache import ResultCache
+from sm1000_tester.limits import MemoryLimit
+from sm1000_tester.models import BenchmarkCase, BenchmarkResult, RunMeasurement, split_case_key
+from sm1000_tester.output import OutputParser
+from sm1000_tester.process import ProcessResult, run_process
+from sm1000_tester.results_log import ResultLog
+from sm1000_tester.scheduler import LongestFirstScheduler, shard_cases
+from sm1000_tester.suite import discover_cases, find_manifest, load_manifest, lookup_expected
+from sm1000_tester.timeouts import TimeoutPolicy
+from sm1000_tester.utils import file_sha256, normalize_result, results_match
+
+
+def aggregate_runs(runs: List[RunMeasurement]) -> RunMeasurement:
+    """Combine repeated runs of one case into a single measurement.
+
+    The outcome is that of the last run. The duration, CPU and internal times
+    are the medians of the runs, the peak RSS is their maximum, and the
+    individual wall times are kept in `samples`.
+
+    Args:
+        runs: Runs of the same case (at least one)
+
+    Returns:
+        Aggregated RunMeasurement
+    """
+    if len(runs) == 1:
+        runs[0].samples = [runs[0].duration]
+        return runs[0]
+    return RunMeasurement(
+        outcome=runs[-1].outcome,
+        duration=statistics.median(r.duration for r in runs),
+        peak_rss=max(r.peak_rss for r in runs),
+        user_time=statistics.median(r.user_time for r in runs),
+        sys_time=statistics.median(r.sys_time for r in runs),
+        samples=[r.duration for r in runs],
+        internal_time=(
+            statistics.median(r.internal_time for r in runs)
+            if all(r.internal_time is not None for r in runs) else None
+        ),
+        explored_states=runs[-1].explored_states,
+    )
 
 
 class CynthiaBenchmark:
@@ -25,21 +65,79 @@ class CynthiaBenchmark:
         verbose: bool = False,
         all_failures: bool = False,
         show_paths: bool = False,
+        jobs: int = 1,
+        cache: Optional[ResultCache] = None,
+        timeout_policy: Optional[TimeoutPolicy] = None,
+        scheduler: Optional[LongestFirstScheduler] = None,
+        manifest: Optional[Path] = None,
+        repeat: int = 1,
+        warmup: int = 0,
+        result_log: Optional[ResultLog] = None,
+        resume: bool = False,
+        force_resume: bool = False,
+        shard: Optional[Tuple[int, int]] = None,
+        shard_history: Optional[Dict[str, List[float]]] = None,
+        pin_cpus: bool = False,
+        no_smt_siblings: bool = False,
+        memory_limit: Optional[MemoryLimit] = None,
+        extra_flags: Optional[List[str]] = None,
+        dashboard: bool = False,
+        duration_history: Optional[Dict[str, List[float]]] = None,
     ):
         """Initialize the benchmark runner.
 
         Args:
             app_path: Path to cynthia-app executable
-            benchmark_dir: Path to SMV 1000 benchmark directory
+            benchmark_dir: Root directory of the suite (e.g. SMV 1000)
             verbose: Enable verbose output
             all_failures: Display all failed test cases
             show_paths: Display file paths for failures
+            jobs: Number of cases to run concurrently (0 uses all CPUs)
+            cache: Result cache to reuse unchanged cases from, if any
+            timeout_policy: Per-case timeout budgets (defaults to 60s for all)
+            scheduler: Orders case start times; None keeps the canonical order
+            manifest: Expected results CSV (defaults to benchmark_dir/results.csv)
+            repeat: Number of measured runs per case
+            warmup: Number of discarded runs per case before measuring
+            result_log: JSONL log that each result is streamed to, if any
+            resume: Skip cases already present in `result_log`
+            force_resume: Resume even if `result_log` was written by another
+                binary or with other flags
+            shard: Only run shard i of N, given as (i, N)
+            shard_history: Recorded durations to balance shards by; without
+                them, cases are dealt round-robin
+            pin_cpus: Pin each running case to a CPU of its own; `jobs` is
+                capped at the number of available CPUs
+            no_smt_siblings: With `pin_cpus`, use one hardware thread per
+                physical core and leave its SMT siblings idle
+            memory_limit: Memory limit applied to every cynthia-app process
+            extra_flags: Additional cynthia-app flags (e.g. ['-g'])
+            dashboard: Show a live per-worker dashboard instead of a progress bar
+            duration_history: Recorded durations keyed by case key; the
+                dashboard highlights cases running past their p99
         """
         self.app_path = Path(app_path)
         self.benchmark_dir = Path(benchmark_dir)
         self.verbose = verbose
         self.all_failures = all_failures
         self.show_paths = show_paths
+        self.jobs = jobs if jobs > 0 else (os.cpu_count() or 1)
+        self.cache = cache
+        self.timeout_policy = timeout_policy or TimeoutPolicy()
+        self.scheduler = scheduler
+        self.manifest = find_manifest(self.benchmark_dir, manifest)
+        self.repeat = max(repeat, 1)
+        self.warmup = max(warmup, 0)
+        self.result_log = result_log
+        self.resume = resume
+        self.force_resume = force_resume
+        self.shard = shard
+        self.shard_history = shard_history
+        self.cpu_pool: Optional[CpuPool] = None
+        self.memory_limit = memory_limit
+        self.extra_flags = list(extra_flags or [])
+        self.dashboard = dashboard
+        self.duration_history = duration_history or {}
         self.results: List[BenchmarkResult] = []
         self.console = Console()
 
@@ -49,159 +147,393 @@ class CynthiaBenchmark:
         if not self.benchmark_dir.exists():
             raise typer.BadParameter(f"Benchmark directory not found: {self.benchmark_dir}")
 
+        if pin_cpus:
+            self.cpu_pool = CpuPool(select_cpus(no_smt_siblings))
+            if self.jobs > len(self.cpu_pool.cpus):
+                self.console.print(
+                    f"[yellow]Only {len(self.cpu_pool.cpus)} CPUs to pin to; "
+                    f"running {len(self.cpu_pool.cpus)} jobs instead of {self.jobs}[/yellow]"
+                )
+                self.jobs = len(self.cpu_pool.cpus)
+
+    @property
+    def app_flags(self) -> List[str]:
+        """Command-line flags passed to cynthia-app besides the input files."""
+        flags = ["-n", *self.extra_flags]
+        if self.verbose:
+            flags.append("-v")
+        return flags
+
     def run_cynthia(
-        self, formula_file: Path, partition_file: Path
-    ) -> tuple[str, float]:
-        """Run Cynthia on a single formula and return result with timing.
+        self,
+        formula_file: Path,
+        partition_file: Path,
+        timeout: float = 60.0,
+        cpu: Optional[int] = None,
+    ) -> RunMeasurement:
+        """Run Cynthia on a single formula and return result with measurements.
 
         Args:
             formula_file: Path to the .ltlf formula file
             partition_file: Path to the .part partition file
+            timeout: Wall-clock budget in seconds
+            cpu: CPU to pin the process to, if any
 
         Returns:
-            Tuple of (result_string, duration_seconds)
+            RunMeasurement with the outcome, wall time and resource usage
         """
-        start_time = time.time()
+        start_time = time.perf_counter()
 
         cmd = [
             str(self.app_path),
             "-f", str(formula_file),
             "--part", str(partition_file),
-            "-n",
+            *self.app_flags,
         ]
 
-        if self.verbose:
-            cmd.append("-v")
-
+        parser = OutputParser()
         try:
-            result = subprocess.run(
-                cmd,
-                capture_output=True,
-                text=True,
-                timeout=60,
+            result = run_process(
+                cmd, timeout=timeout, cpu=cpu, memory=self.memory_limit, on_lines=parser.feed
             )
+        except Exception as e:
+            return RunMeasurement(outcome=f"Error: {e}", duration=time.perf_counter() - start_time)
 
-            # Parse output to determine realizability
-            # Check for "NOT REALIZABLE" or "UNREALIZABLE" FIRST to avoid
-            # matching "REALIZABLE" in "NOT REALIZABLE"
-            output = result.stdout + result.stderr
-            output_upper = output.upper()
-            if "UNREALIZABLE" in output_upper or "NOT REALIZABLE" in output_upper:
-                outcome = "Unrealizable"
-            elif "REALIZABLE" in output_upper:
-                outcome = "Realizable"
-            else:
-                outcome = "Unknown"
-        except subprocess.TimeoutExpired:
+        if result.timed_out:
             outcome = "Timeout"
-        except Exception as e:
-            outcome = f"Error: {e}"
+        elif self.is_memout(result, parser):
+            outcome = "MemOut"
+        else:
+            outcome = parser.outcome(result.output)
+
+        return RunMeasurement(
+            outcome=outcome,
+            duration=result.duration,
+            peak_rss=result.peak_rss,
+            user_time=result.user_time,
+            sys_time=result.sys_time,
+            internal_time=parser.internal_time,
+            explored_states=parser.explored_states,
+        )
+
+    def is_memout(self, result: ProcessResult, parser: OutputParser) -> bool:
+        """Check whether a run failed for lack of memory.
+
+        That is the case if the OOM killer fired in its cgroup, if it
+        reported a failed allocation, or if it was killed by SIGKILL or
+        SIGABRT while a memory limit was in effect.
+        """
+        if result.oom_killed or parser.memout:
+            return True
+        return self.memory_limit is not None and result.returncode in (
+            -signal.SIGKILL,
+            -signal.SIGABRT,
+        )
 
-        duration = time.time() - start_time
-        return outcome, duration
+    def measure(
+        self,
+        formula_file: Path,
+        partition_file: Path,
+        timeout: float,
+        cpu: Optional[int] = None,
+    ) -> RunMeasurement:
+        """Run Cynthia `warmup` + `repeat` times and aggregate the measured runs.
 
-    def load_expected_results(self) -> pd.DataFrame:
-        """Load expected results from CSV file.
+        The measured runs are combined with aggregate_runs. A run that does not reach a verdict ends the
+        series, and its outcome is reported, so a hanging case is not retried.
+
+        Args:
+            formula_file: Path to the .ltlf formula file
+            partition_file: Path to the .part partition file
+            timeout: Wall-clock budget in seconds of each run
+            cpu: CPU to pin the processes to, if any
 
         Returns:
-            DataFrame with normalized column names
+            Aggregated RunMeasurement, with the individual wall times in `samples`
         """
-        csv_path = self.benchmark_dir / "results.csv"
-        if not csv_path.exists():
-            raise typer.BadParameter(f"Results CSV not found: {csv_path}")
+        for _ in range(self.warmup):
+            warmup_run = self.run_cynthia(formula_file, partition_file, timeout, cpu)
+            if normalize_result(warmup_run.outcome) not in ("realizable", "unrealizable"):
+                return warmup_run
 
-        df = pd.read_csv(csv_path)
-        # Normalize column names
-        df.columns = df.columns.str.strip().str.lower()
-        return df
+        runs = []
+        for _ in range(self.repeat):
+            run = self.run_cynthia(formula_file, partition_file, timeout, cpu)
+            runs.append(run)
+            if normalize_result(run.outcome) not in ("realizable", "unrealizable"):
+                break
 
-    def run_smv1000(self) -> List[BenchmarkResult]:
-        """Run the complete SMV 1000 benchmark suite.
+        return aggregate_runs(runs)
+
+    def load_expected_map(self) -> Dict[str, str]:
+        """Load expected results from the suite manifest.
+
+        Returns:
+            Dict mapping case keys to expected result strings (empty if the
+            suite has no manifest)
+        """
+        if self.manifest is None:
+            return {}
+        return load_manifest(self.manifest)
+
+    def collect_cases(self) -> List[BenchmarkCase]:
+        """Discover all cases of the suite in their canonical order.
 
         Returns:
-            List of benchmark results
+            List of cases whose formula and partition files both exist
         """
-        df = self.load_expected_results()
-
-        # Build lookup dict for expected results
-        expected_map = {}
-        for _, row in df.iterrows():
-            folder = row.get("folder", row.get("folder", ""))
-            filename = row.get("filename", row.get("filename", ""))
-            result = row.get("result", row.get("result", ""))
-            key = f"{folder}/{filename}"
-            expected_map[key] = result
-
-        total_tests = 1000
-        results = []
-
-        with Progress(
-            TextColumn("[progress.description]{task.description}"),
-            BarColumn(),
-            PassStatsColumn(),
-            TextColumn("[progress.percentage]{task.percentage:>3.0f}%"),
-            TimeRemainingColumn(),
-            console=self.console,
-        ) as progress:
-            task = progress.add_task(
-                "[cyan]Running SMV 1000 benchmark...",
-                total=total_tests,
+        cases = discover_cases(self.benchmark_dir)
+        if not cases:
+            self.console.print(
+                f"[yellow]Warning: no .ltlf/.part pairs found in {self.benchmark_dir}[/yellow]"
             )
+        return cases
 
-            # Process bench1 and bench2
-            for bench_name in ["bench1", "bench2"]:
-                bench_dir = self.benchmark_dir / bench_name
-                if not bench_dir.exists():
-                    self.console.print(
-                        f"[yellow]Warning: {bench_dir} not found, skipping...[/yellow]"
+    def run_case(
+        self,
+        case: BenchmarkCase,
+        expected_map: Dict[str, str],
+        timeout: Optional[float] = None,
+    ) -> BenchmarkResult:
+        """Run Cynthia on a single case and compare with the expected result.
+
+        Args:
+            case: The benchmark case to run
+            expected_map: Expected results keyed by case key
+            timeout: Budget in seconds, overriding the timeout policy
+
+        Returns:
+            BenchmarkResult for the case
+        """
+        measurement = None
+        cache_key = None
+        if self.cache is not None:
+            cache_key = self.cache.key_for(case, self.app_flags)
+            measurement = self.cache.get(cache_key, self.repeat, self.warmup)
+        cached = measurement is not None
+        if timeout is None:
+            timeout = self.timeout_policy.budget_for(case.key)
+        cpu = None
+        if measurement is None:
+            if self.cpu_pool is not None:
+                with self.cpu_pool.acquire() as cpu:
+                    measurement = self.measure(
+                        case.formula_file, case.partition_file, timeout, cpu
                     )
-                    continue
-
-                for i in range(1, 501):
-                    formula_file = bench_dir / f"f{i}.ltlf"
-                    partition_file = bench_dir / f"f{i}.part"
-
-                    if not formula_file.exists() or not partition_file.exists():
-                        self.console.print(
-                            f"[yellow]Warning: {formula_file.name} or {partition_file.name} "
-                            f"not found, skipping...[/yellow]"
-                        )
-                        continue
-
-                    # Run Cynthia
-                    actual, duration = self.run_cynthia(formula_file, partition_file)
-
-                    # Get expected result
-                    key = f"{bench_name}/f{i}"
-                    expected = expected_map.get(key, "Unknown")
-
-                    # Normalize results for comparison
-                    expected_normalized = normalize_result(expected)
-                    actual_normalized = normalize_result(actual)
-                    matched = expected_normalized == actual_normalized
-
-                    results.append(BenchmarkResult(
-                        folder=bench_name,
-                        filename=f"f{i}",
-                        expected=expected,
-                        actual=actual,
-                        matched=matched,
-                        duration=duration,
-                    ))
-
-                    # Update pass statistics
-                    passed = sum(1 for r in results if r.matched)
-                    total_tested = len(results)
-                    progress.update(task, advance=1, passed=passed, total_tested=total_tested)
+            else:
+                measurement = self.measure(case.formula_file, case.partition_file, timeout)
+            if cache_key is not None:
+                self.cache.put(cache_key, measurement, self.warmup)
+
+        expected = expected_map.get(case.key, "Unknown")
+        matched = results_match(expected, measurement.outcome)
 
+        return BenchmarkResult(
+            folder=case.folder,
+            filename=case.filename,
+            expected=expected,
+            actual=measurement.outcome,
+            matched=matched,
+            duration=measurement.duration,
+            peak_rss=measurement.peak_rss,
+            user_time=measurement.user_time,
+            sys_time=measurement.sys_time,
+            cached=cached,
+            timeout=timeout,
+            samples=measurement.samples,
+            cpu=cpu,
+            internal_time=measurement.internal_time,
+            explored_states=measurement.explored_states,
+        )
+
+    def run_cases(
+        self, cases: List[BenchmarkCase], expected_map: Dict[str, str]
+    ) -> List[BenchmarkResult]:
+        """Run a list of cases on a pool of `self.jobs` workers.
+
+        Each worker drives one cynthia-app process at a time, and cases are
+        started in the scheduler's order. Each result is written to the result
+        log as soon as it completes. Results are returned in the order of
+        `cases`, regardless of start or completion order.
+
+        Args:
+            cases: Cases to run
+            expected_map: Expected results keyed by case key
+
+        Returns:
+            List of benchmark results, one per case
+        """
+        from rich.live import Live
+        from rich.progress import BarColumn, Progress, TimeRemainingColumn, TextColumn
+
+        from sm1000_tester.ui import Dashboard, PassStatsColumn
+
+        results: List[Optional[BenchmarkResult]] = [None] * len(cases)
+        passed = 0
+        if self.scheduler is not None:
+            order = self.scheduler.order(cases)
+        else:
+            order = list(range(len(cases)))
+
+        title = f"Running {self.benchmark_dir.name} benchmark ({self.jobs} jobs)..."
+        dashboard = None
+        if self.dashboard:
+            dashboard = Dashboard(
+                total=len(cases),
+                jobs=self.jobs,
+                title=title,
+                history=self.duration_history,
+                runs_per_case=self.warmup + self.repeat,
+            )
+            display = Live(dashboard, console=self.console, refresh_per_second=4)
+        else:
+            display = Progress(
+                TextColumn("[progress.description]{task.description}"),
+                BarColumn(),
+                PassStatsColumn(),
+                TextColumn("[progress.percentage]{task.percentage:>3.0f}%"),
+                TimeRemainingColumn(),
+                console=self.console,
+            )
+
+        def run_tracked(case: BenchmarkCase) -> BenchmarkResult:
+            if dashboard is not None:
+                dashboard.case_started(case.key)
+            return self.run_case(case, expected_map)
+
+        with display:
+            if dashboard is None:
+                task = display.add_task(f"[cyan]{title}", total=len(cases))
+
+            with ThreadPoolExecutor(max_workers=self.jobs) as executor:
+                # The executor's queue is FIFO, so submission order is start order
+                futures = {executor.submit(run_tracked, cases[index]): index for index in order}
+                try:
+                    for completed, future in enumerate(as_completed(futures), start=1):
+                        result = future.result()
+                        results[futures[future]] = result
+                        if self.result_log is not None:
+                            self.result_log.append(result)
+                        if dashboard is not None:
+                            dashboard.case_finished(result)
+                            continue
+                        if result.matched:
+                            passed += 1
+                        display.update(task, advance=1, passed=passed, total_tested=completed)
+                except KeyboardInterrupt:
+                    # Drop queued cases; running ones finish on their own
+                    for future in futures:
+                        future.cancel()
+                    raise
+
+        return [r for r in results if r is not None]
+
+    def select_shard(self, cases: List[BenchmarkCase]) -> List[BenchmarkCase]:
+        """Restrict cases to this runner's shard.
+
+        Args:
+            cases: All cases of the suite, in canonical order
+
+        Returns:
+            The cases of shard `self.shard`
+        """
+        index, count = self.shard
+        costs = None
+        if self.shard_history:
+            costs = LongestFirstScheduler(self.shard_history).expected_costs(cases)
+        selected = shard_cases(cases, index, count, costs)
+        self.console.print(
+            f"[dim]Shard {index}/{count}: {len(selected)} of {len(cases)} cases"
+            f"{' (balanced by recorded durations)' if costs else ''}[/dim]"
+        )
+        return selected
+
+    def check_resumable(self, app_hash: str) -> None:
+        """Check that the result log was written by this binary and flags.
+
+        Args:
+            app_hash: SHA-256 of the cynthia-app binary of this run
+
+        Raises:
+            typer.BadParameter: If the log's binary or flags differ from this
+                run's (or the log has no run record), unless `force_resume`
+        """
+        if self.force_resume or not self.result_log.path.exists():
+            return
+        header = self.result_log.read_header()
+        if header is None:
+            reason = "has no run record"
+        elif header.get("app_hash") != app_hash:
+            reason = "was written by a different cynthia-app binary"
+        elif list(header.get("flags", [])) != self.app_flags:
+            reason = (
+                f"was written with flags {' '.join(header.get('flags', []))!r}, "
+                f"not {' '.join(self.app_flags)!r}"
+            )
+        else:
+            return
+        raise typer.BadParameter(
+            f"{self.result_log.path} {reason}; resuming would mix their results. "
+            f"Use a new --log, or --force to resume anyway"
+        )
+
+    def run_suite(self) -> List[BenchmarkResult]:
+        """Run every case discovered under the benchmark directory.
+
+        Returns:
+            List of benchmark results, in canonical case order
+        """
+        expected_map = self.load_expected_map()
+        cases = self.collect_cases()
+        if self.shard is not None:
+            cases = self.select_shard(cases)
+
+        app_hash = file_sha256(self.app_path)
+        done: Dict[str, BenchmarkResult] = {}
+        if self.result_log is not None and self.resume:
+            self.check_resumable(app_hash)
+            done = {f"{r.folder}/{r.filename}": r for r in self.result_log.load()}
+            for result in done.values():
+                result.resumed = True
+            if done:
+                self.console.print(
+                    f"[dim]Resuming: {len(done)} case(s) already in {self.result_log.path}[/dim]"
+                )
+        if self.result_log is not None:
+            self.result_log.open(app_hash, self.app_flags, resume=self.resume)
+
+        try:
+            pending = [case for case in cases if case.key not in done]
+            new_results = {
+                f"{r.folder}/{r.filename}": r for r in self.run_cases(pending, expected_map)
+            }
+        finally:
+            if self.result_log is not None:
+                self.result_log.close()
+
+        results = [
+            done[case.key] if case.key in done else new_results[case.key]
+            for case in cases
+            if case.key in done or case.key in new_results
+        ]
         self.results = results
         return results
 
+    def run_smv1000(self) -> List[BenchmarkResult]:
+        """Run the complete SMV 1000 benchmark suite.
+
+        Returns:
+            List of benchmark results, in bench1/f1..bench2/f500 order
+        """
+        return self.run_suite()
+
     def run_single_test(self, test_case: str) -> BenchmarkResult:
         """Run a single test case.
 
         Args:
-            test_case: Test case identifier in format "bench1/f7" or "bench2/f123"
+            test_case: Test case identifier 'folder/filename', relative to the
+                benchmark directory (e.g. "bench1/f7" or "Patterns/GFand/gfand_3";
+                just "f7" for a case at the root)
 
         Returns:
             BenchmarkResult for the single test
@@ -210,24 +542,12 @@ class CynthiaBenchmark:
             typer.BadParameter: If test case format is invalid or files don't exist
         """
         # Parse test case identifier
-        parts = test_case.split("/")
-        if len(parts) != 2:
+        folder, filename = split_case_key(test_case)
+        if not filename:
             raise typer.BadParameter(
                 f"Invalid test case format: '{test_case}'. Expected format: 'bench1/f7' or 'bench2/f123'"
             )
 
-        folder, filename = parts
-        if folder not in ["bench1", "bench2"]:
-            raise typer.BadParameter(
-                f"Invalid folder: '{folder}'. Must be 'bench1' or 'bench2'"
-            )
-
-        # Verify filename format
-        if not filename.startswith("f") or not filename[1:].isdigit():
-            raise typer.BadParameter(
-                f"Invalid filename: '{filename}'. Must be in format 'f<number>' (e.g., 'f7', 'f123')"
-            )
-
         # Build file paths
         bench_dir = self.benchmark_dir / folder
         formula_file = bench_dir / f"{filename}.ltlf"
@@ -247,32 +567,11 @@ class CynthiaBenchmark:
                 f"Partition file not found: {partition_file}"
             )
 
-        # Load expected result from CSV
-        df = self.load_expected_results()
-        expected_map = {}
-        for _, row in df.iterrows():
-            folder_name = row.get("folder", "")
-            file_name = row.get("filename", "")
-            result = row.get("result", "")
-            key = f"{folder_name}/{file_name}"
-            expected_map[key] = result
-
-        key = f"{folder}/{filename}"
-        expected = expected_map.get(key, "Unknown")
-
-        # Run Cynthia
-        actual, duration = self.run_cynthia(formula_file, partition_file)
-
-        # Normalize results for comparison
-        expected_normalized = normalize_result(expected)
-        actual_normalized = normalize_result(actual)
-        matched = expected_normalized == actual_normalized
-
-        return BenchmarkResult(
+        case = BenchmarkCase(
             folder=folder,
             filename=filename,
-            expected=expected,
-            actual=actual,
-            matched=matched,
-            duration=duration,
+            formula_file=formula_file,
+            partition_file=partition_file,
         )
+        expected = lookup_expected(self.manifest, case.key) if self.manifest is not None else None
+        return self.run_case(case, {case.key: expected} if expected is not None else {})
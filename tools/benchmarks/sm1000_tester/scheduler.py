@@ -0,0 +1,124 @@
+"""Ordering of benchmark cases for parallel execution."""
+
+import statistics
+from enum import Enum
+from typing import Dict, List, Optional, Sequence, Tuple
+
+import typer
+
+from sm1000_tester.models import BenchmarkCase
+
+
+class Schedule(str, Enum):
+    """Order in which cases are started."""
+
+    fixed = "fixed"
+    longest_first = "longest-first"
+
+
+class LongestFirstScheduler:
+    """Start the most expensive cases first to shorten the makespan.
+
+    A case's expected cost is the median of its recorded durations. Cases
+    without history are estimated from their formula size: relative to the
+    known cases when there are any (median known cost scaled by size over
+    median known size), or by the size alone otherwise.
+    """
+
+    def __init__(self, history: Dict[str, List[float]]):
+        """Initialize the scheduler.
+
+        Args:
+            history: Recorded durations keyed by case key (e.g. 'bench1/f7')
+        """
+        self.history = history
+
+    def expected_costs(self, cases: Sequence[BenchmarkCase]) -> Dict[str, float]:
+        """Estimate the cost of each case.
+
+        Args:
+            cases: Cases to estimate
+
+        Returns:
+            Dict mapping case keys to expected cost (seconds when history exists)
+        """
+        sizes = {case.key: max(case.formula_file.stat().st_size, 1) for case in cases}
+        costs = {
+            case.key: statistics.median(self.history[case.key])
+            for case in cases
+            if self.history.get(case.key)
+        }
+
+        if costs:
+            seconds_per_byte = statistics.median(costs.values()) / statistics.median(
+                sizes[key] for key in costs
+            )
+        else:
+            seconds_per_byte = 1.0
+
+        for case in cases:
+            if case.key not in costs:
+                costs[case.key] = sizes[case.key] * seconds_per_byte
+        return costs
+
+    def order(self, cases: Sequence[BenchmarkCase]) -> List[int]:
+        """Return case indices sorted by decreasing expected cost.
+
+        Ties keep their original relative order, so the schedule is
+        deterministic.
+        """
+        costs = self.expected_costs(cases)
+        return sorted(range(len(cases)), key=lambda i: -costs[cases[i].key])
+
+
+def parse_shard(spec: str) -> Tuple[int, int]:
+    """Parse a shard specification such as '2/4'.
+
+    Args:
+        spec: 'i/N' with 1 <= i <= N
+
+    Returns:
+        (i, N)
+
+    Raises:
+        typer.BadParameter: If the specification is malformed
+    """
+    index, _, count = spec.partition("/")
+    if not index.isdigit() or not count.isdigit() or not 1 <= int(index) <= int(count):
+        raise typer.BadParameter(f"Invalid shard '{spec}'. Expected i/N with 1 <= i <= N")
+    return int(index), int(count)
+
+
+def shard_cases(
+    cases: Sequence[BenchmarkCase],
+    index: int,
+    count: int,
+    costs: Optional[Dict[str, float]] = None,
+) -> List[BenchmarkCase]:
+    """Select the cases of one shard out of `count`.
+
+    The partition only depends on the cases and the costs, so every shard
+    computed from the same inputs is disjoint from the others and together
+    they cover all cases. With costs, cases are assigned greedily, most
+    expensive first, to the shard with the smallest total so far (LPT);
+    without, they are dealt round-robin.
+
+    Args:
+        cases: All cases, in canonical order
+        index: Shard to select, from 1 to `count`
+        count: Number of shards
+        costs: Expected cost per case key, to balance shards by
+
+    Returns:
+        The cases of shard `index`, in canonical order
+    """
+    if costs is None:
+        return [case for i, case in enumerate(cases) if i % count == index - 1]
+
+    loads = [0.0] * count
+    assignment = [0] * len(cases)
+    for i in sorted(range(len(cases)), key=lambda i: -costs[cases[i].key]):
+        shard = min(range(count), key=lambda s: loads[s])
+        loads[shard] += costs[cases[i].key]
+        assignment[i] = shard
+    return [case for i, case in enumerate(cases) if assignment[i] == index - 1]
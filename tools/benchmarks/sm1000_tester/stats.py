@@ -0,0 +1,139 @@
+"""Statistics helpers for comparing benchmark timings.
+
+Implemented with the standard library only, so that the tester does not
+depend on scipy or numpy.
+"""
+
+import math
+import random
+import statistics
+from typing import List, Sequence, Tuple
+
+from sm1000_tester.models import TimingStats
+from sm1000_tester.utils import percentile
+
+
+def timing_stats(samples: Sequence[float]) -> TimingStats:
+    """Summarize repeated timing samples.
+
+    Args:
+        samples: Wall-time samples in seconds (at least one)
+
+    Returns:
+        TimingStats with median, minimum, interquartile range and coefficient
+        of variation (sample standard deviation over mean; 0 for one sample)
+    """
+    mean = statistics.fmean(samples)
+    stdev = statistics.stdev(samples) if len(samples) > 1 else 0.0
+    return TimingStats(
+        samples=len(samples),
+        median=statistics.median(samples),
+        minimum=min(samples),
+        iqr=percentile(samples, 75) - percentile(samples, 25),
+        cv=stdev / mean if mean > 0 else 0.0,
+    )
+
+
+def geometric_mean(values: Sequence[float]) -> float:
+    """Compute the geometric mean of positive values (1.0 for an empty sample)."""
+    if not values:
+        return 1.0
+    return math.exp(sum(math.log(v) for v in values) / len(values))
+
+
+def bootstrap_geomean_ci(
+    ratios: Sequence[float],
+    confidence: float = 0.95,
+    resamples: int = 2000,
+    seed: int = 0,
+) -> Tuple[float, float]:
+    """Bootstrap a confidence interval for the geometric mean of ratios.
+
+    The resampling uses a fixed seed, so the interval is reproducible.
+
+    Args:
+        ratios: Positive per-case ratios
+        confidence: Confidence level of the interval
+        resamples: Number of bootstrap resamples
+        seed: Seed of the random generator
+
+    Returns:
+        (low, high) bounds of the interval
+    """
+    if not ratios:
+        return 1.0, 1.0
+    logs = [math.log(r) for r in ratios]
+    n = len(logs)
+    rng = random.Random(seed)
+    means = sorted(sum(rng.choices(logs, k=n)) / n for _ in range(resamples))
+    alpha = (1 - confidence) / 2
+    low = means[int(alpha * (resamples - 1))]
+    high = means[int((1 - alpha) * (resamples - 1))]
+    return math.exp(low), math.exp(high)
+
+
+def _ranks(values: Sequence[float]) -> List[float]:
+    """Rank values from 1, giving tied values their average rank."""
+    order = sorted(range(len(values)), key=lambda i: values[i])
+    ranks = [0.0] * len(values)
+    i = 0
+    while i < len(order):
+        j = i
+        while j + 1 < len(order) and values[order[j + 1]] == values[order[i]]:
+            j += 1
+        for k in range(i, j + 1):
+            ranks[order[k]] = (i + j) / 2 + 1
+        i = j + 1
+    return ranks
+
+
+def _normal_sf(z: float) -> float:
+    """Survival function of the standard normal distribution."""
+    return 0.5 * math.erfc(z / math.sqrt(2))
+
+
+def wilcoxon_signed_rank(differences: Sequence[float]) -> float:
+    """Two-sided Wilcoxon signed-rank test that the differences are centred on 0.
+
+    Zero differences are discarded. The exact null distribution is used for
+    small samples without ties, the normal approximation (with tie
+    correction) otherwise.
+
+    Args:
+        differences: Paired differences (e.g. log candidate - log baseline)
+
+    Returns:
+        The two-sided p-value (1.0 when there is nothing to test)
+    """
+    diffs = [d for d in differences if d != 0]
+    n = len(diffs)
+    if n == 0:
+        return 1.0
+
+    abs_diffs = [abs(d) for d in diffs]
+    ranks = _ranks(abs_diffs)
+    w_plus = sum(r for r, d in zip(ranks, diffs) if d > 0)
+    has_ties = len(set(abs_diffs)) < n
+
+    if n <= 30 and not has_ties:
+        # counts[s] = number of subsets of {1..n} whose sum is s
+        max_sum = n * (n + 1) // 2
+        counts = [1] + [0] * max_sum
+        for k in range(1, n + 1):
+            for s in range(max_sum, k - 1, -1):
+                counts[s] += counts[s - k]
+        w = int(min(w_plus, max_sum - w_plus))
+        tail = sum(counts[: w + 1]) / 2 ** n
+        return min(1.0, 2 * tail)
+
+    mean = n * (n + 1) / 4
+    tie_groups = {}
+    for value in abs_diffs:
+        tie_groups[value] = tie_groups.get(value, 0) + 1
+    tie_correction = sum(t ** 3 - t for t in tie_groups.values()) / 48
+    variance = n * (n + 1) * (2 * n + 1) / 24 - tie_correction
+    if variance <= 0:
+        return 1.0
+    # Continuity correction towards the mean
+    z = (abs(w_plus - mean) - 0.5) / math.sqrt(variance)
+    return min(1.0, 2 * _normal_sf(max(z, 0.0)))
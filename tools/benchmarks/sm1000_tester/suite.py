@@ -0,0 +1,128 @@
+"""Discovery of benchmark cases and their expected results."""
+
+import csv
+import re
+from pathlib import Path
+from typing import Dict, Iterator, List, Optional, Tuple
+
+import typer
+
+from sm1000_tester.models import BenchmarkCase
+
+
+MANIFEST_NAME = "results.csv"
+
+
+def natural_key(text: str) -> Tuple:
+    """Sort key that orders embedded numbers numerically ('f2' < 'f10')."""
+    return tuple(int(part) if part.isdigit() else part for part in re.split(r"(\d+)", text))
+
+
+def discover_cases(root: Path) -> List[BenchmarkCase]:
+    """Find all .ltlf/.part pairs under a directory tree.
+
+    A case's folder is the path of its directory relative to `root` (e.g.
+    'bench1' or 'Patterns/GFand', empty at the root), and its filename is the
+    file stem. Formula
+    files without a partition file next to them are skipped.
+
+    Args:
+        root: Root directory of the suite
+
+    Returns:
+        Cases in natural order of folder, then filename
+    """
+    root = Path(root)
+    cases = []
+    for formula_file in root.rglob("*.ltlf"):
+        partition_file = formula_file.with_suffix(".part")
+        if not partition_file.exists():
+            continue
+        folder = formula_file.parent.relative_to(root).as_posix()
+        if folder == ".":
+            folder = ""
+        cases.append(BenchmarkCase(
+            folder=folder,
+            filename=formula_file.stem,
+            formula_file=formula_file,
+            partition_file=partition_file,
+        ))
+    cases.sort(key=lambda c: (natural_key(c.folder), natural_key(c.filename)))
+    return cases
+
+
+def _manifest_rows(path: Path) -> Iterator[Tuple[str, str]]:
+    """Stream (case key, expected result) pairs from a manifest CSV."""
+    if not path.exists():
+        raise typer.BadParameter(f"Results CSV not found: {path}")
+
+    with open(path, newline="", encoding="utf-8-sig") as f:
+        reader = csv.reader(f)
+        header = next(reader, [])
+        # Normalize column names
+        columns = {name.strip().lower(): i for i, name in enumerate(header)}
+        indices = [columns.get(name) for name in ("folder", "filename", "result")]
+
+        for row in reader:
+            if not row:
+                continue
+            folder, filename, result = (
+                row[i].strip() if i is not None and i < len(row) else "" for i in indices
+            )
+            yield f"{folder}/{filename}", result
+
+
+def load_manifest(path: Path) -> Dict[str, str]:
+    """Load expected results from a manifest CSV.
+
+    The manifest has Folder, Filename and Result columns (case-insensitive),
+    like benchmarks/sm1000/results.csv. Folder is relative to the suite root.
+
+    Args:
+        path: Path to the manifest
+
+    Returns:
+        Dict mapping case keys (e.g. 'bench1/f7') to expected result strings
+
+    Raises:
+        typer.BadParameter: If the manifest does not exist
+    """
+    return dict(_manifest_rows(path))
+
+
+def lookup_expected(path: Path, key: str) -> Optional[str]:
+    """Find the expected result of a single case in a manifest CSV.
+
+    Stops reading at the first matching row, which makes single-case runs
+    cheaper than loading the whole manifest.
+
+    Args:
+        path: Path to the manifest
+        key: Case key (e.g. 'bench1/f7')
+
+    Returns:
+        The expected result string, or None if the case is not listed
+
+    Raises:
+        typer.BadParameter: If the manifest does not exist
+    """
+    for row_key, result in _manifest_rows(path):
+        if row_key == key:
+            return result
+    return None
+
+
+def find_manifest(root: Path, manifest: Optional[Path] = None) -> Optional[Path]:
+    """Resolve the manifest of a suite.
+
+    Args:
+        root: Root directory of the suite
+        manifest: Explicit manifest path, if given
+
+    Returns:
+        The explicit manifest, else `root/results.csv` if it exists, else None
+    """
+    if manifest is not None:
+        return manifest
+    default = Path(root) / MANIFEST_NAME
+    return default if default.exists() else None
@@ -0,0 +1,177 @@
+"""Suite runs over a cartesian product of cynthia-app flag sets."""
+
+import itertools
+import shlex
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from typing import Callable, Dict, List, Optional, Sequence
+
+from sm1000_tester.models import BenchmarkCase, BenchmarkResult, CaseBest, ConfigSummary, Sweep
+from sm1000_tester.runner import CynthiaBenchmark
+from sm1000_tester.stats import geometric_mean
+from sm1000_tester.utils import normalize_result
+
+
+def expand_axes(axes: Sequence[str]) -> List[List[str]]:
+    """Expand flag axes into the cartesian product of their alternatives.
+
+    Each axis is a comma-separated list of alternatives, and an alternative
+    is a (possibly empty) string of flags. For example, the axes
+    ',-g' and '--gc-threshold 0.5,--gc-threshold 0.95' give four
+    configurations: [], ['--gc-threshold', '0.5'], ['-g'], ...
+
+    Args:
+        axes: Axis specifications
+
+    Returns:
+        Distinct flag lists, one per configuration, varying the last axis fastest
+    """
+    alternatives = [[shlex.split(alt) for alt in axis.split(",")] for axis in axes]
+    configs = []
+    for product in itertools.product(*alternatives):
+        flags = [flag for choice in product for flag in choice]
+        if flags not in configs:
+            configs.append(flags)
+    return configs
+
+
+def config_label(flags: Sequence[str]) -> str:
+    """Display name of a configuration ('(default)' for no extra flags)."""
+    return " ".join(flags) or "(default)"
+
+
+def _is_conclusive(result: BenchmarkResult) -> bool:
+    return normalize_result(result.actual) in ("realizable", "unrealizable")
+
+
+def summarize_sweep(
+    configs: Sequence[List[str]],
+    results: Dict[str, List[BenchmarkResult]],
+    min_duration: float = 0.001,
+) -> Sweep:
+    """Compare the configurations of a sweep.
+
+    Ratios and per-case winners only consider cases that every configuration
+    solved, and ratios are relative to the first configuration.
+
+    Args:
+        configs: Flag lists of the configurations, the first being the reference
+        results: Results per configuration label, all in the same case order
+        min_duration: Durations are clamped to at least this many seconds
+
+    Returns:
+        Sweep with per-configuration summaries and per-case winners
+    """
+    labels = [config_label(flags) for flags in configs]
+    reference = labels[0]
+    keys = [f"{r.folder}/{r.filename}" for r in results[reference]]
+
+    cases = []
+    for i, key in enumerate(keys):
+        row = {label: results[label][i] for label in labels}
+        if not all(_is_conclusive(r) for r in row.values()):
+            continue
+        durations = {label: max(r.duration, min_duration) for label, r in row.items()}
+        best = min(labels, key=lambda label: durations[label])
+        cases.append(CaseBest(
+            key=key,
+            best=best,
+            durations=durations,
+            speedup=durations[reference] / durations[best],
+        ))
+
+    summaries = []
+    for label, flags in zip(labels, configs):
+        config_results = results[label]
+        summaries.append(ConfigSummary(
+            label=label,
+            flags=list(flags),
+            passed=sum(1 for r in config_results if r.matched),
+            timeouts=sum(1 for r in config_results if r.actual == "Timeout"),
+            total_duration=sum(r.duration for r in config_results),
+            geomean_ratio=geometric_mean(
+                [c.durations[label] / c.durations[reference] for c in cases]
+            ),
+            wins=sum(1 for c in cases if c.best == label),
+        ))
+    return Sweep(configs=summaries, cases=cases, results=results)
+
+
+class SweepBenchmark:
+    """Run every case of a suite under several flag configurations.
+
+    The configurations of a case are run back to back, so that they see the
+    same machine state, and cases run on the base runner's `jobs` workers.
+    The order of the configurations rotates from case to case, so each of
+    them runs first (and pays the cold start of the case) equally often.
+    """
+
+    def __init__(self, base: CynthiaBenchmark, configs: Sequence[List[str]]):
+        """Initialize the sweep.
+
+        Args:
+            base: Runner whose binary, suite, timeouts and resources are used
+            configs: Extra flags of each configuration
+        """
+        self.base = base
+        self.configs = [list(flags) for flags in configs]
+        self.runners = [self._runner_for(flags) for flags in self.configs]
+
+    def _runner_for(self, flags: List[str]) -> CynthiaBenchmark:
+        runner = CynthiaBenchmark(
+            app_path=self.base.app_path,
+            benchmark_dir=self.base.benchmark_dir,
+            verbose=self.base.verbose,
+            cache=self.base.cache,
+            timeout_policy=self.base.timeout_policy,
+            manifest=self.base.manifest,
+            repeat=self.base.repeat,
+            warmup=self.base.warmup,
+            memory_limit=self.base.memory_limit,
+            extra_flags=flags,
+        )
+        # Share the base runner's CPUs, so that configurations don't overlap
+        runner.cpu_pool = self.base.cpu_pool
+        return runner
+
+    def run(
+        self, progress_callback: Optional[Callable[[int], None]] = None
+    ) -> Dict[str, List[BenchmarkResult]]:
+        """Run all configurations on all cases.
+
+        Args:
+            progress_callback: Called with the number of finished cases
+
+        Returns:
+            Results per configuration label, in canonical case order
+        """
+        expected_map = self.base.load_expected_map()
+        cases = self.base.collect_cases()
+        rows: List[Optional[List[BenchmarkResult]]] = [None] * len(cases)
+
+        def run_case(case: BenchmarkCase, first: int) -> List[BenchmarkResult]:
+            count = len(self.runners)
+            row: List[Optional[BenchmarkResult]] = [None] * count
+            for step in range(count):
+                c = (first + step) % count
+                row[c] = self.runners[c].run_case(case, expected_map)
+            return row
+
+        with ThreadPoolExecutor(max_workers=self.base.jobs) as executor:
+            futures = {
+                executor.submit(run_case, case, i % len(self.runners)): i
+                for i, case in enumerate(cases)
+            }
+            try:
+                for done, future in enumerate(as_completed(futures), start=1):
+                    rows[futures[future]] = future.result()
+                    if progress_callback is not None:
+                        progress_callback(done)
+            except KeyboardInterrupt:
+                for future in futures:
+                    future.cancel()
+                raise
+
+        return {
+            config_label(flags): [row[c] for row in rows if row is not None]
+            for c, flags in enumerate(self.configs)
+        }
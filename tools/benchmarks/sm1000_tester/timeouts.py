@@ -0,0 +1,51 @@
+"""Per-case timeout budgets."""
+
+from typing import Dict, List, Optional
+
+from sm1000_tester.utils import percentile
+
+
+class TimeoutPolicy:
+    """Decide the wall-clock budget of each case.
+
+    Without history, every case gets the default timeout. With history, a
+    case's budget is `factor` times the 95th percentile of its recorded
+    durations, clamped to [floor, ceiling]. Cases without recorded durations
+    fall back to the default.
+    """
+
+    def __init__(
+        self,
+        default: float = 60.0,
+        history: Optional[Dict[str, List[float]]] = None,
+        factor: float = 5.0,
+        floor: float = 1.0,
+        ceiling: Optional[float] = None,
+    ):
+        """Initialize the timeout policy.
+
+        Args:
+            default: Timeout in seconds for cases without history
+            history: Recorded durations keyed by case key, for adaptive budgets
+            factor: Multiplier applied to the historical p95 duration
+            floor: Smallest adaptive budget in seconds
+            ceiling: Largest adaptive budget in seconds (defaults to `default`)
+        """
+        self.default = default
+        self.history = history or {}
+        self.factor = factor
+        self.floor = floor
+        self.ceiling = ceiling if ceiling is not None else default
+
+    @property
+    def adaptive(self) -> bool:
+        """Whether budgets are derived from history."""
+        return bool(self.history)
+
+    def budget_for(self, key: str) -> float:
+        """Return the timeout in seconds for a case key (e.g. 'bench1/f7')."""
+        durations = self.history.get(key)
+        if not durations:
+            return self.default
+        budget = self.factor * percentile(durations, 95)
+        return min(max(budget, self.floor), self.ceiling)
@@ -1,6 +1,7 @@
 """UI components for SMV 1000 benchmark testing."""
 
+from sm1000_tester.ui.dashboard import Dashboard
 from sm1000_tester.ui.progress import PassStatsColumn
 from sm1000_tester.ui.report import ReportGenerator
 
-__all__ = ["PassStatsColumn", "ReportGenerator"]
+__all__ = ["Dashboard", "PassStatsColumn", "ReportGenerator"]
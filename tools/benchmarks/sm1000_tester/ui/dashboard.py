@@ -0,0 +1,200 @@
+"""Live dashboard of a parallel benchmark run."""
+
+import heapq
+import threading
+import time
+from collections import deque
+from typing import Callable, Deque, Dict, List, Optional, Tuple
+
+from rich.console import Group
+from rich.progress_bar import ProgressBar
+from rich.table import Table
+from rich.text import Text
+
+from sm1000_tester.models import BenchmarkResult
+from sm1000_tester.utils import percentile
+
+
+class Dashboard:
+    """Show each worker's current case, the throughput and stalled cases.
+
+    Workers report with `case_started` (from the worker thread) and results
+    with `case_finished`; both only update counters, so the cost per case is
+    constant however long the run. Render it with `rich.live.Live`, which
+    re-renders it periodically so elapsed times keep ticking between events.
+
+    A case is stalled once it has run longer than the 99th percentile of its
+    recorded durations (times the runs made per case, since the elapsed time
+    covers the warmup and repeated runs); such cases are highlighted.
+    """
+
+    def __init__(
+        self,
+        total: int,
+        jobs: int,
+        title: str = "Running benchmark",
+        history: Optional[Dict[str, List[float]]] = None,
+        runs_per_case: int = 1,
+        window: float = 30.0,
+        slowest: int = 5,
+        max_worker_rows: int = 16,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        """Initialize the dashboard.
+
+        Args:
+            total: Number of cases in the run
+            jobs: Number of workers
+            title: Title shown next to the progress bar
+            history: Recorded durations keyed by case key, for stall detection
+            runs_per_case: Runs of cynthia-app per case (warmups + repeats);
+                recorded durations are of a single run
+            window: Seconds of completions the rolling throughput covers
+            slowest: Number of slowest in-flight cases to list
+            max_worker_rows: Workers listed individually; more are summarized
+            clock: Monotonic clock in seconds
+        """
+        self.total = total
+        self.jobs = jobs
+        self.title = title
+        self.history = history or {}
+        self.runs_per_case = max(runs_per_case, 1)
+        self.window = window
+        self.slowest = slowest
+        self.max_worker_rows = max_worker_rows
+        self.clock = clock
+
+        self.completed = 0
+        self.passed = 0
+        self.timeouts = 0
+        self.memouts = 0
+        self.started_at = clock()
+
+        self._completions: Deque[float] = deque()
+        # Worker slot -> (case key, start time, p99 of recorded durations
+        # times runs_per_case)
+        self._running: Dict[int, Tuple[str, float, Optional[float]]] = {}
+        self._slot_of_case: Dict[str, int] = {}
+        self._local = threading.local()
+        self._next_slot = 0
+        self._lock = threading.Lock()
+
+    def case_started(self, key: str) -> None:
+        """Record that the calling worker thread started a case."""
+        durations = self.history.get(key)
+        p99 = percentile(durations, 99) * self.runs_per_case if durations else None
+        with self._lock:
+            slot = getattr(self._local, "slot", None)
+            if slot is None:
+                slot = self._local.slot = self._next_slot
+                self._next_slot += 1
+            self._running[slot] = (key, self.clock(), p99)
+            self._slot_of_case[key] = slot
+
+    def case_finished(self, result: BenchmarkResult) -> None:
+        """Record a finished case."""
+        key = f"{result.folder}/{result.filename}"
+        with self._lock:
+            slot = self._slot_of_case.pop(key, None)
+            if slot is not None and self._running.get(slot, ("",))[0] == key:
+                del self._running[slot]
+            self.completed += 1
+            self.passed += result.matched
+            self.timeouts += result.actual == "Timeout"
+            self.memouts += result.actual == "MemOut"
+            self._completions.append(self.clock())
+
+    def throughput(self) -> float:
+        """Cases completed per second over the last `window` seconds."""
+        now = self.clock()
+        with self._lock:
+            while self._completions and self._completions[0] < now - self.window:
+                self._completions.popleft()
+            count = len(self._completions)
+        span = min(self.window, now - self.started_at)
+        return count / span if span > 0 else 0.0
+
+    def in_flight(self) -> List[Tuple[int, str, float, Optional[float]]]:
+        """Running cases as (worker slot, case key, elapsed seconds, p99)."""
+        now = self.clock()
+        with self._lock:
+            return [
+                (slot, key, now - start, p99)
+                for slot, (key, start, p99) in sorted(self._running.items())
+            ]
+
+    @staticmethod
+    def _is_stalled(elapsed: float, p99: Optional[float]) -> bool:
+        return p99 is not None and elapsed > p99
+
+    def _header(self, rate: float, stalled: int) -> Text:
+        failed = self.completed - self.passed
+        remaining = self.total - self.completed
+        eta = f"{remaining / rate:.0f}s" if rate > 0 else "-"
+        text = Text.assemble(
+            (f"{self.title} ", "cyan"),
+            f"{self.completed}/{self.total}  ",
+            (f"passed {self.passed}", "green"),
+            "  ",
+            (f"failed {failed}", "red" if failed else "dim"),
+            "  ",
+            (f"timeouts {self.timeouts}", "yellow" if self.timeouts else "dim"),
+        )
+        if self.memouts:
+            text.append(f"  memouts {self.memouts}", style="yellow")
+        text.append(f"  {rate:.2f} cases/s  ETA {eta}")
+        if stalled:
+            text.append(f"  {stalled} past p99", style="bold red")
+        return text
+
+    def _p99_title(self) -> str:
+        if self.runs_per_case == 1:
+            return "Recorded p99"
+        return f"Recorded p99 x{self.runs_per_case}"
+
+    def _row(self, key: str, elapsed: float, p99: Optional[float]) -> Tuple[List[str], str]:
+        cells = [key, f"{elapsed:.1f}s", f"{p99:.2f}s" if p99 is not None else "-"]
+        return cells, "bold red" if self._is_stalled(elapsed, p99) else ""
+
+    def __rich__(self) -> Group:
+        running = self.in_flight()
+        rate = self.throughput()
+        stalled = sum(1 for _, _, elapsed, p99 in running if self._is_stalled(elapsed, p99))
+
+        header = Table.grid(padding=(0, 1))
+        header.add_row(
+            ProgressBar(total=max(self.total, 1), completed=self.completed, width=30),
+            self._header(rate, stalled),
+        )
+        parts = [header]
+
+        if self.jobs <= self.max_worker_rows:
+            workers = Table(title="Workers", title_justify="left", expand=False)
+            workers.add_column("Worker", justify="right")
+            workers.add_column("Case")
+            workers.add_column("Elapsed", justify="right")
+            workers.add_column(self._p99_title(), justify="right")
+            by_slot = {slot: (key, elapsed, p99) for slot, key, elapsed, p99 in running}
+            for slot in range(self.jobs):
+                if slot in by_slot:
+                    cells, style = self._row(*by_slot[slot])
+                    workers.add_row(str(slot + 1), *cells, style=style)
+                else:
+                    workers.add_row(str(slot + 1), "idle", "", "", style="dim")
+            parts.append(workers)
+        else:
+            parts.append(Text(f"{len(running)} of {self.jobs} workers busy", style="dim"))
+
+        if self.slowest > 0 and running:
+            slowest = Table(title="Slowest in flight", title_justify="left", expand=False)
+            slowest.add_column("Case")
+            slowest.add_column("Elapsed", justify="right")
+            slowest.add_column(self._p99_title(), justify="right")
+            for _, key, elapsed, p99 in heapq.nlargest(
+                self.slowest, running, key=lambda entry: entry[2]
+            ):
+                cells, style = self._row(key, elapsed, p99)
+                slowest.add_row(*cells, style=style)
+            parts.append(slowest)
+
+        return Group(*parts)
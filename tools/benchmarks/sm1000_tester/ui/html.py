@@ -0,0 +1,354 @@
+"""Self-contained HTML/SVG reports of stored benchmark results.
+
+The report is a single HTML file with inline SVG and CSS: no scripts and no
+network access, so it can be archived as a CI artifact and opened anywhere.
+Plots are reduced to a bounded number of SVG elements (downsampled curves,
+binned scatter plots), so suites with tens of thousands of cases stay light.
+"""
+
+import html
+import math
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Callable, Dict, List, Sequence, Tuple
+
+from sm1000_tester.models import BenchmarkResult
+from sm1000_tester.utils import normalize_result, percentile
+
+
+COLORS = ["#1f77b4", "#d62728", "#2ca02c", "#ff7f0e", "#9467bd", "#8c564b"]
+WIDTH, HEIGHT = 720, 400
+MARGIN_LEFT, MARGIN_RIGHT, MARGIN_TOP, MARGIN_BOTTOM = 70, 20, 20, 50
+MIN_TIME = 0.001
+MAX_CURVE_POINTS = 500
+MAX_SCATTER_POINTS = 2000
+SCATTER_BINS = 60
+
+STYLE = """
+body { font-family: sans-serif; margin: 2em auto; max-width: 800px; color: #222; }
+h1 { font-size: 1.5em; } h2 { font-size: 1.2em; margin-top: 2em; }
+table { border-collapse: collapse; margin: 1em 0; }
+th, td { border: 1px solid #ccc; padding: 4px 10px; text-align: right; }
+th:first-child, td:first-child { text-align: left; }
+svg text { font-size: 11px; fill: #333; }
+.grid { stroke: #e5e5e5; } .axis { stroke: #333; }
+.note { color: #666; font-size: 0.9em; }
+"""
+
+
+def _solved_times(results: Sequence[BenchmarkResult]) -> List[float]:
+    """Sorted wall times of cases solved correctly."""
+    return sorted(
+        max(r.duration, MIN_TIME)
+        for r in results
+        if r.matched and normalize_result(r.actual) in ("realizable", "unrealizable")
+    )
+
+
+def _downsample(points: List[Tuple[float, float]], limit: int) -> List[Tuple[float, float]]:
+    """Keep at most `limit` evenly spaced points, always including the last."""
+    if len(points) <= limit:
+        return points
+    step = len(points) / limit
+    kept = [points[int(i * step)] for i in range(limit)]
+    if kept[-1] != points[-1]:
+        kept.append(points[-1])
+    return kept
+
+
+def _log_scale(low: float, high: float, start: float, end: float) -> Callable[[float], float]:
+    """Map [low, high], widened to whole decades, onto [start, end]."""
+    decades = _decades(low, high)
+    low, high = math.log10(decades[0]), math.log10(decades[-1])
+    return lambda v: start + (math.log10(max(v, decades[0])) - low) / (high - low) * (end - start)
+
+
+def _linear_scale(low: float, high: float, start: float, end: float) -> Callable[[float], float]:
+    span = (high - low) or 1
+    return lambda v: start + (v - low) / span * (end - start)
+
+
+def _decades(low: float, high: float) -> List[float]:
+    """Powers of ten covering [low, high]."""
+    first = math.floor(math.log10(low))
+    last = math.ceil(math.log10(max(high, low * 10)))
+    return [10.0 ** e for e in range(first, last + 1)]
+
+
+def _format_time(seconds: float) -> str:
+    return f"{seconds * 1000:g}ms" if seconds < 1 else f"{seconds:g}s"
+
+
+def _linear_ticks(high: float, count: int = 5) -> List[float]:
+    if high <= 0:
+        return [0.0]
+    raw = high / count
+    magnitude = 10 ** math.floor(math.log10(raw))
+    step = min((m * magnitude for m in (1, 2, 5, 10) if m * magnitude >= raw), default=raw)
+    return [i * step for i in range(int(high / step) + 1)]
+
+
+class _Plot:
+    """An SVG plot area with axes, grid lines and labels."""
+
+    def __init__(self, x_label: str, y_label: str, height: int = HEIGHT):
+        self.height = height
+        self.left, self.right = MARGIN_LEFT, WIDTH - MARGIN_RIGHT
+        self.top, self.bottom = MARGIN_TOP, height - MARGIN_BOTTOM
+        self.elements: List[str] = []
+        self.x_label, self.y_label = x_label, y_label
+
+    def x_ticks(self, ticks: Sequence[float], scale: Callable[[float], float], fmt) -> None:
+        for t in ticks:
+            x = scale(t)
+            self.elements.append(
+                f'<line class="grid" x1="{x:.1f}" y1="{self.top}" x2="{x:.1f}" y2="{self.bottom}"/>'
+                f'<text x="{x:.1f}" y="{self.bottom + 15}" text-anchor="middle">{fmt(t)}</text>'
+            )
+
+    def y_ticks(self, ticks: Sequence[float], scale: Callable[[float], float], fmt) -> None:
+        for t in ticks:
+            y = scale(t)
+            self.elements.append(
+                f'<line class="grid" x1="{self.left}" y1="{y:.1f}" x2="{self.right}" y2="{y:.1f}"/>'
+                f'<text x="{self.left - 5}" y="{y + 4:.1f}" text-anchor="end">{fmt(t)}</text>'
+            )
+
+    def add(self, element: str) -> None:
+        self.elements.append(element)
+
+    def render(self, legend: Sequence[Tuple[str, str]] = ()) -> str:
+        parts = [
+            f'<svg xmlns="http://www.w3.org/2000/svg" width="{WIDTH}" height="{self.height}" '
+            f'viewBox="0 0 {WIDTH} {self.height}">',
+            *self.elements,
+            f'<line class="axis" x1="{self.left}" y1="{self.bottom}" x2="{self.right}" y2="{self.bottom}"/>',
+            f'<line class="axis" x1="{self.left}" y1="{self.top}" x2="{self.left}" y2="{self.bottom}"/>',
+            f'<text x="{(self.left + self.right) / 2}" y="{self.height - 12}" '
+            f'text-anchor="middle">{html.escape(self.x_label)}</text>',
+            f'<text transform="translate(14,{(self.top + self.bottom) / 2}) rotate(-90)" '
+            f'text-anchor="middle">{html.escape(self.y_label)}</text>',
+        ]
+        for i, (label, color) in enumerate(legend):
+            y = self.top + 10 + i * 16
+            parts.append(
+                f'<rect x="{self.left + 10}" y="{y - 8}" width="10" height="10" fill="{color}"/>'
+                f'<text x="{self.left + 25}" y="{y + 1}">{html.escape(label)}</text>'
+            )
+        parts.append("</svg>")
+        return "\n".join(parts)
+
+
+class HtmlReport:
+    """Render stored result sets as a static HTML page."""
+
+    def __init__(self, title: str = "Benchmark Report"):
+        """Initialize the report.
+
+        Args:
+            title: Page title
+        """
+        self.title = title
+
+    def render(self, runs: Dict[str, List[BenchmarkResult]]) -> str:
+        """Render one or more result sets.
+
+        Args:
+            runs: Result sets keyed by label; with two or more, the first two
+                are also compared case by case
+
+        Returns:
+            The HTML document
+        """
+        labels = list(runs)
+        sections = [
+            f"<h1>{html.escape(self.title)}</h1>",
+            f'<p class="note">Generated {datetime.now(timezone.utc):%Y-%m-%d %H:%M} UTC</p>',
+            self._summary_table(runs),
+            "<h2>Cactus Plot</h2>",
+            '<p class="note">Correctly solved instances within a given time per instance.</p>',
+            self._cactus(runs),
+            "<h2>Survival Plot</h2>",
+            '<p class="note">Fraction of all instances solved correctly within a given time.</p>',
+            self._survival(runs),
+        ]
+        for label in labels:
+            sections += [
+                f"<h2>Runtime per Folder: {html.escape(label)}</h2>",
+                '<p class="note">Box: p25-p75 with median; whiskers: p5-p95.</p>',
+                self._folder_boxes(runs[label]),
+            ]
+        if len(labels) >= 2:
+            sections += [
+                f"<h2>Scatter: {html.escape(labels[0])} vs {html.escape(labels[1])}</h2>",
+                '<p class="note">Cases solved by both runs; points below the diagonal '
+                "are faster in the second run. Dashed lines mark 2x.</p>",
+                self._scatter(runs[labels[0]], runs[labels[1]], labels[0], labels[1]),
+            ]
+        return (
+            "<!DOCTYPE html>\n<html><head><meta charset=\"utf-8\">"
+            f"<title>{html.escape(self.title)}</title><style>{STYLE}</style></head><body>\n"
+            + "\n".join(sections)
+            + "\n</body></html>\n"
+        )
+
+    def write(self, path: Path, runs: Dict[str, List[BenchmarkResult]]) -> None:
+        """Render result sets and write the HTML to `path`."""
+        Path(path).write_text(self.render(runs), encoding="utf-8")
+
+    def _summary_table(self, runs: Dict[str, List[BenchmarkResult]]) -> str:
+        rows = []
+        for label, results in runs.items():
+            solved = _solved_times(results)
+            rows.append(
+                f"<tr><td>{html.escape(label)}</td><td>{len(results)}</td>"
+                f"<td>{sum(1 for r in results if r.matched)}</td>"
+                f"<td>{sum(1 for r in results if r.actual == 'Timeout')}</td>"
+                f"<td>{sum(r.duration for r in results):.2f}s</td>"
+                f"<td>{_format_time(percentile(solved, 50)) if solved else '-'}</td></tr>"
+            )
+        return (
+            "<table><tr><th>Run</th><th>Cases</th><th>Passed</th><th>Timeouts</th>"
+            "<th>Total Time</th><th>Median Solved</th></tr>" + "".join(rows) + "</table>"
+        )
+
+    def _time_range(self, runs: Dict[str, List[BenchmarkResult]]) -> Tuple[float, float]:
+        times = [t for results in runs.values() for t in _solved_times(results)]
+        if not times:
+            return MIN_TIME, 1.0
+        return min(times), max(times)
+
+    def _cactus(self, runs: Dict[str, List[BenchmarkResult]]) -> str:
+        plot = _Plot("Solved instances", "Time per instance")
+        low, high = self._time_range(runs)
+        most = max(len(results) for results in runs.values()) or 1
+        x = _linear_scale(0, most, plot.left, plot.right)
+        y = _log_scale(low, high, plot.bottom, plot.top)
+        plot.x_ticks(_linear_ticks(most), x, lambda v: f"{v:g}")
+        plot.y_ticks(_decades(low, high), y, _format_time)
+
+        legend = []
+        for i, (label, results) in enumerate(runs.items()):
+            color = COLORS[i % len(COLORS)]
+            points = _downsample(
+                [(n, t) for n, t in enumerate(_solved_times(results), start=1)], MAX_CURVE_POINTS
+            )
+            path = " ".join(f"{x(n):.1f},{y(t):.1f}" for n, t in points)
+            plot.add(f'<polyline fill="none" stroke="{color}" stroke-width="1.5" points="{path}"/>')
+            legend.append((f"{label} ({len(_solved_times(results))} solved)", color))
+        return plot.render(legend)
+
+    def _survival(self, runs: Dict[str, List[BenchmarkResult]]) -> str:
+        plot = _Plot("Time per instance", "Fraction solved")
+        low, high = self._time_range(runs)
+        x = _log_scale(low, high, plot.left, plot.right)
+        y = _linear_scale(0, 1, plot.bottom, plot.top)
+        plot.x_ticks(_decades(low, high), x, _format_time)
+        plot.y_ticks([i / 5 for i in range(6)], y, lambda v: f"{v:.0%}")
+
+        legend = []
+        for i, (label, results) in enumerate(runs.items()):
+            color = COLORS[i % len(COLORS)]
+            total = len(results) or 1
+            steps = [(low, 0.0)] + [
+                (t, n / total) for n, t in enumerate(_solved_times(results), start=1)
+            ]
+            path = " ".join(f"{x(t):.1f},{y(f):.1f}" for t, f in _downsample(steps, MAX_CURVE_POINTS))
+            plot.add(f'<polyline fill="none" stroke="{color}" stroke-width="1.5" points="{path}"/>')
+            legend.append((label, color))
+        return plot.render(legend)
+
+    def _folder_boxes(self, results: Sequence[BenchmarkResult]) -> str:
+        by_folder: Dict[str, List[float]] = {}
+        for r in results:
+            by_folder.setdefault(r.folder, []).append(max(r.duration, MIN_TIME))
+        if not by_folder:
+            return '<p class="note">No results.</p>'
+
+        row_height = 22
+        height = MARGIN_TOP + MARGIN_BOTTOM + row_height * len(by_folder)
+        plot = _Plot("Wall time (all cases)", "", height=height)
+        plot.left = 160
+        times = [t for ts in by_folder.values() for t in ts]
+        x = _log_scale(min(times), max(times), plot.left, plot.right)
+        plot.x_ticks(_decades(min(times), max(times)), x, _format_time)
+
+        for i, (folder, ts) in enumerate(sorted(by_folder.items())):
+            mid = plot.top + row_height * i + row_height / 2
+            p5, p25, p50, p75, p95 = (percentile(ts, q) for q in (5, 25, 50, 75, 95))
+            plot.add(
+                f'<text x="{plot.left - 5}" y="{mid + 4:.1f}" text-anchor="end">'
+                f"{html.escape(folder)} ({len(ts)})</text>"
+                f'<line stroke="#555" x1="{x(p5):.1f}" y1="{mid:.1f}" x2="{x(p95):.1f}" y2="{mid:.1f}"/>'
+                f'<rect fill="{COLORS[0]}" fill-opacity="0.4" stroke="{COLORS[0]}" '
+                f'x="{x(p25):.1f}" y="{mid - 7:.1f}" width="{max(x(p75) - x(p25), 1):.1f}" height="14"/>'
+                f'<line stroke="#000" stroke-width="2" x1="{x(p50):.1f}" y1="{mid - 7:.1f}" '
+                f'x2="{x(p50):.1f}" y2="{mid + 7:.1f}"/>'
+            )
+        return plot.render()
+
+    def _scatter(
+        self,
+        baseline: Sequence[BenchmarkResult],
+        candidate: Sequence[BenchmarkResult],
+        baseline_label: str,
+        candidate_label: str,
+    ) -> str:
+        conclusive = ("realizable", "unrealizable")
+        cand_map = {f"{r.folder}/{r.filename}": r for r in candidate}
+        pairs = []
+        for base in baseline:
+            cand = cand_map.get(f"{base.folder}/{base.filename}")
+            if (
+                cand is not None
+                and normalize_result(base.actual) in conclusive
+                and normalize_result(cand.actual) in conclusive
+            ):
+                pairs.append((max(base.duration, MIN_TIME), max(cand.duration, MIN_TIME)))
+        if not pairs:
+            return '<p class="note">No cases solved by both runs.</p>'
+
+        height = WIDTH - MARGIN_LEFT - MARGIN_RIGHT + MARGIN_TOP + MARGIN_BOTTOM
+        plot = _Plot(f"{baseline_label} time", f"{candidate_label} time", height=height)
+        low = min(min(p) for p in pairs)
+        high = max(max(p) for p in pairs)
+        x = _log_scale(low, high, plot.left, plot.right)
+        y = _log_scale(low, high, plot.bottom, plot.top)
+        plot.x_ticks(_decades(low, high), x, _format_time)
+        plot.y_ticks(_decades(low, high), y, _format_time)
+
+        lo, hi = _decades(low, high)[0], _decades(low, high)[-1]
+        for factor, dash in ((1, ""), (2, ' stroke-dasharray="4,3"'), (0.5, ' stroke-dasharray="4,3"')):
+            start, end = max(lo, lo / factor), min(hi, hi / factor)
+            plot.add(
+                f'<line stroke="#888"{dash} x1="{x(start):.1f}" y1="{y(start * factor):.1f}" '
+                f'x2="{x(end):.1f}" y2="{y(end * factor):.1f}"/>'
+            )
+
+        if len(pairs) <= MAX_SCATTER_POINTS:
+            for b, c in pairs:
+                color = COLORS[2] if c < b else COLORS[1]
+                plot.add(f'<circle cx="{x(b):.1f}" cy="{y(c):.1f}" r="2.5" fill="{color}" fill-opacity="0.6"/>')
+        else:
+            # Bin into a grid of cells shaded by count, to bound the SVG size
+            cell_w = (plot.right - plot.left) / SCATTER_BINS
+            cell_h = (plot.bottom - plot.top) / SCATTER_BINS
+            counts: Dict[Tuple[int, int], int] = {}
+            for b, c in pairs:
+                i = min(int((x(b) - plot.left) / cell_w), SCATTER_BINS - 1)
+                j = min(int((plot.bottom - y(c)) / cell_h), SCATTER_BINS - 1)
+                counts[(i, j)] = counts.get((i, j), 0) + 1
+            most = max(counts.values())
+            for (i, j), n in counts.items():
+                opacity = 0.15 + 0.85 * math.log1p(n) / math.log1p(most)
+                plot.add(
+                    f'<rect x="{plot.left + i * cell_w:.1f}" y="{plot.bottom - (j + 1) * cell_h:.1f}" '
+                    f'width="{cell_w:.1f}" height="{cell_h:.1f}" fill="{COLORS[0]}" '
+                    f'fill-opacity="{opacity:.2f}"><title>{n} cases</title></rect>'
+                )
+
+        faster = sum(1 for b, c in pairs if c < b)
+        return plot.render([
+            (f"faster in {candidate_label}: {faster}", COLORS[2]),
+            (f"slower or equal: {len(pairs) - faster}", COLORS[1]),
+        ] if len(pairs) <= MAX_SCATTER_POINTS else [(f"{len(pairs)} cases (binned)", COLORS[0])])
@@ -1,13 +1,15 @@
 """Report generation for SMV 1000 benchmark testing."""
 
 from pathlib import Path
-from typing import List
+from typing import Dict, List, Tuple
 
 from rich.console import Console
 from rich.panel import Panel
 from rich.table import Table
 
-from sm1000_tester.models import BenchmarkResult
+from sm1000_tester.models import BenchmarkResult, Comparison, RunRecord, Sweep
+from sm1000_tester.stats import timing_stats
+from sm1000_tester.utils import format_bytes, percentile
 
 
 class ReportGenerator:
@@ -20,6 +22,8 @@ class ReportGenerator:
         verbose: bool = False,
         all_failures: bool = False,
         show_paths: bool = False,
+        suite_name: str = "SMV 1000",
+        max_cv: float = 0.10,
     ):
         """Initialize the report generator.
 
@@ -29,12 +33,17 @@ class ReportGenerator:
             verbose: Whether to show detailed failure information
             all_failures: Whether to show all failures or limit to 20
             show_paths: Whether to show file paths for failures
+            suite_name: Name of the suite shown in report titles
+            max_cv: Coefficient of variation above which repeated timings
+                are marked unreliable
         """
         self.console = console
         self.benchmark_dir = benchmark_dir
         self.verbose = verbose
         self.all_failures = all_failures
         self.show_paths = show_paths
+        self.suite_name = suite_name
+        self.max_cv = max_cv
 
     def print_summary(self, results: List[BenchmarkResult]) -> None:
         """Print benchmark summary.
@@ -53,7 +62,7 @@ class ReportGenerator:
 
         # Summary table
         table = Table(
-            title="SMV 1000 Benchmark Summary",
+            title=f"{self.suite_name} Benchmark Summary",
             show_header=True,
             header_style="bold magenta"
         )
@@ -66,9 +75,31 @@ class ReportGenerator:
         table.add_row("Pass Rate", f"{passed/total*100:.1f}%")
         table.add_row("Total Duration", f"{total_duration:.2f}s")
         table.add_row("Avg Duration", f"{total_duration/total:.3f}s")
+        unchecked = sum(1 for r in results if r.expected == "Unknown")
+        if unchecked:
+            table.add_row("Unchecked (no expected result)", f"[dim]{unchecked}[/dim]")
+        timeouts = sum(1 for r in results if r.actual == "Timeout")
+        if timeouts:
+            table.add_row("Timeouts", f"[yellow]{timeouts}[/yellow]")
+        memouts = sum(1 for r in results if r.actual == "MemOut")
+        if memouts:
+            table.add_row("MemOuts", f"[yellow]{memouts}[/yellow]")
+        cached = sum(1 for r in results if r.cached)
+        if cached:
+            table.add_row("Cached", f"[dim]{cached}[/dim]")
+        searched = [r for r in results if r.explored_states is not None and r.internal_time]
+        internal = sum(r.internal_time for r in searched)
+        if internal > 0:
+            states = sum(r.explored_states for r in searched)
+            table.add_row("Explored States/s", f"{states / internal:,.0f}")
+        pinned = {r.cpu for r in results if r.cpu is not None}
+        if pinned:
+            table.add_row("Pinned CPUs", f"[dim]{len(pinned)}[/dim]")
 
         self.console.print()
         self.console.print(table)
+        self._print_resource_usage(results)
+        self._print_timing_stability(results)
 
         # Show failures if any (only in verbose mode)
         if self.verbose:
@@ -77,6 +108,117 @@ class ReportGenerator:
             self.console.print()
             self.console.print("[yellow]Use -v for detailed failure information[/yellow]")
 
+    def _print_resource_usage(self, results: List[BenchmarkResult]) -> None:
+        """Print totals, maxima and percentiles of per-case resource usage.
+
+        Args:
+            results: List of benchmark results
+        """
+        metrics = [
+            ("Wall Time", [r.duration for r in results], lambda v: f"{v:.3f}s"),
+            ("User CPU", [r.user_time for r in results], lambda v: f"{v:.3f}s"),
+            ("System CPU", [r.sys_time for r in results], lambda v: f"{v:.3f}s"),
+            # Zero where it is not measured (no os.wait4)
+            ("Peak RSS", [r.peak_rss for r in results if r.peak_rss], format_bytes),
+            # Only cases whose output reports the synthesis time
+            (
+                "Internal Time",
+                [r.internal_time for r in results if r.internal_time is not None],
+                lambda v: f"{v:.3f}s",
+            ),
+            (
+                "Overhead",
+                [r.overhead for r in results if r.overhead is not None],
+                lambda v: f"{v:.3f}s",
+            ),
+        ]
+
+        table = Table(
+            title="Resource Usage per Case",
+            show_header=True,
+            header_style="bold magenta"
+        )
+        table.add_column("Metric", style="cyan")
+        for column in ["Total", "Max", "p50", "p90", "p99"]:
+            table.add_column(column, justify="right")
+
+        for name, values, fmt in metrics:
+            if not values:
+                continue
+            # A total peak RSS is meaningless, since cases don't share memory
+            total = "-" if name == "Peak RSS" else fmt(sum(values))
+            table.add_row(
+                name,
+                total,
+                fmt(max(values)),
+                fmt(percentile(values, 50)),
+                fmt(percentile(values, 90)),
+                fmt(percentile(values, 99)),
+            )
+
+        self.console.print()
+        self.console.print(table)
+        unmeasured = sum(1 for r in results if not r.peak_rss)
+        if unmeasured:
+            self.console.print(
+                f"[dim]Peak RSS not measured for {unmeasured} case(s)[/dim]"
+            )
+
+    def _print_timing_stability(self, results: List[BenchmarkResult]) -> None:
+        """Print the spread of repeated timings and flag unreliable cases.
+
+        Only shown when cases were measured more than once.
+
+        Args:
+            results: List of benchmark results
+        """
+        repeated = [(r, timing_stats(r.samples)) for r in results if len(r.samples) > 1]
+        if not repeated:
+            return
+
+        unreliable = [(r, st) for r, st in repeated if st.cv > self.max_cv]
+        cvs = [st.cv for _, st in repeated]
+
+        table = Table(
+            title="Timing Stability (repeated runs)",
+            show_header=True,
+            header_style="bold magenta"
+        )
+        table.add_column("Metric", style="cyan")
+        table.add_column("Value", justify="right")
+        table.add_row("Repeated Cases", str(len(repeated)))
+        table.add_row("Samples per Case", str(max(st.samples for _, st in repeated)))
+        table.add_row("Median CV", f"{percentile(cvs, 50) * 100:.1f}%")
+        table.add_row("p90 CV", f"{percentile(cvs, 90) * 100:.1f}%")
+        table.add_row(
+            f"Unreliable (CV > {self.max_cv * 100:.0f}%)",
+            f"[yellow]{len(unreliable)}[/yellow]" if unreliable else "0",
+        )
+
+        self.console.print()
+        self.console.print(table)
+
+        if self.verbose and unreliable:
+            display = unreliable if self.all_failures else unreliable[:20]
+            case_table = Table(
+                title=f"Unreliable Timings ({len(unreliable)})",
+                show_header=True,
+                header_style="bold magenta",
+            )
+            case_table.add_column("Case", style="yellow")
+            for column in ["Median", "Min", "IQR", "CV"]:
+                case_table.add_column(column, justify="right")
+            for r, st in sorted(display, key=lambda pair: -pair[1].cv):
+                case_table.add_row(
+                    f"{r.folder}/{r.filename}",
+                    f"{st.median:.3f}s",
+                    f"{st.minimum:.3f}s",
+                    f"{st.iqr:.3f}s",
+                    f"{st.cv * 100:.1f}%",
+                )
+            self.console.print()
+            self.console.print(case_table)
+
     def _print_failures(self, results: List[BenchmarkResult]) -> None:
         """Print failure details.
 
@@ -138,7 +280,25 @@ class ReportGenerator:
         table.add_row("Status", status)
         table.add_row("Expected", result.expected)
         table.add_row("Actual", result.actual)
-        table.add_row("Duration", f"{result.duration:.3f}s")
+        table.add_row("Duration", f"{result.duration:.3f}s" + (" (cached)" if result.cached else ""))
+        table.add_row("Timeout", f"{result.timeout:.1f}s")
+        if len(result.samples) > 1:
+            st = timing_stats(result.samples)
+            flag = " [yellow](unreliable)[/yellow]" if st.cv > self.max_cv else ""
+            table.add_row(
+                f"Timing ({st.samples} runs)",
+                f"median {st.median:.3f}s, min {st.minimum:.3f}s, "
+                f"IQR {st.iqr:.3f}s, CV {st.cv * 100:.1f}%{flag}",
+            )
+        if result.internal_time is not None:
+            table.add_row(
+                "Internal Time",
+                f"{result.internal_time:.3f}s (overhead {result.overhead:.3f}s)",
+            )
+        if result.explored_states is not None:
+            table.add_row("Explored States", f"{result.explored_states:,}")
+        table.add_row("CPU (user/sys)", f"{result.user_time:.3f}s / {result.sys_time:.3f}s")
+        table.add_row("Peak RSS", format_bytes(result.peak_rss) if result.peak_rss else "-")
 
         self.console.print()
         self.console.print(table)
@@ -150,3 +310,219 @@ class ReportGenerator:
             part_file = self.benchmark_dir / result.folder / f"{result.filename}.part"
             self.console.print(f"[dim]Formula:   {ltlf_file}[/dim]")
             self.console.print(f"[dim]Partition: {part_file}[/dim]")
+
+    def print_run_history(self, runs: List[RunRecord]) -> None:
+        """Print a table of stored benchmark runs.
+
+        Args:
+            runs: Run records, newest first
+        """
+        if not runs:
+            self.console.print("[yellow]No runs recorded yet[/yellow]")
+            return
+
+        table = Table(
+            title="Benchmark Run History",
+            show_header=True,
+            header_style="bold magenta"
+        )
+        table.add_column("Run", justify="right", style="cyan")
+        table.add_column("Started (UTC)")
+        table.add_column("Binary")
+        table.add_column("Flags")
+        table.add_column("Host")
+        table.add_column("Passed", justify="right")
+        table.add_column("Total Duration", justify="right")
+
+        for run in runs:
+            rate = run.passed / run.total * 100 if run.total else 0.0
+            table.add_row(
+                str(run.run_id),
+                run.started_at,
+                run.app_hash[:12],
+                run.flags,
+                f"{run.hostname} ({run.cpu_count} CPUs)",
+                f"{run.passed}/{run.total} ({rate:.1f}%)",
+                f"{run.total_duration:.2f}s",
+            )
+
+        self.console.print()
+        self.console.print(table)
+
+    def print_case_history(
+        self, test_case: str, history: List[Tuple[Dict[str, object], BenchmarkResult]]
+    ) -> None:
+        """Print the results of one case across stored runs.
+
+        Args:
+            test_case: Case identifier (e.g. 'bench1/f7')
+            history: (run info, result) pairs, newest first
+        """
+        if not history:
+            self.console.print(f"[yellow]No recorded results for {test_case}[/yellow]")
+            return
+
+        table = Table(
+            title=f"History: {test_case}",
+            show_header=True,
+            header_style="bold magenta"
+        )
+        table.add_column("Run", justify="right", style="cyan")
+        table.add_column("Started (UTC)")
+        table.add_column("Binary")
+        table.add_column("Actual")
+        table.add_column("Duration", justify="right")
+        table.add_column("CPU (user/sys)", justify="right")
+        table.add_column("Peak RSS", justify="right")
+
+        for run, result in history:
+            actual_style = "green" if result.matched else "red"
+            table.add_row(
+                str(run["run_id"]),
+                str(run["started_at"]),
+                str(run["app_hash"])[:12],
+                f"[{actual_style}]{result.actual}[/{actual_style}]",
+                f"{result.duration:.3f}s",
+                f"{result.user_time:.3f}s / {result.sys_time:.3f}s",
+                format_bytes(result.peak_rss) if result.peak_rss else "-",
+            )
+
+        self.console.print()
+        self.console.print(table)
+
+    def print_sweep(self, sweep: Sweep, top: int = 10) -> None:
+        """Print a per-configuration comparison and the best configuration per case.
+
+        Args:
+            sweep: Summarized sweep
+            top: Number of cases with the largest gain over the first
+                configuration to list
+        """
+        reference = sweep.configs[0].label
+        table = Table(
+            title=f"Flag Sweep ({len(sweep.cases)} cases solved by every configuration)",
+            show_header=True,
+            header_style="bold magenta",
+        )
+        table.add_column("Configuration", style="cyan", no_wrap=True)
+        table.add_column("Passed", justify="right")
+        table.add_column("Timeouts", justify="right")
+        table.add_column("Total Time", justify="right")
+        table.add_column(f"Geomean vs {reference}", justify="right")
+        table.add_column("Fastest On", justify="right")
+
+        best_ratio = min(c.geomean_ratio for c in sweep.configs)
+        for config in sweep.configs:
+            style = "green" if config.geomean_ratio == best_ratio else "white"
+            table.add_row(
+                config.label,
+                str(config.passed),
+                f"[yellow]{config.timeouts}[/yellow]" if config.timeouts else "0",
+                f"{config.total_duration:.2f}s",
+                f"[{style}]{config.geomean_ratio:.3f}x[/{style}]",
+                str(config.wins),
+            )
+        self.console.print()
+        self.console.print(table)
+
+        gains = sorted(
+            (c for c in sweep.cases if c.best != reference),
+            key=lambda c: c.speedup,
+            reverse=True,
+        )[:top]
+        if not gains:
+            return
+        case_table = Table(
+            title=f"Best Configuration per Case (largest gains over {reference})",
+            show_header=True,
+            header_style="bold magenta",
+        )
+        case_table.add_column("Case", style="cyan")
+        case_table.add_column("Best Configuration")
+        case_table.add_column(reference, justify="right")
+        case_table.add_column("Best", justify="right")
+        case_table.add_column("Speedup", justify="right")
+        for case in gains:
+            case_table.add_row(
+                case.key,
+                case.best,
+                f"{case.durations[reference]:.3f}s",
+                f"{case.durations[case.best]:.3f}s",
+                f"[green]{case.speedup:.2f}x[/green]",
+            )
+        self.console.print()
+        self.console.print(case_table)
+
+    def print_comparison(self, comparison: Comparison, top: int = 10) -> None:
+        """Print an aggregate and per-case comparison of two result sets.
+
+        Args:
+            comparison: Comparison of a candidate against a baseline
+            top: Number of largest slowdowns and speedups to list
+        """
+        table = Table(
+            title="Performance Comparison (candidate / baseline)",
+            show_header=True,
+            header_style="bold magenta"
+        )
+        table.add_column("Metric", style="cyan")
+        table.add_column("Value", justify="right")
+
+        table.add_row("Compared Cases", str(len(comparison.cases)))
+        # Timings need cases conclusive in both runs, outcome changes don't
+        if comparison.cases:
+            ratio = comparison.geomean_ratio
+            ratio_style = "red" if ratio > 1 else "green"
+            table.add_row("Geomean Time Ratio", f"[{ratio_style}]{ratio:.3f}x[/{ratio_style}]")
+            table.add_row(
+                f"{comparison.confidence:.0%} CI (bootstrap)",
+                f"{comparison.ci_low:.3f}x - {comparison.ci_high:.3f}x",
+            )
+            table.add_row("Wilcoxon p-value", f"{comparison.p_value:.4f}")
+            table.add_row("Slower / Faster Cases",
+                          f"{sum(1 for c in comparison.cases if c.ratio > 1)} / "
+                          f"{sum(1 for c in comparison.cases if c.ratio < 1)}")
+        table.add_row("New Timeouts",
+                      f"[red]{len(comparison.new_timeouts)}[/red]" if comparison.new_timeouts else "0")
+        table.add_row("Resolved Timeouts", str(len(comparison.resolved_timeouts)))
+        table.add_row("New Failures",
+                      f"[red]{len(comparison.new_failures)}[/red]" if comparison.new_failures else "0")
+        if comparison.missing:
+            table.add_row("Missing in Candidate", f"[yellow]{len(comparison.missing)}[/yellow]")
+
+        self.console.print()
+        self.console.print(table)
+        if not comparison.cases:
+            self.console.print("[yellow]No cases conclusive in both runs to compare times on[/yellow]")
+
+        by_ratio = sorted(comparison.cases, key=lambda c: c.ratio, reverse=True)
+        slowdowns = [c for c in by_ratio if c.ratio > 1][:top]
+        speedups = [c for c in reversed(by_ratio) if c.ratio < 1][:top]
+        for title, cases, style in [
+            ("Largest Slowdowns", slowdowns, "red"),
+            ("Largest Speedups", speedups, "green"),
+        ]:
+            if not cases:
+                continue
+            case_table = Table(title=title, show_header=True, header_style="bold magenta")
+            case_table.add_column("Case", style="cyan")
+            case_table.add_column("Baseline", justify="right")
+            case_table.add_column("Candidate", justify="right")
+            case_table.add_column("Ratio", justify="right")
+            for c in cases:
+                case_table.add_row(
+                    c.key,
+                    f"{c.baseline.duration:.3f}s",
+                    f"{c.candidate.duration:.3f}s",
+                    f"[{style}]{c.ratio:.2f}x[/{style}]",
+                )
+            self.console.print()
+            self.console.print(case_table)
+
+        if comparison.new_timeouts:
+            self.console.print()
+            self.console.print(Panel(
+                "\n".join(comparison.new_timeouts),
+                title=f"[bold red]New Timeouts ({len(comparison.new_timeouts)})[/bold red]",
+                border_style="red",
+            ))
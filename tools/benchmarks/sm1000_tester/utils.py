@@ -1,8 +1,14 @@
 """Utility functions for SMV 1000 benchmark testing."""
 
+import hashlib
 from pathlib import Path
+from typing import Sequence
 
 
+# TCP port of the coordinator; here rather than in `distributed` so that the
+# CLI can use it as an option default without importing the socket modules
+DEFAULT_PORT = 8765
+
 def normalize_result(result: str) -> str:
     """Normalize result string for comparison."""
     result = result.strip().lower()
@@ -14,6 +20,19 @@ def normalize_result(result: str) -> str:
     return result
 
 
+def results_match(expected: str, actual: str) -> bool:
+    """Check an actual result against the expected one.
+
+    Cases without an expected result ('Unknown', e.g. absent from the
+    manifest) match any conclusive outcome.
+    """
+    expected_normalized = normalize_result(expected)
+    actual_normalized = normalize_result(actual)
+    if expected_normalized in ("", "unknown"):
+        return actual_normalized in ("realizable", "unrealizable")
+    return expected_normalized == actual_normalized
+
+
 def get_project_root() -> Path:
     """Get the project root directory."""
     return Path(__file__).parent.parent.parent.parent
@@ -33,3 +52,40 @@ def format_path_display(label: str, path: Path, max_label_len: int = 10) -> str:
     tab_count = 2 - (len(label) // 8)
     tabs = "\t" * tab_count
     return f"{label}{tabs}[dim]{path}[/dim]"
+
+
+def percentile(values: Sequence[float], q: float) -> float:
+    """Compute the q-th percentile (0-100) with linear interpolation.
+
+    Args:
+        values: Sample values (need not be sorted)
+        q: Percentile to compute, between 0 and 100
+
+    Returns:
+        The interpolated percentile, or 0.0 for an empty sample
+    """
+    if not values:
+        return 0.0
+    ordered = sorted(values)
+    rank = (len(ordered) - 1) * q / 100
+    lower = int(rank)
+    upper = min(lower + 1, len(ordered) - 1)
+    return ordered[lower] + (ordered[upper] - ordered[lower]) * (rank - lower)
+
+
+def format_bytes(num_bytes: float) -> str:
+    """Format a byte count with a binary unit suffix (e.g. '12.3 MiB')."""
+    for unit in ["B", "KiB", "MiB", "GiB"]:
+        if abs(num_bytes) < 1024:
+            return f"{num_bytes:.1f} {unit}"
+        num_bytes /= 1024
+    return f"{num_bytes:.1f} TiB"
+
+
+def file_sha256(path: Path) -> str:
+    """Compute the SHA-256 hex digest of a file's contents."""
+    digest = hashlib.sha256()
+    with open(path, "rb") as f:
+        for chunk in iter(lambda: f.read(1 << 20), b""):
+            digest.update(chunk)
+    return digest.hexdigest()